@@ -5,14 +5,22 @@
 # Date: 22/03/2021
 # Run this app with `python evalne_gui` and
 # visit http://127.0.0.1:8050/ in your web browser.
+# Run `python evalne_gui --serve` to use a production server instead, see `--help` for all options.
 
 import os
 import logging
+import argparse
 import webbrowser
 
 from threading import Timer
 from evalne_gui import index
 from evalne_gui.app import app
+from evalne_gui.sampler import sampler
+from evalne_gui.profiler import profiler
+from evalne_gui.jobs import scheduler
+from evalne_gui.serve import serve, SERVERS
+from evalne_gui.startup import startup_report
+from evalne_gui.session import sessions, DEFAULT_SESSION_DB
 
 
 # Log only UI errors to stdout
@@ -20,18 +28,63 @@ log = logging.getLogger('werkzeug')
 log.setLevel(logging.ERROR)
 
 
-# Remove the Flask development warning
-os.environ.setdefault('FLASK_ENV', 'development')
+def open_browser(port=8050):
+    webbrowser.open_new("http://localhost:{}".format(port))
 
 
-def open_browser():
-    port = 8050
-    webbrowser.open_new("http://localhost:{}".format(port))
+def start_services():
+    """ Starts the background threads of the GUI. Called once in each process serving requests. """
+    # Start collecting resource usage history right away, not only once the Monitoring tab is opened
+    sampler.start()
+    # Resume the jobs queued in the default evaluation folder, other folders resume once selected in the settings
+    if os.path.isdir(os.path.join(os.getcwd(), '.evalne_gui', 'jobs')):
+        scheduler.get_queue(os.getcwd())
+    scheduler.start()
+    # Record the resource usage of every evaluation run from the job queue
+    profiler.start()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog='evalne_gui', description='Plotly Dash based GUI for EvalNE.')
+    parser.add_argument('--serve', action='store_true',
+                        help='Run the GUI with a production server instead of the development one and do not open a '
+                             'browser.')
+    parser.add_argument('--server', choices=('auto',) + SERVERS, default='auto',
+                        help='Production server used with --serve. Default is the first one installed.')
+    parser.add_argument('--host', default='localhost', help='Interface to bind to. Default is localhost.')
+    parser.add_argument('--port', type=int, default=8050, help='Port to listen on. Default is 8050.')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of worker processes used with --serve (gunicorn only). Default is 1.')
+    parser.add_argument('--threads', type=int, default=8,
+                        help='Number of threads per worker process used with --serve. Default is 8.')
+    parser.add_argument('--session-db', default=DEFAULT_SESSION_DB,
+                        help='SQLite database where the GUI state of each browser session is stored, or `:memory:` '
+                             'to keep it in memory only (single worker). Default is {}.'.format(DEFAULT_SESSION_DB))
+    parser.add_argument('--profile-interval', type=float, default=1.0,
+                        help='Seconds between two samples of the resources used by each running evaluation, stored in '
+                             'its run folder. Use 0 to disable the profiles. Default is 1.')
+    parser.add_argument('--startup-report', action='store_true',
+                        help='Print the time needed to import the GUI and the packages it loads, then exit.')
+    return parser.parse_args()
 
 
 def main():
-    Timer(1, open_browser).start()
-    app.run_server(debug=False, port=8050, host='localhost', use_reloader=False)
+    args = parse_args()
+    sessions.path = None if args.session_db == ':memory:' else args.session_db
+    profiler.interval = args.profile_interval
+    if args.startup_report:
+        print(startup_report())
+    elif args.serve:
+        try:
+            serve(app.server, args.host, args.port, args.workers, args.threads, args.server, start_services)
+        except (ImportError, ValueError) as e:
+            raise SystemExit(str(e))
+    else:
+        # Remove the Flask development warning
+        os.environ.setdefault('FLASK_ENV', 'development')
+        start_services()
+        Timer(1, open_browser, [args.port]).start()
+        app.run(debug=False, port=args.port, host=args.host, use_reloader=False)
 
 
 if __name__ == '__main__':
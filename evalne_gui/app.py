@@ -5,6 +5,7 @@
 # Date: 22/03/2021
 
 import dash
+from evalne_gui.session import init_app
 
 
 # Load external styles
@@ -19,3 +20,6 @@ external_stylesheets = [{
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets,
                 suppress_callback_exceptions=True, update_title=None)
 server = app.server
+
+# Assign a session id to each browser, the GUI state is kept server-side
+init_app(server)
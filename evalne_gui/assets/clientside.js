@@ -0,0 +1,164 @@
+/* Clientside callbacks of the EvalNE-GUI, these run in the browser without a request to the server. */
+
+var MAXIMIZE_OPTS = [{'label': 'AUROC', 'value': 'auroc'},
+                     {'label': 'F-score', 'value': 'f_score'},
+                     {'label': 'Precision', 'value': 'precision'},
+                     {'label': 'Recall', 'value': 'recall'},
+                     {'label': 'Accuracy', 'value': 'accuracy'},
+                     {'label': 'Fallout', 'value': 'fallout'},
+                     {'label': 'Miss', 'value': 'miss'}];
+
+var F1_OPTS = [{'label': 'F1-micro', 'value': 'f1_micro'},
+               {'label': 'F1-macro', 'value': 'f1_macro'},
+               {'label': 'F1-weighted', 'value': 'f1_weighted'}];
+
+/* Parses the value of a range input like Python's `float`, stopping the callback if it is not a number. */
+function toFloat(val) {
+    var num = (typeof val === 'string' && val.trim() === '') || val === null ? NaN : Number(val);
+    if (isNaN(num)) {
+        throw window.dash_clientside.PreventUpdate;
+    }
+    return num;
+}
+
+/* Formats a number with one decimal like Python's `{:.1f}`, which rounds exact ties to even unlike `toFixed`. */
+function toFixed1(num) {
+    if ((num * 4) % 2 === 1 || (num * 4) % 2 === -1) {
+        // Odd multiples of 0.25 are the only exact ties at one decimal
+        var n = Math.floor(num * 10);
+        return ((n % 2 === 0 ? n : n + 1) / 10).toFixed(1);
+    }
+    return num.toFixed(1);
+}
+
+/* Config values last restored or saved, changes are only sent to the server when they differ from these. */
+var savedConfig = {};
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dashboard: {
+        /* Returns the config fields changed by the user as a {field: value} object. The last input is the set of
+           values written by `restore_config`, which are already stored server-side and are not sent again. */
+        collect_config_changes: function() {
+            var ctx = window.dash_clientside.callback_context;
+            var inputs = ctx.inputs_list;
+            var restored = inputs[inputs.length - 1].value;
+            var triggered = ctx.triggered.map(function(t) { return t.prop_id.split('.')[0]; });
+            if (triggered.indexOf('conf-restored') !== -1 && restored) {
+                savedConfig = Object.assign({}, restored);
+            }
+            var changes = {};
+            var changed = false;
+            inputs.slice(0, -1).forEach(function(input) {
+                var val = input.value === undefined ? null : input.value;
+                if (triggered.indexOf(input.id) !== -1 &&
+                        JSON.stringify(savedConfig[input.id]) !== JSON.stringify(val)) {
+                    changes[input.id] = val;
+                    savedConfig[input.id] = val;
+                    changed = true;
+                }
+            });
+            if (!changed) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            return changes;
+        },
+
+        /* Node classification is scored with F1 metrics and the other tasks with binary classification metrics, so
+           the metric to maximize is reset when it does not apply to the selected task. */
+        reset_maximize: function(task, maximize) {
+            var isF1 = typeof maximize === 'string' && maximize.indexOf('f1_') === 0;
+            if ((task === 'nc') === isF1) {
+                return window.dash_clientside.no_update;
+            }
+            return task === 'nc' ? 'f1_micro' : 'auroc';
+        },
+
+        /* Renders the global section hiding/showing elements based on the task evaluated. */
+        render_global_section: function(task) {
+            return task === 'nc' || task === 'nr' ? {'display': 'none'} : {'display': 'flex'};
+        },
+
+        toggle_neigh_visibility: function(val) {
+            return val === 'dir' ? {'width': '30%'} : {'display': 'none'};
+        },
+
+        toggle_heuristics_visibility: function(task) {
+            return task === 'nc' ? {'display': 'none'} : {'display': 'flex', 'margin-bottom': '20px'};
+        },
+
+        /* Updates the train frac percentage when the slider moves. */
+        render_train_perc: function(frac) {
+            return 'Train-test fraction (' + Math.trunc(toFloat(frac) * 100) + '%):';
+        },
+
+        /* Updates the valid frac percentage when the slider moves. */
+        render_valid_perc: function(frac) {
+            return 'Train-valid. fraction (' + Math.trunc(toFloat(frac) * 100) + '%):';
+        },
+
+        /* Updates the node-pair frac when the slider moves. */
+        render_nodepairs_perc: function(frac) {
+            return 'Node pairs to evaluate (' + toFixed1(toFloat(frac) * 100).padStart(4) + '%):';
+        },
+
+        /* Updates the Dashboard elements and style based on the task to be evaluated. */
+        render_content: function(task) {
+            if (task === 'lp' || task === 'sp' || task === 'nr') {
+                return [{'width': '30%', 'padding-right': '5%'},                                    // task
+                        task === 'nr' ? {'display': 'none'} : {'width': '30%', 'padding-right': '5%'},  // exprep
+                        task === 'nr' ? {'width': '30%', 'padding-right': '5%'} : {'display': 'none'},  // nr fracs
+                        {'display': 'none'},                                                        // nc nodefracs
+                        {'display': 'none'},                                                        // nc repperfrac
+                        {'width': '30%'},                                                           // ee method
+                        'Binary classifier:',
+                        {'display': 'none'},
+                        MAXIMIZE_OPTS,
+                        MAXIMIZE_OPTS.concat([{'label': 'All', 'value': 'all'}])];
+            } else if (task === 'nc') {
+                return [{'width': '30%', 'padding-right': '5%'},                                    // task
+                        {'display': 'none'},                                                        // exprep
+                        {'display': 'none'},                                                        // nr fracs
+                        {'width': '30%', 'padding-right': '5%'},                                    // nc nodefracs
+                        {'width': '30%'},                                                           // nc repperfrac
+                        {'display': 'none'},                                                        // ee method
+                        'Multi-label classifier:',
+                        {'display': 'block'},
+                        F1_OPTS,
+                        [{'label': 'All', 'value': 'all'}].concat(F1_OPTS)];
+            }
+            throw window.dash_clientside.PreventUpdate;
+        },
+
+        /* Renders the metrics section based on the task evaluated. */
+        render_metrics_section: function(task) {
+            if (task === 'nc') {
+                return [{'width': '48%', 'padding-right': '4%'},
+                        {'width': '48%'},
+                        {'display': 'none'},
+                        {'display': 'none'}];
+            }
+            return [{'width': '22%', 'padding-right': '4%'},
+                    {'width': '22%', 'padding-right': '4%'},
+                    {'width': '22%', 'padding-right': '4%'},
+                    {'width': '22%'}];
+        },
+
+        toggle_method_style: function(m_type) {
+            if (!m_type) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            if (m_type === 'opne') {
+                return [{'display': 'none'},
+                        {'display': 'none'},
+                        {'width': '100%'},
+                        {'display': 'none'},
+                        {'display': 'none'}];
+            }
+            return [{'width': '22%', 'padding-right': '4%'},
+                    {'width': '22%'},
+                    {'width': '48%', 'padding-right': '4%'},
+                    {'width': '22%', 'padding-right': '4%'},
+                    {'width': '22%'}];
+        }
+    }
+});
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import json
+import time
+import datetime
+import threading
+from evalne_gui.utils import LOG_TIME_FORMAT, get_state_dir, write_json, read_first_line, read_last_lines
+from evalne_gui.jobs import get_queue
+
+
+# Seconds during which the run summaries of a folder are reused, so the callbacks of each refresh of the Runs &
+# Results tab, which run at the same time, compute them once
+SUMMARY_TTL = 2
+
+_summaries = dict()
+_summaries_lock = threading.Lock()
+
+
+class RunCatalog(object):
+    """ Persistent and incremental index of the evaluation runs stored in an evaluation folder.
+
+    The index is kept in memory and mirrored to a json file in the GUI state folder. On each update, the evaluation
+    folder is only listed if its mtime changed and each run log is only read if its size or mtime changed. Runs that
+    have finished are never read again. For logs that have to be read, only the first line and the tail are accessed.
+
+    Parameters
+    ----------
+    filename : string
+        Name of the json file where the index is persisted.
+    """
+
+    version = 1
+
+    def __init__(self, filename='catalog.json'):
+        self._filename = filename
+        self._cache = dict()
+        self._lock = threading.Lock()
+
+    def update(self, eval_path):
+        """ Brings the index of `eval_path` up to date and returns a dict mapping run names to their entries.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the evaluation folder does not exist.
+        """
+        with self._lock:
+            index = self._cache.get(eval_path)
+            if index is None:
+                index = self._load(eval_path)
+            changed = False
+
+            # Only list the folder if runs have been added or removed
+            dir_mtime = os.stat(eval_path).st_mtime_ns
+            if index['dir_mtime'] != dir_mtime:
+                names = sorted(fname for fname in os.listdir(eval_path)
+                               if '_eval_' in fname and (fname in index['runs'] or
+                                                         os.path.isdir(os.path.join(eval_path, fname))))
+                index['runs'] = {name: index['runs'].get(name) for name in names}
+                index['dir_mtime'] = dir_mtime
+                changed = True
+
+            # Only update the runs whose log has changed
+            for name, entry in index['runs'].items():
+                if entry is not None and entry['finished']:
+                    continue
+                new_entry = self._update_entry(os.path.join(eval_path, name, 'eval.log'), entry)
+                if new_entry is not entry:
+                    index['runs'][name] = new_entry
+                    changed = True
+
+            if changed:
+                write_json(os.path.join(get_state_dir(eval_path), self._filename), index)
+            self._cache[eval_path] = index
+            return index['runs']
+
+    def _load(self, eval_path):
+        """ Reads the persisted index of `eval_path` or returns an empty one if missing or outdated. """
+        try:
+            with open(os.path.join(eval_path, '.evalne_gui', self._filename)) as f:
+                index = json.load(f)
+            if index.get('version') == self.version:
+                return index
+        except (FileNotFoundError, ValueError):
+            pass
+        return {'version': self.version, 'dir_mtime': None, 'runs': dict()}
+
+    @staticmethod
+    def _update_entry(logpath, entry):
+        """ Returns the updated entry of a run log, or the same entry if the log did not change. """
+        try:
+            st = os.stat(logpath)
+        except FileNotFoundError:
+            # EvalNE has created the run folder but not the log yet
+            if entry is not None and entry['log_size'] == -1:
+                return entry
+            return {'log_size': -1, 'log_mtime': 0, 'start_time': '', 'end_time': '', 'last_line': '',
+                    'finished': False}
+
+        if entry is not None and entry['log_size'] == st.st_size and entry['log_mtime'] == st.st_mtime_ns:
+            return entry
+
+        # The first line only needs to be read once, unless the log has been truncated
+        if entry is not None and entry['start_time'] != '' and st.st_size >= entry['log_size']:
+            start_time = entry['start_time']
+        else:
+            start_time = get_log_time(read_first_line(logpath)) or ''
+        last_line, last_logged = read_last_lines(logpath, predicate=lambda line: get_log_time(line) is not None)
+
+        return {'log_size': st.st_size,
+                'log_mtime': st.st_mtime_ns,
+                'start_time': start_time,
+                'end_time': get_log_time(last_logged) if last_logged else '',
+                'last_line': last_line or '',
+                'finished': last_line is not None and 'Evaluation end' in last_line}
+
+
+def get_log_time(line):
+    """ Returns the timestamp of an EvalNE log line as a string or None if the line does not start with one. """
+    time_str = line.split(' - ')[0]
+    try:
+        datetime.datetime.strptime(time_str, LOG_TIME_FORMAT)
+    except ValueError:
+        return None
+    return time_str
+
+
+def get_logged_evals(path):
+    """ Returns, for each run in the evaluation folder, a list with its name, status, runtime, start and end time.
+    Results are reused for `SUMMARY_TTL` seconds. """
+    with _summaries_lock:
+        cached = _summaries.get(path)
+        if cached is None or time.time() - cached[0] > SUMMARY_TTL:
+            cached = (time.time(), get_run_summaries(path))
+            _summaries[path] = cached
+    return [list(row) for row in cached[1]]
+
+
+def get_run_summaries(path):
+    """ Computes the rows returned by `get_logged_evals`. """
+    runs = catalog.update(path)
+    # The most recent unfinished runs are the ones of the jobs currently running, split evaluations are a single run
+    num_running = len(set(job['group'] or job['id'] for job in get_queue(path).running()))
+    res = []
+    for name in sorted(runs.keys(), reverse=True):
+        entry = runs[name]
+        # Get status
+        if entry['finished']:
+            status = 'Finished'
+        elif num_running > 0:
+            status = 'Running'
+            num_running -= 1
+        else:
+            status = 'Failed'
+        # Get runtime
+        if entry['start_time'] != '' and entry['end_time'] != '':
+            std = datetime.datetime.strptime(entry['start_time'], LOG_TIME_FORMAT)
+            etd = datetime.datetime.strptime(entry['end_time'], LOG_TIME_FORMAT)
+            runtime = str(etd - std)
+        else:
+            runtime = ''
+        res.append([name, status, runtime, entry['start_time'], entry['end_time']])
+    return res
+
+
+# Shared catalog instance
+catalog = RunCatalog()
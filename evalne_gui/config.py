@@ -0,0 +1,408 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import io
+import re
+import configparser
+from collections import OrderedDict
+from evalne_gui.init_values import init_vals, method_init_vals
+
+
+# Dashboard field of each config attribute
+CONF_FIELDS = OrderedDict([('task', 'task-dropdown'),
+                           ('edge_embedding_methods', 'ee-dropdown'),
+                           ('lp_num_edge_splits', 'ib-exprep'),
+                           ('nr_edge_samp_frac', 'ib-frace'),
+                           ('nc_num_node_splits', 'ib-rpnf'),
+                           ('nc_node_fracs', 'ib-fracn'),
+                           ('lp_model', 'ib-lpmodel'),
+                           ('embed_dim', 'ib-embdim'),
+                           ('timeout', 'ib-timeout'),
+                           ('seed', 'ib-seed'),
+                           ('traintest_frac', 'ib-trainfrac'),
+                           ('trainvalid_frac', 'ib-validfrac'),
+                           ('split_alg', 'splitalg-dropdown'),
+                           ('neg_sampling', 'negsamp-dropdown'),
+                           ('fe_ratio', 'ib-negratio'),
+                           ('names', 'ib-nwnames'),
+                           ('inpaths', 'network-paths'),
+                           ('labelpaths', 'network-nodelabels'),
+                           ('network_type', 'network-types'),
+                           ('separators', 'ib-separator'),
+                           ('comments', 'ib-comment'),
+                           ('prep', 'nw-prep-checklist'),
+                           ('prep_output', 'nw-prep-checklist2'),
+                           ('delimiter', 'input-prep-delim'),
+                           ('baselines', 'baselines-checklist'),
+                           ('baselines_other', 'baselines-checklist2'),
+                           ('neighbourhood', 'neighbourhood-dropdown'),
+                           ('maximize', 'maximize-dropdown'),
+                           ('scores', 'scores-dropdown'),
+                           ('curves', 'curves-dropdown'),
+                           ('precatk_vals', 'ib-precatk')])
+
+# Dashboard field of each method attribute
+METHOD_FIELDS = OrderedDict([('lib', 'm-lib-dropdown'),
+                             ('name', 'm-name'),
+                             ('emb_type', 'm-type-dropdown'),
+                             ('opts', 'm-opts'),
+                             ('cmd', 'm-cmd'),
+                             ('tune', 'm-tune'),
+                             ('input_delim', 'm-input-delim'),
+                             ('output_delim', 'm-output-delim')])
+
+TASKS = ('lp', 'sp', 'nr', 'nc')
+EMB_TYPES = ('ne', 'ee', 'e2e')
+
+# Baselines listed in the first baselines checklist, the rest go in the second one
+NEIGHBOURHOOD_BASELINES = ('common', 'jaccard', 'adamic', 'cosine', 'resource', 'preferential')
+
+
+class MethodConfig(object):
+    """ An NE method to evaluate, with the same values as the method fields of the dashboard. """
+
+    __slots__ = tuple(METHOD_FIELDS.keys())
+
+    def __init__(self, lib=method_init_vals['m-lib-dropdown'], name=method_init_vals['m-name'],
+                 emb_type=method_init_vals['m-type-dropdown'], opts=None, cmd=method_init_vals['m-cmd'],
+                 tune=method_init_vals['m-tune'], input_delim=method_init_vals['m-input-delim'],
+                 output_delim=method_init_vals['m-output-delim']):
+        self.lib = lib
+        self.name = name
+        self.emb_type = emb_type
+        self.opts = list(method_init_vals['m-opts']) if opts is None else opts
+        self.cmd = cmd
+        self.tune = tune
+        self.input_delim = input_delim
+        self.output_delim = output_delim
+
+    def __eq__(self, other):
+        return isinstance(other, MethodConfig) and all(getattr(self, attr) == getattr(other, attr)
+                                                       for attr in self.__slots__)
+
+    def __repr__(self):
+        return 'MethodConfig({})'.format(', '.join('{}={!r}'.format(attr, getattr(self, attr))
+                                                   for attr in self.__slots__))
+
+    @property
+    def is_empty(self):
+        """ Methods without name and command are ignored when exporting. """
+        return (self.name or '') == '' and (self.cmd or '') == ''
+
+    @property
+    def is_opne(self):
+        return self.lib == 'opne'
+
+
+class EvalConfig(object):
+    """ An EvalNE evaluation config. Attributes hold the same values as the corresponding dashboard fields, see
+    `CONF_FIELDS`, so converting from and to the dashboard values is lossless. Converting to an EvalNE .ini file and
+    parsing it back gives the same file for every config written by the GUI. Options the GUI does not expose are not
+    kept when parsing other config files.
+
+    Parameters
+    ----------
+    methods : list
+        A list of `MethodConfig`.
+    kwargs :
+        Values of the config attributes, the dashboard defaults are used for the ones not given.
+    """
+
+    __slots__ = tuple(CONF_FIELDS.keys()) + ('methods',)
+
+    def __init__(self, methods=None, **kwargs):
+        for attr, key in CONF_FIELDS.items():
+            setattr(self, attr, kwargs.get(attr, init_vals[key]))
+        self.methods = list(methods) if methods is not None else [MethodConfig()]
+
+    def __eq__(self, other):
+        return isinstance(other, EvalConfig) and all(getattr(self, attr) == getattr(other, attr)
+                                                     for attr in self.__slots__)
+
+    @property
+    def num_methods(self):
+        return len(self.methods)
+
+    # --------------------------
+    #     Dashboard values
+    # --------------------------
+
+    @classmethod
+    def from_values(cls, conf_dict, methods_dict):
+        """ Creates a config from the dashboard values, a dict of field values and a dict of lists of method values.
+
+        Raises
+        ------
+        ValueError
+            If the method value lists have different lengths.
+        """
+        cols = [methods_dict[key] for key in METHOD_FIELDS.values()]
+        if any(len(col) != len(cols[0]) for col in cols):
+            raise ValueError('Inconsistent method values, all method fields must have one value per method!')
+        methods = [MethodConfig(**dict(zip(METHOD_FIELDS.keys(), vals))) for vals in zip(*cols)]
+        return cls(methods, **{attr: conf_dict[key] for attr, key in CONF_FIELDS.items() if key in conf_dict})
+
+    def to_values(self):
+        """ Returns the dashboard values of the config as a dict of field values and a dict of lists of method
+        values, both ordered like `init_vals` and `method_init_vals`. """
+        conf_dict = OrderedDict((key, getattr(self, attr)) for attr, key in CONF_FIELDS.items())
+        methods_dict = OrderedDict((key, [getattr(method, attr) for method in self.methods])
+                                   for attr, key in METHOD_FIELDS.items())
+        return conf_dict, methods_dict
+
+    # --------------------------
+    #        .ini files
+    # --------------------------
+
+    @classmethod
+    def from_ini(cls, text):
+        """ Parses the text of an EvalNE config file. Blank options take the dashboard defaults.
+
+        Raises
+        ------
+        ValueError
+            If the text is not a valid EvalNE config file.
+        """
+        config = configparser.ConfigParser()
+        try:
+            config.read_string(text)
+            return cls.from_parser(config)
+        except configparser.Error as e:
+            raise ValueError(str(e))
+
+    @classmethod
+    def from_parser(cls, config):
+        """ Creates a config from a `ConfigParser` holding an EvalNE config file.
+
+        Raises
+        ------
+        ValueError
+            If the config is not valid.
+        configparser.Error
+            If sections or options are missing.
+        """
+        def get(section, option, default=None, dtype=str):
+            val = config.get(section, option).strip()
+            if default is not None and (val == '' or val.lower() == 'none'):
+                return default
+            return dtype(val)
+
+        baselines = [bl.strip() for bl in config.get('BASELINES', 'lp_baselines').split('\n') if bl.strip() != '']
+        curves = get('REPORT', 'curves')
+        res = cls([],
+                  task=get('GENERAL', 'task'),
+                  edge_embedding_methods=get('GENERAL', 'edge_embedding_methods', init_vals['ee-dropdown'],
+                                             str.split),
+                  lp_num_edge_splits=get('GENERAL', 'lp_num_edge_splits', init_vals['ib-exprep'], int),
+                  nr_edge_samp_frac=get('GENERAL', 'nr_edge_samp_frac', init_vals['ib-frace'], float),
+                  nc_num_node_splits=get('GENERAL', 'nc_num_node_splits', init_vals['ib-rpnf'], int),
+                  nc_node_fracs=get('GENERAL', 'nc_node_fracs', init_vals['ib-fracn'], to_percentages),
+                  lp_model=get('GENERAL', 'lp_model'),
+                  embed_dim=get('GENERAL', 'embed_dim', init_vals['ib-embdim'], int),
+                  timeout=get('GENERAL', 'timeout', init_vals['ib-timeout'], int),
+                  seed=get('GENERAL', 'seed', init_vals['ib-seed'], int),
+                  traintest_frac=get('EDGESPLIT', 'traintest_frac', init_vals['ib-trainfrac'], float),
+                  trainvalid_frac=get('EDGESPLIT', 'trainvalid_frac', init_vals['ib-validfrac'], float),
+                  split_alg=get('EDGESPLIT', 'split_alg'),
+                  neg_sampling='ow' if config.getboolean('EDGESPLIT', 'owa') else 'cw',
+                  fe_ratio='{}:1'.format(format_num(get('EDGESPLIT', 'fe_ratio', 1.0, float))),
+                  names=config.get('NETWORKS', 'names'),
+                  inpaths=config.get('NETWORKS', 'inpaths'),
+                  labelpaths=config.get('NETWORKS', 'labelpaths'),
+                  network_type='dir' if config.getboolean('NETWORKS', 'directed') else 'undir',
+                  separators=config.get('NETWORKS', 'separators'),
+                  comments=config.get('NETWORKS', 'comments'),
+                  prep=get_flags(config, 'PREPROCESSING', [('rel', 'relabel'), ('selfloops', 'del_selfloops')]),
+                  prep_output=get_flags(config, 'PREPROCESSING', [('save', 'save_prep_nw'), ('stats', 'write_stats')]),
+                  delimiter=config.get('PREPROCESSING', 'delimiter'),
+                  baselines=[bl for bl in baselines if is_neighbourhood_baseline(bl)],
+                  baselines_other=[bl for bl in baselines if not is_neighbourhood_baseline(bl)],
+                  neighbourhood=get('BASELINES', 'neighbourhood'),
+                  maximize=get('REPORT', 'maximize'),
+                  scores=get('REPORT', 'scores'),
+                  curves='none' if curves == '' else curves,
+                  precatk_vals=config.get('REPORT', 'precatk_vals'))
+
+        # Methods are stored as one list per option, other methods first
+        names = config.get('OTHER METHODS', 'names_other').split()
+        cols = [get_padded(config.get('OTHER METHODS', 'embtype_other').split(), names, 'EMBTYPE_OTHER'),
+                get_padded(config.get('OTHER METHODS', 'write_weights_other').split(), names, 'WRITE_WEIGHTS_OTHER',
+                           'False'),
+                get_padded(config.get('OTHER METHODS', 'write_dir_other').split(), names, 'WRITE_DIR_OTHER', 'False'),
+                get_padded(get_lines(config.get('OTHER METHODS', 'methods_other')), names, 'METHODS_OTHER'),
+                get_padded(get_lines(config.get('OTHER METHODS', 'tune_params_other')), names, 'TUNE_PARAMS_OTHER',
+                           ''),
+                get_padded(config.get('OTHER METHODS', 'input_delim_other').split(), names, 'INPUT_DELIM_OTHER', ''),
+                get_padded(config.get('OTHER METHODS', 'output_delim_other').split(), names, 'OUTPUT_DELIM_OTHER',
+                           '')]
+        for name, emb_type, weights, directed, cmd, tune, input_delim, output_delim in zip(names, *cols):
+            opts = [opt for opt, val in (('weights', weights), ('dir', directed)) if val.lower() == 'true']
+            res.methods.append(MethodConfig(lib='other', name=name, emb_type=emb_type, opts=opts, cmd=cmd, tune=tune,
+                                            input_delim=input_delim, output_delim=output_delim))
+        names = config.get('OPENNE METHODS', 'names_opne').split()
+        cmds = get_padded(get_lines(config.get('OPENNE METHODS', 'methods_opne')), names, 'METHODS_OPNE')
+        tunes = get_padded(get_lines(config.get('OPENNE METHODS', 'tune_params_opne')), names, 'TUNE_PARAMS_OPNE', '')
+        for name, cmd, tune in zip(names, cmds, tunes):
+            res.methods.append(MethodConfig(lib='opne', name=name, emb_type='ne', opts=[], cmd=cmd, tune=tune))
+        res.validate()
+        return res
+
+    def to_ini(self):
+        """ Returns the config as the text of an EvalNE config file. """
+        f = io.StringIO()
+        self.to_parser().write(f)
+        return f.getvalue()
+
+    def write(self, path):
+        """ Writes the config as an EvalNE config file to `path`. """
+        with open(path, 'w') as f:
+            self.to_parser().write(f)
+
+    def to_parser(self):
+        """ Returns a `ConfigParser` holding the config as an EvalNE config file. """
+        opne = [method for method in self.methods if method.is_opne and not method.is_empty]
+        other = [method for method in self.methods if not method.is_opne and not method.is_empty]
+
+        config = configparser.ConfigParser()
+        config.optionxform = str
+        config['GENERAL'] = {'TASK': self.task,
+                             'LP_NUM_EDGE_SPLITS': '' if self.task in ('nc', 'nr') else self.lp_num_edge_splits,
+                             'NC_NUM_NODE_SPLITS': self.nc_num_node_splits if self.task == 'nc' else '',
+                             'NC_NODE_FRACS': to_fractions(self.nc_node_fracs) if self.task == 'nc' else '',
+                             'NR_EDGE_SAMP_FRAC': self.nr_edge_samp_frac if self.task == 'nr' else '',
+                             'EDGE_EMBEDDING_METHODS': '' if self.task == 'nc'
+                             else ' '.join(self.edge_embedding_methods or []),
+                             'LP_MODEL': self.lp_model,
+                             'EMBED_DIM': self.embed_dim,
+                             'TIMEOUT': '' if self.timeout == 0 else self.timeout,
+                             'VERBOSE': 'False',
+                             'SEED': self.seed}
+        config['NETWORKS'] = {'NAMES': self.names,
+                              'INPATHS': self.inpaths,
+                              'DIRECTED': str(self.network_type == 'dir'),
+                              'SEPARATORS': self.separators,
+                              'COMMENTS': self.comments,
+                              'LABELPATHS': self.labelpaths}
+        config['PREPROCESSING'] = {'RELABEL': str('rel' in self.prep),
+                                   'DEL_SELFLOOPS': str('selfloops' in self.prep),
+                                   'SAVE_PREP_NW': str('save' in self.prep_output),
+                                   'WRITE_STATS': str('stats' in self.prep_output),
+                                   'DELIMITER': self.delimiter}
+        config['EDGESPLIT'] = {'TRAINTEST_FRAC': self.traintest_frac,
+                               'TRAINVALID_FRAC': self.trainvalid_frac,
+                               'SPLIT_ALG': self.split_alg,
+                               'OWA': str(self.neg_sampling == 'ow'),
+                               'FE_RATIO': float(self.fe_ratio.split(':')[0])}
+        config['BASELINES'] = {'LP_BASELINES': '\n'.join(self.baselines + self.baselines_other),
+                               'NEIGHBOURHOOD': self.neighbourhood}
+        config['OPENNE METHODS'] = {'NAMES_OPNE': ' '.join(method.name or '' for method in opne),
+                                    'METHODS_OPNE': '\n'.join(method.cmd or '' for method in opne),
+                                    'TUNE_PARAMS_OPNE': '\n'.join(method.tune or '' for method in opne)}
+        config['OTHER METHODS'] = {'NAMES_OTHER': ' '.join(method.name or '' for method in other),
+                                   'EMBTYPE_OTHER': ' '.join(method.emb_type or '' for method in other),
+                                   'WRITE_WEIGHTS_OTHER': ' '.join(str('weights' in (method.opts or []))
+                                                                   for method in other),
+                                   'WRITE_DIR_OTHER': ' '.join(str('dir' in (method.opts or [])) for method in other),
+                                   'METHODS_OTHER': '\n'.join(method.cmd or '' for method in other),
+                                   'TUNE_PARAMS_OTHER': '\n'.join(method.tune or '' for method in other),
+                                   'INPUT_DELIM_OTHER': ' '.join(method.input_delim or '' for method in other),
+                                   'OUTPUT_DELIM_OTHER': ' '.join(method.output_delim or '' for method in other)}
+        config['REPORT'] = {'MAXIMIZE': self.maximize,
+                            'SCORES': self.scores,
+                            'CURVES': '' if self.curves == 'none' else self.curves,
+                            'PRECATK_VALS': self.precatk_vals}
+        return config
+
+    # --------------------------
+    #        Validation
+    # --------------------------
+
+    def validate(self):
+        """ Checks the types and ranges of the config values.
+
+        Raises
+        ------
+        ValueError
+            Listing the incorrect values found.
+        """
+        errors = []
+        if self.task not in TASKS:
+            errors.append('Unknown task `{}`'.format(self.task))
+        for attr, minimum in (('lp_num_edge_splits', 1), ('nc_num_node_splits', 1), ('embed_dim', 1),
+                              ('timeout', 0), ('seed', None)):
+            val = getattr(self, attr)
+            if not isinstance(val, int) or isinstance(val, bool) or (minimum is not None and val < minimum):
+                errors.append('{} should be an integer{}'.format(
+                    attr.upper(), '' if minimum is None else ' >= {}'.format(minimum)))
+        for attr in ('nr_edge_samp_frac', 'traintest_frac', 'trainvalid_frac'):
+            val = getattr(self, attr)
+            if not isinstance(val, (int, float)) or isinstance(val, bool) or not 0 <= val <= 1:
+                errors.append('{} should be a number in [0, 1]'.format(attr.upper()))
+        if not re.match(r'^\d+(\.\d*)?:1$', str(self.fe_ratio)):
+            errors.append('FE_RATIO should be a positive number')
+        for method in self.methods:
+            if method.is_empty:
+                continue
+            if method.name is None or len(method.name.split()) != 1:
+                errors.append('Method name `{}` should be a single word'.format(method.name))
+            if not method.is_opne and method.emb_type not in EMB_TYPES:
+                errors.append('Method `{}` has an unknown embedding type `{}`'.format(method.name, method.emb_type))
+            if (method.cmd or '') == '' or '\n' in method.cmd + (method.tune or ''):
+                errors.append('Method `{}` needs a single line command and tune parameters'.format(method.name))
+        # Per-method delimiters are split by blanks, so blank values can only be left out for all methods
+        other = [method for method in self.methods if not method.is_opne and not method.is_empty]
+        for attr in ('input_delim', 'output_delim'):
+            delims = [getattr(method, attr) or '' for method in other]
+            if any(len(delim.split()) > 1 or delim != delim.strip() for delim in delims):
+                errors.append('{} values should not contain blanks, use `\\s` or `\\t`'.format(attr.upper()))
+            elif 0 < delims.count('') < len(delims):
+                errors.append('{} should be set for all methods or none'.format(attr.upper()))
+        if len(errors):
+            raise ValueError('Incorrect config values: {}!'.format('; '.join(errors)))
+
+
+def format_num(val):
+    """ Returns the shortest string that parses back to the same float, without a trailing `.0` for integers. """
+    res = repr(float(val))
+    return res[:-2] if res.endswith('.0') else res
+
+
+def to_fractions(percentages):
+    """ Converts node fractions given as percentages, e.g. `10 50 90`, to fractions, e.g. `0.1 0.5 0.9`. Values of at
+    most 1 are taken to be fractions already and kept as they are. """
+    return ' '.join(val if float(val) <= 1 else format_num(float(val) / 100) for val in percentages.split())
+
+
+def to_percentages(fractions):
+    """ Converts node fractions, e.g. `0.1 0.5 0.9`, to the percentages shown in the dashboard, e.g. `10 50 90`. """
+    return ' '.join(format_num(round(float(val) * 100, 10)) for val in fractions.split())
+
+
+def is_neighbourhood_baseline(baseline):
+    return any(name in baseline for name in NEIGHBOURHOOD_BASELINES)
+
+
+def get_flags(config, section, flags):
+    """ Returns the values of the given (value, option) pairs whose boolean option is set. """
+    return [val for val, option in flags if config.getboolean(section, option)]
+
+
+def get_lines(text):
+    """ Splits a multi-line option into lines, trailing empty lines are dropped by configparser. """
+    return [] if text == '' else text.split('\n')
+
+
+def get_padded(values, names, option, default=None):
+    """ Returns the values of a per-method option padded with `default` to one value per method.
+
+    Raises
+    ------
+    ValueError
+        If there are more values than methods or values are missing and no default is given.
+    """
+    if len(values) > len(names) or (len(values) < len(names) and default is None):
+        raise ValueError('Option {} has {} values for {} methods!'.format(option, len(values), len(names)))
+    return values + [default] * (len(names) - len(values))
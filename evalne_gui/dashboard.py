@@ -12,22 +12,21 @@ import dash_bootstrap_components as dbc
 from datetime import datetime
 from evalne_gui.app import app
 from dash import callback_context
-from dash.dependencies import Input, Output
-from dash import dcc, State, html, ALL, MATCH
+from dash.dependencies import Input, Output, ClientsideFunction
+from dash import dcc, State, html, ALL, MATCH, no_update
 from dash.exceptions import PreventUpdate
 from evalne_gui.utils import *
+from evalne_gui.jobs import get_queue
+from evalne_gui.sweep import *
+from evalne_gui.config import EvalConfig
+from evalne_gui.sampler import sampler
+from evalne_gui.session import sessions, get_session_id
+from evalne_gui.preflight import preflight, format_report, parse_separators
+from evalne_gui.datasets import datasets, format_stats, format_deg_hist
+from evalne_gui.estimator import estimator, get_warnings, format_estimate
 from evalne_gui.init_values import *
 
 
-maximize_opts = [{'label': 'AUROC', 'value': 'auroc'},
-                 {'label': 'F-score', 'value': 'f_score'},
-                 {'label': 'Precision', 'value': 'precision'},
-                 {'label': 'Recall', 'value': 'recall'},
-                 {'label': 'Accuracy', 'value': 'accuracy'},
-                 {'label': 'Fallout', 'value': 'fallout'},
-                 {'label': 'Miss', 'value': 'miss'}]
-
-
 dashboard_layout = html.Div([
 
     # --------------------------
@@ -54,6 +53,18 @@ dashboard_layout = html.Div([
                     )
                 ]
             ),
+            html.Div(
+                children=[
+                    dcc.Upload(
+                        id='upload-confs',
+                        multiple=True,
+                        children=[
+                            html.Button('Queue Configs', id='imp-confs', className='btn btn-square btn-imp',
+                                        n_clicks=0),
+                        ]
+                    )
+                ]
+            ),
             html.Div(
                 children=[
                     html.Button('Export Config', id='exp-conf', className='btn btn-square btn-imp', n_clicks=0),
@@ -77,6 +88,13 @@ dashboard_layout = html.Div([
         interval=1*1000,    # in milliseconds
         n_intervals=0
     ),
+    # Runtime and memory estimate of the current config, updated as fields change and runs finish
+    html.Div(id='eval-estimate', className='eval-estimate'),
+    dcc.Interval(
+        id='estimate-interval',
+        interval=10*1000,    # in milliseconds
+        n_intervals=0
+    ),
     html.Br(),
     html.Br(),
 
@@ -325,6 +343,14 @@ dashboard_layout = html.Div([
             value=init_vals['network-paths'],
             persistence=True,
         ),
+        # Statistics of each network, hover a line to see its degree distribution
+        html.Div(id='network-stats', className='network-stats'),
+        dcc.Interval(
+            id='network-stats-interval',
+            interval=1*1000,    # in milliseconds
+            n_intervals=0,
+            disabled=True
+        ),
     ]),
     html.Br(),
     html.Div(
@@ -597,13 +623,78 @@ dashboard_layout = html.Div([
     html.Br(),
     ]),
 
+    # --------------------------
+    #     Parameter sweeps
+    # --------------------------
+    html.H3(children='Parameter Sweep', className='section-title'),
+    html.Hr(className='sectionHr'),
+    html.Br(),
+
+    html.Div(className='plot-area', children=[
+    html.Div([
+        html.Label(['Swept parameters:']),
+        html.Abbr("\u003f", className='help-qm',
+                  title="One `OPTION = values` per line. Values can be a list (e.g. `EMBED_DIM = 64 128 256`), a range "
+                        "with step (e.g. `TRAINTEST_FRAC = 0.5:0.9:0.1`) or, for random and Latin hypercube sweeps, "
+                        "a continuous range (e.g. `TRAINTEST_FRAC = 0.5:0.9`). Options that can be swept are: {}."
+                        .format(', '.join(SWEEP_PARAMS.keys())),
+                  ),
+        dcc.Textarea(
+            id='sweep-params',
+            placeholder='Insert the swept options and their values, one per line...',
+            style={
+                'width': '100%',
+                'height': '100px',
+            },
+            value='',
+            persistence=True,
+        ),
+    ]),
+    html.Br(),
+    html.Div(
+        children=[
+            html.Div(
+                children=[
+                    html.Label(['Sweep type:']),
+                    dcc.Dropdown(
+                        id='sweep-dropdown',
+                        options=[{'label': 'Grid', 'value': 'grid'},
+                                 {'label': 'Random', 'value': 'random'},
+                                 {'label': 'Latin hypercube', 'value': 'lhs'}],
+                        value='grid',
+                        persistence=True,
+                    ),
+                ],
+                style={'width': '30%', 'padding-right': '5%'},
+            ),
+            html.Div(
+                children=[
+                    html.Label(['Number of samples (random and Latin hypercube):']),
+                    dcc.Input(id="ib-sweepsamples", className='input-box', type="number", value=10,
+                              min=1, max=MAX_SWEEP_RUNS, step=1, persistence=True),
+                ],
+                style={'width': '30%', 'padding-right': '5%'},
+            ),
+            html.Div(
+                children=[
+                    html.Button('Run Sweep', id='run-sweep', className='btn btn-square btn-run', n_clicks=0),
+                ],
+                style={'width': '30%', 'display': 'flex', 'align-items': 'flex-end'},
+            ),
+        ],
+        style={'display': 'flex'}
+    ),
+    html.Br(),
+    html.Br(),
+    ]),
+
     # --------------------------
     #       Data storage
     # --------------------------
-    dcc.Store(id='conf-values', storage_type='local'),
-    dcc.Store(id='method-values', storage_type='local'),
     dcc.Store(id='num-methods', storage_type='local'),
-    dcc.Store(id='settings-data', storage_type='local')
+    dcc.Store(id='settings-data', storage_type='local'),
+    dcc.Store(id='conf-restored'),
+    dcc.Store(id='conf-changes'),
 ])
 
 
@@ -611,43 +702,92 @@ dashboard_layout = html.Div([
 #         Callbacks
 # --------------------------
 
-@app.callback(Output("global-r3-div", "style"),
-              Input("task-dropdown", "value"))
-def render_global_section(task):
-    """ Renders the global section hiding/showing elements based on the task evaluated. """
+# Presentational callbacks are computed in the browser, see assets/clientside.js
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='render_global_section'),
+                        Output("global-r3-div", "style"),
+                        Input("task-dropdown", "value"))
 
-    if task == 'nc' or task == 'nr':
-        return {'display': 'none'}
-    else:
-        return {'display': 'flex'}
 
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='toggle_neigh_visibility'),
+                        Output("neighbourhood-div", "style"),
+                        Input("network-types", "value"))
 
-@app.callback(Output("neighbourhood-div", "style"),
-              Input("network-types", "value"))
-def toggle_neigh_visibility(val):
-    if val == 'dir':
-        return {'width': '30%'}
-    else:
-        return {'display': 'none'}
 
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='toggle_heuristics_visibility'),
+                        Output("heuristic-bl-div", "style"),
+                        Input("task-dropdown", "value"))
 
-@app.callback(Output("heuristic-bl-div", "style"),
-              Input("task-dropdown", "value"))
-def toggle_heuristics_visibility(task):
-    if task == 'nc':
-        return {'display': 'none'}
-    else:
-        return {'display': 'flex', 'margin-bottom': '20px'}
+
+@app.callback(Output('network-stats', 'children'),
+              Output('network-stats-interval', 'disabled'),
+              Input('network-paths', 'value'),
+              Input('ib-nwnames', 'value'),
+              Input('ib-separator', 'value'),
+              Input('ib-comment', 'value'),
+              Input('network-types', 'value'),
+              Input('network-stats-interval', 'n_intervals'),
+              State('settings-data', 'data'))
+def show_network_stats(paths, names, seps, comments, nw_type, n_intervals, settings_data):
+    """ Shows the statistics of each network below the edgelist paths. Networks not indexed yet are read in the
+    background and the statistics are polled until all of them are available. """
+    exec_path, eval_path, settings_data = get_settings(settings_data)
+    paths = [path.strip() for path in (paths or '').split('\n') if path.strip() != '']
+    names = (names or '').split()
+    seps = parse_separators(seps or '')
+    comments = parse_separators(comments or '')
+    if len(paths) == 0:
+        return [], True
+    if len(seps) != len(paths) or len(comments) != len(paths) or '' in seps + comments:
+        return [html.Div('Set a separator and comment char per network to see its statistics.')], True
+
+    lines = []
+    pending = False
+    for i, path in enumerate(paths):
+        stats = datasets.lookup(eval_path, path, seps[i], comments[i])
+        pending = pending or stats is None
+        name = names[i] if i < len(names) else os.path.basename(path)
+        lines.append(html.Div(format_stats(name, stats, nw_type == 'dir'),
+                              title=format_deg_hist(stats, nw_type == 'dir')))
+    return lines, not pending
+
+
+# Fields used by the runtime and memory estimate, their current values are used before they reach the session store
+ESTIMATE_FIELDS = ['task-dropdown', 'ib-exprep', 'ib-frace', 'ib-rpnf', 'ib-fracn', 'ib-embdim', 'ib-timeout',
+                   'ib-trainfrac', 'network-paths', 'network-types', 'ib-separator', 'ib-comment',
+                   'baselines-checklist', 'baselines-checklist2']
+
+
+@app.callback(Output('eval-estimate', 'children'),
+              [Input(key, 'value') for key in ESTIMATE_FIELDS],
+              Input('estimate-interval', 'n_intervals'),
+              Input('network-stats-interval', 'disabled'),
+              State('settings-data', 'data'))
+def show_estimate(*args):
+    """ Shows the estimated runtime and peak memory of the current config, learned from the previous runs in the
+    evaluation folder, and warns if it is likely to hit the TIMEOUT or to run out of memory. """
+    exec_path, eval_path, settings_data = get_settings(args[-1])
+    conf_dict, methods_dict = get_session_config()
+    conf_dict.update(zip(ESTIMATE_FIELDS, args[:len(ESTIMATE_FIELDS)]))
+    try:
+        config = EvalConfig.from_values(conf_dict, methods_dict)
+    except ValueError:
+        raise PreventUpdate
+    if not os.path.isdir(eval_path) or config.inpaths.strip() == '':
+        return []
+    estimate = estimator.estimate(eval_path, config)
+    warnings = get_warnings(config, estimate, sampler.latest()['mem_available'])
+    return [html.Div(format_estimate(estimate))] + [html.Div(warning, className='warning') for warning in warnings]
 
 
 @app.callback(Output("modal-sm", "is_open"),
               Output("modal-sm", "children"),
               Input("exp-conf", "n_clicks"),
               Input("clr-conf", "n_clicks"),
-              Input("run-eval", "n_clicks"),
-              State("modal-sm", "is_open"),
-              State('settings-data', 'data'))
-def toggle_modal(n1, n2, n3, is_open, settings_data):
+              Input("upload-conf", "contents"),
+              State("modal-sm", "is_open"))
+def toggle_modal(n1, n2, upload, is_open):
+    """ Shows the outcome of the config buttons. Evaluations, sweeps and queued configs report their own outcome when
+    submitted. """
     ctx = callback_context
     if not ctx.triggered:
         raise PreventUpdate
@@ -657,89 +797,154 @@ def toggle_modal(n1, n2, n3, is_open, settings_data):
             return not is_open, [dbc.ModalHeader(dbc.ModalTitle("Config exported successfully!"), close_button=False)]
         elif button_id == 'clr-conf':
             return not is_open, [dbc.ModalHeader(dbc.ModalTitle("Config cleared successfully!"), close_button=False)]
-        elif button_id == 'run-eval':
-            if settings_data is None:
-                settings_data = [val for val in init_settings.values()]
-            else:
-                settings_data = json.loads(settings_data)
-            if settings_data[0] == '':
-                exec_path = sys.executable
-            else:
-                exec_path = settings_data[0]
-            if evalne_installed(exec_path):
-                raise PreventUpdate
-            else:
-                return not is_open, [dbc.ModalHeader(dbc.ModalTitle("EvalNE is not installed in the current env!"),
-                                                     close_button=False)]
+        elif button_id == 'upload-conf':
+            # Only failed imports are reported, the parsed config is cached for the callbacks loading it
+            try:
+                parse_config(upload)
+            except ValueError as e:
+                return not is_open, [dbc.ModalHeader(dbc.ModalTitle(str(e)), close_button=False)]
+            raise PreventUpdate
         else:
             raise PreventUpdate
 
 
 @app.callback(Output('run-eval', 'className'),
               Output('run-eval', 'children'),
-              Input('btnUpdt-interval', 'n_intervals'))
-def set_run_button_state(n_intervals):
-    """ Periodic function that checks if an evaluation is running and updates the style of the Start/Stop button. """
-    running = get_evalne_proc().running()
-    if not running:
+              Input('btnUpdt-interval', 'n_intervals'),
+              State('settings-data', 'data'))
+def set_run_button_state(n_intervals, settings_data):
+    """ Periodic function that checks if evaluations are queued or running and updates the style of the Run button. """
+    if settings_data is None:
+        settings_data = [val for val in init_settings.values()]
+    else:
+        settings_data = json.loads(settings_data)
+    if settings_data[1] == '':
+        eval_path = os.getcwd()
+    else:
+        eval_path = settings_data[1]
+    active = os.path.isdir(eval_path) and \
+        any(job['state'] in ('queued', 'running') for job in get_queue(eval_path).jobs())
+    if not active:
         return ['btn btn-square btn-run', 'Start Evaluation']
     else:
-        return ['btn btn-square btn-run btn-active', 'Stop Evaluation']
+        return ['btn btn-square btn-run btn-active', 'Queue Evaluation']
 
 
-@app.callback(Output('run-eval', 'n_clicks'),
+@app.callback(Output("modal-sm", "is_open", allow_duplicate=True),
+              Output("modal-sm", "children", allow_duplicate=True),
               Input('run-eval', 'n_clicks'),
-              State('conf-values', 'data'),
-              State('method-values', 'data'),
-              State('settings-data', 'data'))
-def start_stop_eval(n_clicks, conf_vals, methods_vals, settings_data):
-    """ Function that starts/stops an evaluation when the Start/Stop button is pressed. """
-    ctx = callback_context
-
-    if not ctx.triggered:
+              State('settings-data', 'data'),
+              prevent_initial_call=True)
+def submit_eval(n_clicks, settings_data):
+    """ Function that checks the networks of the current config and, if no errors are found, exports the config and
+    adds an evaluation to the job queue when the Run button is pressed. Nothing is queued if EvalNE is not installed.
+    The outcome is shown in the modal. Queued and running evaluations can be cancelled from the Runs & Results tab. """
+    exec_path, eval_path, settings_data = get_settings(settings_data)
+    if not evalne_installed(exec_path):
+        return True, get_modal_children("EvalNE is not installed in the current env! Evaluation not queued.")
+
+    # Load config data and check the networks before EvalNE spends time loading them
+    conf_dict, methods_dict = get_session_config()
+    errors, reports = preflight(conf_dict, eval_path)
+    if len(errors):
+        return True, get_modal_children("Evaluation not queued, errors found in the networks!", errors)
+
+    # Export conf.ini and queue the evaluation
+    queue = get_queue(eval_path)
+    queue.configure(settings_data[2], settings_data[3])
+    queue_config(queue, exec_path, eval_path, conf_dict, methods_dict, settings_data,
+                 datetime.datetime.now().strftime("%m%d_%H%M%S"))
+
+    return True, get_modal_children("Evaluation queued!", [format_report(*report) for report in reports])
+
+
+@app.callback(Output("modal-sm", "is_open", allow_duplicate=True),
+              Output("modal-sm", "children", allow_duplicate=True),
+              Input('run-sweep', 'n_clicks'),
+              State('settings-data', 'data'),
+              State('sweep-params', 'value'),
+              State('sweep-dropdown', 'value'),
+              State('ib-sweepsamples', 'value'),
+              prevent_initial_call=True)
+def submit_sweep(n_clicks, settings_data, sweep_params, sweep_mode, sweep_samples):
+    """ Function that expands the parameter sweep into one config per point and adds them to the job queue as a
+    single group when the Run Sweep button is pressed. Nothing is queued if EvalNE is not installed. The outcome is
+    shown in the modal. """
+    exec_path, eval_path, settings_data = get_settings(settings_data)
+    if not evalne_installed(exec_path):
+        return True, get_modal_children("EvalNE is not installed in the current env! Sweep not queued.")
+
+    # Load config data
+    conf_dict, methods_dict = get_session_config()
+
+    try:
+        points = expand_sweep(parse_sweep(sweep_params or ''), sweep_mode, sweep_samples or 1,
+                              conf_dict['ib-seed'])
+    except ValueError as e:
+        return True, get_modal_children(str(e))
+    errors, reports = preflight(conf_dict, eval_path)
+    if len(errors):
+        return True, get_modal_children("Sweep not queued, errors found in the networks!", errors)
+
+    group = '{}_eval_{}_sweep'.format(conf_dict['task-dropdown'], datetime.datetime.now().strftime("%m%d_%H%M%S"))
+    subconfs = [(get_point_name(i, point), apply_sweep(conf_dict, point), methods_dict)
+                for i, point in enumerate(points)]
+    queue = get_queue(eval_path)
+    queue.configure(settings_data[2], settings_data[3])
+    submit_group(queue, exec_path, os.path.join(eval_path, group), subconfs, settings_data[5])
+    write_json(os.path.join(eval_path, group, 'sweep.json'),
+               {name: point for (name, _, _), point in zip(subconfs, points)})
+
+    return True, get_modal_children("Sweep of {} runs queued!".format(len(points)),
+                                    [format_report(*report) for report in reports])
+
+
+@app.callback(Output('upload-confs', 'contents'),
+              Output("modal-sm", "is_open", allow_duplicate=True),
+              Output("modal-sm", "children", allow_duplicate=True),
+              Input('upload-confs', 'contents'),
+              State('upload-confs', 'filename'),
+              State('settings-data', 'data'),
+              prevent_initial_call=True)
+def submit_configs(uploads, filenames, settings_data):
+    """ Function that adds one evaluation per valid config file to the job queue when several config files are
+    imported at once with the Queue Configs button. Nothing is queued if EvalNE is not installed. Invalid files and
+    files with errors in their networks are skipped. The outcome is shown in the modal. """
+    if not uploads:
+        # Also triggered when the uploaded files are cleared after queueing them
         raise PreventUpdate
-    else:
-        if int(n_clicks) % 2 == 0:
-            # Even clicks stop eval and set button text to `Run Evaluation`
-            get_evalne_proc().stop()
-            return n_clicks
-        else:
-            # Odd clicks start eval and set button to `Stop Evaluation`
-            if settings_data is None:
-                settings_data = [val for val in init_settings.values()]
-            else:
-                settings_data = json.loads(settings_data)
-            if settings_data[0] == '':
-                exec_path = sys.executable
-            else:
-                exec_path = settings_data[0]
-            if settings_data[1] == '':
-                eval_path = os.getcwd()
-            else:
-                eval_path = settings_data[1]
-            ini_path = os.path.join(eval_path, 'conf_gui_{}.ini'.format(datetime.datetime.now().strftime("%m%d_%H%M")))
-            console_out = os.path.join(eval_path, 'console.out')
-
-            # Load config data
-            conf_vals = json.loads(conf_vals)
-            conf_dict = dict(zip(init_vals.keys(), conf_vals))
-            methods_vals = json.loads(methods_vals)
-            methods_dict = dict(zip(method_init_vals.keys(), methods_vals))
-
-            # Export conf.ini and run evaluation
-            export_config_file(ini_path, conf_dict, methods_dict)
-            proc = get_evalne_proc()
-            proc.start('{} -m evalne {}'.format(exec_path, ini_path), console_out, eval_path, True)
-
-            return n_clicks
+    exec_path, eval_path, settings_data = get_settings(settings_data)
+    if not evalne_installed(exec_path):
+        return None, True, get_modal_children("EvalNE is not installed in the current env! No configs queued.")
+    queue = get_queue(eval_path)
+    queue.configure(settings_data[2], settings_data[3])
+    stamp = datetime.datetime.now().strftime("%m%d_%H%M%S")
+    queued, invalid, failed = 0, [], []
+    for i, (filename, contents) in enumerate(zip(filenames, uploads)):
+        try:
+            conf_dict, methods_dict = parse_config(contents).to_values()
+        except ValueError:
+            invalid.append(filename)
+            continue
+        # Same network checks as for the evaluations started from the dashboard
+        errors, _ = preflight(conf_dict, eval_path)
+        if len(errors):
+            failed += ['{}: {}'.format(filename, error) for error in errors]
+            continue
+        queue_config(queue, exec_path, eval_path, conf_dict, methods_dict, settings_data, '{}_{:03d}'.format(stamp, i))
+        queued += 1
+
+    lines = ["Invalid files skipped: {}".format(', '.join(invalid))] if len(invalid) else []
+    if len(failed):
+        lines += ["Files skipped, errors found in the networks:"] + failed
+    # Clear the upload so the same files can be queued again
+    return None, True, get_modal_children("{} configs queued!".format(queued), lines)
 
 
 @app.callback(Output('exp-conf', 'n_clicks'),
               Input('exp-conf', 'n_clicks'),
-              State('conf-values', 'data'),
-              State('method-values', 'data'),
               State('settings-data', 'data'))
-def export_config(n_clicks, conf_vals, methods_vals, settings_data):
+def export_config(n_clicks, settings_data):
     """ This function is executed when the user preses the export config button. """
     ctx = callback_context
 
@@ -754,127 +959,92 @@ def export_config(n_clicks, conf_vals, methods_vals, settings_data):
             eval_path = os.getcwd()
         else:
             eval_path = settings_data[1]
-        conf_vals = json.loads(conf_vals)
-        methods_vals = json.loads(methods_vals)
         conf_path = 'conf_gui_{}.ini'.format(datetime.datetime.now().strftime("%m%d_%H%M"))
-        conf_dict = dict(zip(init_vals.keys(), conf_vals))
-        methods_dict = dict(zip(method_init_vals.keys(), methods_vals))
+        conf_dict, methods_dict = get_session_config()
         export_config_file(os.path.join(eval_path, conf_path), conf_dict, methods_dict)
         return n_clicks
 
 
-@app.callback(Output('ob-trainfrac', 'children'),
-              Input('ib-trainfrac', 'value'))
-def render_train_perc(frac):
-    """ Function that updates the train frac percentage when the slider moves. """
-    val = int(float(frac) * 100)
-    return 'Train-test fraction ({}%):'.format(val)
-
-
-@app.callback(Output('ob-validfrac', 'children'),
-              Input('ib-validfrac', 'value'))
-def render_valid_perc(frac):
-    """ Function that updates the valid frac percentage when the slider moves. """
-    val = int(float(frac) * 100)
-    return 'Train-valid. fraction ({}%):'.format(val)
-
-
-@app.callback(Output('output-box-frace', 'children'),
-              Input('ib-frace', 'value'))
-def render_nodepairs_perc(frac):
-    """ Function that updates the node-pair frac when the slider moves. """
-    val = float(frac) * 100
-    return 'Node pairs to evaluate ({:4.1f}%):'.format(val)
-
-
-@app.callback([Output('task', 'style'),
-               Output('exprep', 'style'),
-               Output('output-fracs', 'style'),
-               Output('nc-nodefracs', 'style'),
-               Output('nc-repperfrac', 'style'),
-               Output('ee', 'style'),
-               Output('lbl-lpmodel', 'children'),
-               Output('network-labelpaths-div', 'style'),
-               Output('maximize-dropdown', 'options'),
-               Output('scores-dropdown', 'options')],
-               Input('task-dropdown', 'value'))
-def render_content(task):
-    """ Function that updates the Dashboard elements and style based on the task to be evaluated. """
-    if task == 'lp' or task == 'sp':
-        return [{'width': '30%', 'padding-right': '5%'},                        # task
-                {'width': '30%', 'padding-right': '5%'},                        # exprep
-                {'display': 'none'},                                            # nr fracs
-                {'display': 'none'},                                            # nc nodefracs
-                {'display': 'none'},                                            # nc repperfrac
-                {'width': '30%'},                                               # ee method
-                'Binary classifier:',
-                {'display': 'none'},
-                maximize_opts,
-                maximize_opts + [{'label': 'All', 'value': 'all'}]]
-    elif task == 'nr':
-        return [{'width': '30%', 'padding-right': '5%'},                        # task
-                {'display': 'none'},                                            # exprep
-                {'width': '30%', 'padding-right': '5%'},                        # nr fracs
-                {'display': 'none'},                                            # nc nodefracs
-                {'display': 'none'},                                            # nc repperfrac
-                {'width': '30%'},                                               # ee method
-                'Binary classifier:',
-                {'display': 'none'},
-                maximize_opts,
-                maximize_opts + [{'label': 'All', 'value': 'all'}]]
-    elif task == 'nc':
-        return [{'width': '30%', 'padding-right': '5%'},                        # task
-                {'display': 'none'},                                            # exprep
-                {'display': 'none'},                                            # nr fracs
-                {'width': '30%', 'padding-right': '5%'},                        # nc nodefracs
-                {'width': '30%'},                                               # nc repperfrac
-                {'display': 'none'},                                            # ee method
-                'Multi-label classifier:',
-                {'display': 'block'},
-                [{'label': 'F1-micro', 'value': 'f1_micro'},
-                 {'label': 'F1-macro', 'value': 'f1_macro'},
-                 {'label': 'F1-weighted', 'value': 'f1_weighted'}],
-                [{'label': 'All', 'value': 'all'},
-                 {'label': 'F1-micro', 'value': 'f1_micro'},
-                 {'label': 'F1-macro', 'value': 'f1_macro'},
-                 {'label': 'F1-weighted', 'value': 'f1_weighted'}]]
-
-
-@app.callback([[Output(key, 'value') for key in init_vals.keys()]],
-              Output('conf-values', 'data'),
-              [[Input(key, 'value') for key in init_vals.keys()]],
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='render_train_perc'),
+                        Output('ob-trainfrac', 'children'),
+                        Input('ib-trainfrac', 'value'))
+
+
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='render_valid_perc'),
+                        Output('ob-validfrac', 'children'),
+                        Input('ib-validfrac', 'value'))
+
+
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='render_nodepairs_perc'),
+                        Output('output-box-frace', 'children'),
+                        Input('ib-frace', 'value'))
+
+
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='render_content'),
+                        Output('task', 'style'),
+                        Output('exprep', 'style'),
+                        Output('output-fracs', 'style'),
+                        Output('nc-nodefracs', 'style'),
+                        Output('nc-repperfrac', 'style'),
+                        Output('ee', 'style'),
+                        Output('lbl-lpmodel', 'children'),
+                        Output('network-labelpaths-div', 'style'),
+                        Output('maximize-dropdown', 'options'),
+                        Output('scores-dropdown', 'options'),
+                        Input('task-dropdown', 'value'))
+
+
+# Collects the config fields changed by the user, values written by `restore_config` are not sent back
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='collect_config_changes'),
+                        Output('conf-changes', 'data'),
+                        [Input(key, 'value') for key in init_vals.keys()],
+                        Input('conf-restored', 'data'),
+                        prevent_initial_call=True)
+
+
+@app.callback(Input('conf-changes', 'data'), prevent_initial_call=True)
+def save_config_changes(changes):
+    """ Stores the config values changed by the user in the session store. Only the changed values are sent to the
+    server and only their entries in the store are updated. """
+    if changes:
+        sessions.set_many(get_session_id(), {'conf:' + key: val for key, val in changes.items()})
+
+
+@app.callback([Output(key, 'value') for key in init_vals.keys()],
+              Output('conf-restored', 'data'),
               Input('clr-conf', 'n_clicks'),
               Input('upload-conf', 'contents'),
-              State('conf-values', 'data'))
-def refresh_config(data, nclick, upload, old_data):
-    """ This function stores and loads data from a dcc.Store on page-refresh/tab-change/user-action. """
+              [State(key, 'value') for key in init_vals.keys()])
+def restore_config(clr_nclk, upload, *data):
+    """ This function restores the config values from the session store on page-refresh/tab-change and resets or
+    imports them on user-action. Only the values that differ from the ones displayed are sent back. """
+    session_id = get_session_id()
     ctx = callback_context
     if not ctx.triggered:
-        if old_data is None:
-            # Triggered on first ui load
-            res = [val for val in init_vals.values()]
-            return res, json.dumps(res)
-        else:
-            # Triggered when changing tabs/restarting
-            od = json.loads(old_data)
-            return od, old_data
+        # Triggered when changing tabs/restarting
+        res = list(get_session_config()[0].values())
     else:
         button_id = ctx.triggered[0]['prop_id'].split('.')[0]
         if button_id == 'clr-conf':
             # Triggered by user click
             res = [val for val in init_vals.values()]
-            return res, json.dumps(res)
-        elif button_id == 'upload-conf':
-            conf_vals = get_config_vals(upload)
-            return conf_vals, json.dumps(conf_vals)
         else:
-            # Triggered when any value is changed in conf
-            if button_id == 'task-dropdown':
-                if data[0] == 'nc':
-                    data[27] = 'f1_micro'
-                else:
-                    data[27] = 'auroc'
-            return data, json.dumps(data)
+            try:
+                res = get_config_vals(upload)
+            except ValueError:
+                # Reported by the modal
+                raise PreventUpdate
+        sessions.set_many(session_id, {'conf:' + key: val for key, val in zip(init_vals.keys(), res)})
+    # The restored values are also sent as a whole, so they are not saved again as changes of each field
+    return get_changed(data, res) + [dict(zip(init_vals.keys(), res))]
+
+
+# Resets the metric to maximize when the task changes to or from node classification
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='reset_maximize'),
+                        Output('maximize-dropdown', 'value', allow_duplicate=True),
+                        Input('task-dropdown', 'value'),
+                        State('maximize-dropdown', 'value'),
+                        prevent_initial_call=True)
 
 
 @app.callback(Output('method', 'children'),
@@ -915,19 +1085,25 @@ def show_methods(add_nclk, del_nclk, clr_nclk, upload, curr_children, num_method
             # Reset to one method div
             return append_children_divs(1)
         elif button_id == 'upload-conf':
-            return append_children_divs(get_num_methods(upload))
+            try:
+                return append_children_divs(get_num_methods(upload))
+            except ValueError:
+                raise PreventUpdate
         else:
             raise PreventUpdate
 
 
-@app.callback([[Output({'type': key, 'index': ALL}, 'value') for key in method_init_vals.keys()]],
-              Output('method-values', 'data'),
-              [[Input({'type': key, 'index': ALL}, 'value') for key in method_init_vals.keys()]],
+@app.callback([Output({'type': key, 'index': ALL}, 'value') for key in method_init_vals.keys()],
+              [Input({'type': key, 'index': ALL}, 'value') for key in method_init_vals.keys()],
               Input('num-methods', 'data'),
               Input('clr-conf', 'n_clicks'),
-              Input('upload-conf', 'contents'),
-              State('method-values', 'data'))
-def save_method_values(values, num_methods, nclicks, upload, old_data):
+              Input('upload-conf', 'contents'))
+def save_method_values(*args):
+    """ This function stores the method values in the session store and restores them on
+    page-refresh/tab-change/user-action. Only the values that differ from the ones displayed are sent back. """
+    values, num_methods, upload = list(args[:len(method_init_vals)]), args[-3], args[-1]
+    session_id = get_session_id()
+    old_data = sessions.get(session_id, 'method-values')
     ctx = callback_context
     if not ctx.triggered:
         raise PreventUpdate
@@ -935,7 +1111,7 @@ def save_method_values(values, num_methods, nclicks, upload, old_data):
         button_id = ctx.triggered[0]['prop_id'].split('.')[0]
         if button_id == 'num-methods':
             # Triggered when a method in added or removed
-            res = json.loads(old_data)
+            res = old_data or [[] for _ in method_init_vals]
             num_methods = json.loads(num_methods)
             if len(res[0]) < num_methods:
                 # Method added
@@ -952,68 +1128,47 @@ def save_method_values(values, num_methods, nclicks, upload, old_data):
             # Triggered when used presses clear conf button
             res = [[val] for val in method_init_vals.values()]
         elif button_id == 'upload-conf':
-            res = get_config_methods(upload)
+            try:
+                res = get_config_methods(upload)
+            except ValueError:
+                raise PreventUpdate
         else:
             if values[0][0] is None:
                 # Triggered when page refreshed or ui init
                 if len(values[0]) > 1:
                     # Page refresh
-                    res = json.loads(old_data)
+                    res = old_data
                 else:
                     # UI init
                     if old_data is not None:
-                        res = json.loads(old_data)
+                        res = old_data
                     else:
                         res = [[val] for val in method_init_vals.values()]
             else:
                 # Triggered when method values are modified
                 res = values
 
-    return res, json.dumps(res)
-
-
-@app.callback([Output({'type': 'emb-type-div', 'index': MATCH}, 'style'),
-               Output({'type': 'm-opts-div', 'index': MATCH}, 'style'),
-               Output({'type': 'm-tune-div', 'index': MATCH}, 'style'),
-               Output({'type': 'm-input-delim-div', 'index': MATCH}, 'style'),
-               Output({'type': 'm-output-delim-div', 'index': MATCH}, 'style')],
-              Input({'type': 'm-lib-dropdown', 'index': MATCH}, 'value'))
-def toggle_method_style(m_type):
-    if m_type:
-        if m_type == 'opne':
-            return [{'display': 'none'},
-                    {'display': 'none'},
-                    {'width': '100%'},
-                    {'display': 'none'},
-                    {'display': 'none'}]
-        else:
-            return [{'width': '22%', 'padding-right': '4%'},
-                    {'width': '22%'},
-                    {'width': '48%', 'padding-right': '4%'},
-                    {'width': '22%', 'padding-right': '4%'},
-                    {'width': '22%'}]
-    else:
-        raise PreventUpdate
+    sessions.set(session_id, 'method-values', res)
+    if any(len(vals) != len(new_vals) for vals, new_vals in zip(values, res)):
+        return res
+    return [get_changed(vals, new_vals) for vals, new_vals in zip(values, res)]
 
 
-@app.callback(Output("maximize-div", "style"),
-              Output("scores-div", "style"),
-              Output("curves-div", "style"),
-              Output("precatk-div", "style"),
-              Input("task-dropdown", "value"))
-def render_metrics_section(task):
-    """ Renders the metrics section based on the task evaluated. """
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='toggle_method_style'),
+                        Output({'type': 'emb-type-div', 'index': MATCH}, 'style'),
+                        Output({'type': 'm-opts-div', 'index': MATCH}, 'style'),
+                        Output({'type': 'm-tune-div', 'index': MATCH}, 'style'),
+                        Output({'type': 'm-input-delim-div', 'index': MATCH}, 'style'),
+                        Output({'type': 'm-output-delim-div', 'index': MATCH}, 'style'),
+                        Input({'type': 'm-lib-dropdown', 'index': MATCH}, 'value'))
 
-    if task == 'nc':
-        return [{'width': '48%', 'padding-right': '4%'},
-                {'width': '48%'},
-                {'display': 'none'},
-                {'display': 'none'}]
-    else:
-        return [{'width': '22%', 'padding-right': '4%'},
-                {'width': '22%', 'padding-right': '4%'},
-                {'width': '22%', 'padding-right': '4%'},
-                {'width': '22%'}]
+
+app.clientside_callback(ClientsideFunction(namespace='dashboard', function_name='render_metrics_section'),
+                        Output("maximize-div", "style"),
+                        Output("scores-div", "style"),
+                        Output("curves-div", "style"),
+                        Output("precatk-div", "style"),
+                        Input("task-dropdown", "value"))
 
 
 # --------------------------
@@ -1194,3 +1349,62 @@ def get_method_div(val):
         ]
     )
     return el
+
+
+def submit_group(queue, exec_path, run_path, subconfs, parallel):
+    """ Exports each (name, conf_dict, methods_dict) sub-config to its own folder inside `run_path` and adds them to
+    the job queue as a group running at most `parallel` sub-runs at once. Paths relative to the evaluation folder are
+    made absolute, as sub-runs execute in their own folder. """
+    ini_paths = []
+    for name, sub_conf, sub_methods in subconfs:
+        os.makedirs(os.path.join(run_path, name))
+        ini_paths.append(os.path.join(run_path, name, 'conf.ini'))
+        sub_conf, sub_methods = make_paths_absolute(sub_conf, sub_methods, os.path.dirname(run_path))
+        export_config_file(ini_paths[-1], sub_conf, sub_methods)
+    queue.submit_group(exec_path, ini_paths, os.path.basename(run_path), parallel or 1)
+
+
+def queue_config(queue, exec_path, eval_path, conf_dict, methods_dict, settings_data, stamp):
+    """ Exports a config to `eval_path` and adds it to the job queue, split in sub-runs if enabled in the settings. """
+    ini_path = os.path.join(eval_path, 'conf_gui_{}.ini'.format(stamp))
+    export_config_file(ini_path, conf_dict, methods_dict)
+    subconfs = split_config(conf_dict, methods_dict, settings_data[4])
+    if len(subconfs) > 1:
+        group = '{}_eval_{}'.format(conf_dict['task-dropdown'], stamp)
+        submit_group(queue, exec_path, os.path.join(eval_path, group), subconfs, settings_data[5])
+    else:
+        queue.submit(exec_path, ini_path)
+
+
+def get_settings(settings_data):
+    """ Returns the python executable, the evaluation folder and the list of all settings values. """
+    if settings_data is None:
+        settings_data = [val for val in init_settings.values()]
+    else:
+        settings_data = json.loads(settings_data)
+        settings_data += [val for val in init_settings.values()][len(settings_data):]
+    exec_path = sys.executable if settings_data[0] == '' else settings_data[0]
+    eval_path = os.getcwd() if settings_data[1] == '' else settings_data[1]
+    return exec_path, eval_path, settings_data
+
+
+def get_modal_children(title, lines=()):
+    """ Returns the contents of the modal, a title and optionally a list of lines. """
+    children = [dbc.ModalHeader(dbc.ModalTitle(title), close_button=False)]
+    if len(lines):
+        children.append(dbc.ModalBody(html.Ul([html.Li(line) for line in lines])))
+    return children
+
+
+def get_session_config():
+    """ Returns the config and method values of the current session as two dicts. """
+    session_id = get_session_id()
+    conf_vals = sessions.get_many(session_id, ['conf:' + key for key in init_vals.keys()])
+    conf_dict = OrderedDict((key, conf_vals.get('conf:' + key, val)) for key, val in init_vals.items())
+    methods_vals = sessions.get(session_id, 'method-values') or [[val] for val in method_init_vals.values()]
+    return conf_dict, dict(zip(method_init_vals.keys(), methods_vals))
+
+
+def get_changed(old_vals, new_vals):
+    """ Returns the new values with `no_update` for the ones equal to the old values, so only changes are sent. """
+    return [no_update if old == new else new for old, new in zip(old_vals, new_vals)]
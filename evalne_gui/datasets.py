@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import json
+import queue
+import warnings
+import threading
+from evalne_gui.utils import get_state_dir, write_json
+from evalne_gui.preflight import read_chunks, new_report
+
+
+class DatasetIndex(object):
+    """ Persistent and incremental index of the statistics of the networks used in an evaluation folder.
+
+    Statistics are computed by a background thread, so callbacks never wait for a network to be read. Each entry is
+    keyed by the path of the edge list and the separator and comment character used to read it, and is only valid
+    while the size and mtime of the file do not change. The index is kept in memory and mirrored to a json file in the
+    GUI state folder, so reopening the GUI on a folder only stats the files instead of reading them again.
+
+    Parameters
+    ----------
+    filename : string
+        Name of the json file where the index is persisted.
+    """
+
+    version = 1
+
+    def __init__(self, filename='datasets.json'):
+        self._filename = filename
+        self._cache = dict()
+        self._pending = set()
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def lookup(self, eval_path, path, delimiter, comments):
+        """ Returns the statistics of the edge list at `path`, relative paths are resolved from `eval_path`. If the
+        statistics are missing or outdated, None is returned and the network is queued to be indexed.
+
+        Returns
+        -------
+        stats : dict
+            A dict with an `error` message if the file can not be read. Otherwise, the number of `nodes`, the number of
+            `components` and the size of the `largest` one and, under the `undir` and `dir` keys, the number of `edges`,
+            the `density`, the `min_deg`, `max_deg` and `mean_deg` and the `deg_hist` of the graph read as undirected
+            or directed. The degree histogram has log2 bins, i.e. the number of nodes with degree 1, 2-3, 4-7, etc.
+        """
+        path = os.path.abspath(os.path.join(eval_path, path))
+        try:
+            st = os.stat(path)
+        except OSError:
+            return {'error': 'file not found'}
+        key = json.dumps([path, delimiter, comments])
+        with self._lock:
+            index = self._get_index(eval_path)
+            entry = index['networks'].get(key)
+            if entry is not None and entry['size'] == st.st_size and entry['mtime'] == st.st_mtime_ns:
+                return entry['stats']
+            if (eval_path, key) not in self._pending:
+                self._pending.add((eval_path, key))
+                self._queue.put((eval_path, key))
+            self._start()
+        return None
+
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='evalne-gui-indexer', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            eval_path, key = self._queue.get()
+            path, delimiter, comments = json.loads(key)
+            try:
+                st = os.stat(path)
+                stats = get_network_stats(path, delimiter, comments)
+            except (OSError, MemoryError) as e:
+                st = None
+                stats = {'error': str(e)}
+            with self._lock:
+                self._pending.discard((eval_path, key))
+                if st is None:
+                    continue
+                index = self._get_index(eval_path)
+                index['networks'][key] = {'size': st.st_size, 'mtime': st.st_mtime_ns, 'stats': stats}
+                try:
+                    write_json(os.path.join(get_state_dir(eval_path), self._filename), index)
+                except OSError:
+                    pass
+
+    def _get_index(self, eval_path):
+        """ Returns the index of `eval_path`, reading the persisted one the first time. """
+        index = self._cache.get(eval_path)
+        if index is None:
+            try:
+                with open(os.path.join(eval_path, '.evalne_gui', self._filename)) as f:
+                    index = json.load(f)
+                if index.get('version') != self.version:
+                    index = None
+            except (OSError, ValueError):
+                pass
+            if index is None:
+                index = {'version': self.version, 'networks': dict()}
+            self._cache[eval_path] = index
+        return index
+
+
+def get_network_stats(path, delimiter, comments):
+    """ Reads the whole edge list at `path` and returns its statistics, see `DatasetIndex.lookup`. Lines EvalNE would
+    skip or fail on are ignored. """
+    # Imported here so numpy is only loaded once the indexer runs, not at GUI startup
+    import numpy as np
+    src, dst = read_edges(path, delimiter, comments)
+    if len(src) == 0:
+        return {'error': 'no edges found, the separator `{}` might be incorrect'.format(delimiter)}
+
+    # Relabel the nodes as 0..n-1
+    ids, inv = np.unique(np.concatenate((src, dst)), return_inverse=True)
+    n = len(ids)
+    src, dst = inv[:len(src)], inv[len(src):]
+
+    # Duplicated edges are only counted once, as in networkx graphs
+    dir_edges = np.unique(src * n + dst)
+    und_edges = np.unique(np.minimum(src, dst) * n + np.maximum(src, dst))
+    und_src, und_dst = np.divmod(und_edges, n)
+    labels = get_components(n, und_src, und_dst)
+    sizes = np.bincount(labels)
+    sizes = sizes[sizes > 0]
+
+    stats = {'nodes': int(n), 'components': int(len(sizes)), 'largest': int(sizes.max())}
+    for name, edges, max_edges in (('undir', und_edges, n * (n - 1) / 2), ('dir', dir_edges, n * (n - 1))):
+        deg = np.bincount(edges // n, minlength=n) + np.bincount(edges % n, minlength=n)
+        stats[name] = {'edges': int(len(edges)),
+                       'density': float(len(edges) / max_edges) if max_edges > 0 else 0.0,
+                       'min_deg': int(deg.min()),
+                       'max_deg': int(deg.max()),
+                       'mean_deg': float(deg.mean()),
+                       'deg_hist': np.bincount(np.log2(np.maximum(deg, 1)).astype(int)).tolist()}
+    return stats
+
+
+def read_edges(path, delimiter, comments):
+    """ Reads the node ids of each edge in the edge list as two int64 arrays. """
+    import numpy as np
+    srcs, dsts = [], []
+    for _, lines in read_chunks(path, new_report(path), float('inf')):
+        text = '\n'.join(lines)
+        if comments and comments in text:
+            lines = [line[:line.find(comments)] if comments in line else line for line in lines]
+            text = '\n'.join(lines)
+        edges = parse_chunk(text, lines, delimiter)
+        if edges is None:
+            rows = [row for row in (line.strip().split(delimiter) for line in lines if line) if len(row) >= 2]
+            # Keep only the edges with integer node ids
+            rows = [row for row in rows if is_int(row[0]) and is_int(row[1])]
+            edges = (np.array([int(row[0]) for row in rows], dtype=np.int64),
+                     np.array([int(row[1]) for row in rows], dtype=np.int64))
+        srcs.append(edges[0])
+        dsts.append(edges[1])
+    if len(srcs) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(srcs), np.concatenate(dsts)
+
+
+def parse_chunk(text, lines, delimiter):
+    """ Parses a chunk of edge list lines, also given joined as `text`, with numpy, which is much faster than splitting
+    each line, if all lines have the same two or three columns. Returns the source and destination arrays, or None if
+    the chunk has to be parsed line by line. """
+    import numpy as np
+    num_lines = len(lines) - lines.count('')
+    if num_lines == 0 or lines[0] == '':
+        return None
+    ncols = len(lines[0].strip().split(delimiter))
+    if ncols not in (2, 3):
+        return None
+    # Numpy splits on any blank, which are only allowed when they are the delimiter
+    if any(blank in text for blank in (' ', '\t') if blank != delimiter):
+        return None
+    if delimiter not in (' ', '\t'):
+        text = text.replace(delimiter, ' ')
+    # Weights may be floats, node ids are then only exact up to 2**53
+    dtype = np.int64 if ncols == 2 else np.float64
+    with warnings.catch_warnings():
+        # Numpy only warns when it can not parse the whole text
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            values = np.fromstring(text, dtype=dtype, sep=' ')
+        except (ValueError, DeprecationWarning):
+            return None
+    if values.size != num_lines * ncols:
+        return None
+    values = values.reshape(-1, ncols)[:, :2]
+    if ncols == 3:
+        if not np.all(np.abs(values) < 2 ** 53) or not np.all(values == np.floor(values)):
+            return None
+        values = values.astype(np.int64)
+    return values[:, 0].copy(), values[:, 1].copy()
+
+
+def get_components(n, src, dst):
+    """ Returns the connected component label of each of the `n` nodes of an undirected graph given by its edges.
+    Labels are propagated along the edges as the minimum node id and shortcut through the labels of the labels, which
+    only needs a few passes over the edges. """
+    import numpy as np
+    labels = np.arange(n)
+    while True:
+        old = labels.copy()
+        np.minimum.at(labels, src, labels[dst])
+        np.minimum.at(labels, dst, labels[src])
+        labels = labels[labels]
+        if np.array_equal(labels, old):
+            return labels
+
+
+def is_int(text):
+    try:
+        int(text)
+    except ValueError:
+        return False
+    return True
+
+
+def format_stats(name, stats, directed=False):
+    """ Returns a one line summary of the statistics of a network, e.g.
+    `BlogCatalog: 10,312 nodes, 333,983 edges, density 0.0063, degree 1-3,992 (mean 64.8), 1 component`. """
+    if stats is None:
+        return '{}: indexing...'.format(name)
+    if 'error' in stats:
+        return '{}: {}'.format(name, stats['error'])
+    graph = stats['dir' if directed else 'undir']
+    res = '{}: {:,} nodes, {:,} edges, density {:.2g}, degree {:,}-{:,} (mean {:.1f}), {:,} component{}'.format(
+        name, stats['nodes'], graph['edges'], graph['density'], graph['min_deg'], graph['max_deg'], graph['mean_deg'],
+        stats['components'], '' if stats['components'] == 1 else 's')
+    if stats['components'] > 1:
+        res += ' (largest has {:,} nodes)'.format(stats['largest'])
+    return res
+
+
+def format_deg_hist(stats, directed=False):
+    """ Returns the degree histogram of a network as text, one `degree range: number of nodes` line per bin. """
+    if stats is None or 'error' in stats:
+        return ''
+    lines = []
+    for i, count in enumerate(stats['dir' if directed else 'undir']['deg_hist']):
+        low, high = 2 ** i, 2 ** (i + 1) - 1
+        lines.append('{}: {:,} nodes'.format(low if low == high else '{}-{}'.format(low, high), count))
+    return '\n'.join(lines)
+
+
+# Shared dataset index
+datasets = DatasetIndex()
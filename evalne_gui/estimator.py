@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import threading
+from evalne_gui.config import EvalConfig
+from evalne_gui.jobs import get_queue
+from evalne_gui.datasets import datasets
+from evalne_gui.preflight import parse_separators
+
+
+# Minimum number of finished jobs of the same task needed to estimate runtimes and memory
+MIN_RUNS = 3
+
+# Strength of the ridge penalty, keeps the fit stable while there are fewer runs than features
+RIDGE = 0.1
+
+# Spread, in log space, assumed for the estimates until there are enough runs to measure it
+DEFAULT_LOG_STD = 0.5
+
+
+class RunEstimator(object):
+    """ Predicts the runtime and peak memory of an evaluation from the jobs previously run in the evaluation folder.
+
+    Each finished job gives one sample: the features of its config, see `get_features`, and the runtime and peak
+    memory of its process tree recorded by the job queue. The logarithm of the runtime and the peak memory are fitted
+    with a ridge regression on the logarithm of the features, i.e. a power law of the work done, using the jobs of the
+    same task. The features of finished jobs never change, so they are only computed once.
+    """
+
+    def __init__(self):
+        self._features = dict()
+        self._lock = threading.Lock()
+
+    def estimate(self, eval_path, config):
+        """ Returns the estimates for an `EvalConfig` or None if the networks have not been indexed yet.
+
+        Returns
+        -------
+        estimate : dict
+            A dict with the number of `runs` used and, for the `runtime` in seconds and the `peak_rss` in bytes, a
+            (estimate, low, high) tuple or None if there are less than `MIN_RUNS` runs to learn from. The low and high
+            values are one standard deviation away from the estimate.
+        """
+        x = get_features(eval_path, config)
+        if x is None:
+            return None
+        history = self._history(eval_path, config.task)
+        res = {'runs': len(history)}
+        for name, idx in (('runtime', 1), ('peak_rss', 2)):
+            samples = [sample for sample in history if sample[idx]]
+            res[name] = fit_predict([sample[0] for sample in samples], [sample[idx] for sample in samples], x)
+        return res
+
+    def _history(self, eval_path, task):
+        """ Returns a list of (features, runtime, peak rss) tuples for the finished jobs of `task`. """
+        res = []
+        for job in get_queue(eval_path).jobs():
+            # Adopted jobs have an unknown return code and may have failed
+            if job['state'] != 'done' or job['returncode'] != 0 or job['started'] is None:
+                continue
+            with self._lock:
+                entry = self._features.get(job['id'])
+            if entry is None:
+                try:
+                    with open(job['ini_path']) as f:
+                        config = EvalConfig.from_ini(f.read())
+                except (OSError, ValueError):
+                    config = None
+                feats = None if config is None else get_features(eval_path, config)
+                if config is not None and feats is None:
+                    # Networks still being indexed, try again later
+                    continue
+                entry = (None if config is None else config.task, feats)
+                with self._lock:
+                    self._features[job['id']] = entry
+            if entry[0] == task:
+                res.append((entry[1], job['finished'] - job['started'], job['peak_rss']))
+        return res
+
+
+def get_features(eval_path, config):
+    """ Returns the features of a config used to estimate its cost: the number of nodes and edges summed over all
+    networks, the number of repeats (edge splits or node splits times node fractions), the number of methods and
+    baselines, the embedding dimension and the sampled fraction (edges sampled for NR, train edges for LP and SP).
+    Returns None if the statistics of some network are not available yet. """
+    paths = [path.strip() for path in config.inpaths.split('\n') if path.strip() != '']
+    seps = parse_separators(config.separators)
+    comments = parse_separators(config.comments)
+    nodes, edges = 0, 0
+    for i, path in enumerate(paths):
+        stats = datasets.lookup(eval_path, path, seps[i] if i < len(seps) else ',',
+                                comments[i] if i < len(comments) else '#')
+        if stats is None:
+            return None
+        if 'error' not in stats:
+            nodes += stats['nodes']
+            edges += stats['dir' if config.network_type == 'dir' else 'undir']['edges']
+    return [nodes, edges] + get_work(config)
+
+
+def get_work(config):
+    """ Returns the number of repeats, the number of methods and baselines and the embedding dimension and sampled
+    fraction of a config, the features that do not depend on the networks. """
+    if config.task == 'nc':
+        repeats = to_float(config.nc_num_node_splits) * max(1, len(str(config.nc_node_fracs).split()))
+        frac = 1.0
+    elif config.task == 'nr':
+        repeats = 1
+        frac = to_float(config.nr_edge_samp_frac)
+    else:
+        repeats = to_float(config.lp_num_edge_splits)
+        frac = to_float(config.traintest_frac)
+    methods = sum(1 for method in config.methods if not method.is_empty)
+    methods += len(config.baselines) + len(config.baselines_other)
+    return [repeats, methods, to_float(config.embed_dim), frac]
+
+
+def fit_predict(samples, targets, x):
+    """ Fits the log of the `targets` on the log of the `samples` features and returns the (estimate, low, high)
+    prediction for the features `x`, or None if there are less than `MIN_RUNS` samples. """
+    # Only loaded once there are enough runs to fit, numpy slows down the GUI startup
+    import numpy as np
+    if len(samples) < MIN_RUNS:
+        return None
+    X = np.log1p(np.array(samples, dtype=float))
+    y = np.log(np.maximum(np.array(targets, dtype=float), 1e-3))
+    x = np.log1p(np.array(x, dtype=float))
+
+    # Center the data so the intercept is not penalized
+    mu_X, mu_y = X.mean(axis=0), y.mean()
+    Xc = X - mu_X
+    w = np.linalg.solve(Xc.T @ Xc + RIDGE * np.eye(X.shape[1]), Xc.T @ (y - mu_y))
+    pred = mu_y + (x - mu_X) @ w
+
+    # Spread of the residuals, only meaningful once there are more samples than features
+    dof = len(y) - X.shape[1] - 1
+    std = np.sqrt(np.sum((y - mu_y - Xc @ w) ** 2) / dof) if dof > 0 else DEFAULT_LOG_STD
+    std = max(std, 0.05)
+    return float(np.exp(pred)), float(np.exp(pred - std)), float(np.exp(pred + std))
+
+
+def get_warnings(config, estimate, mem_available):
+    """ Returns a list of warnings for an estimate: if the methods are likely to hit the config TIMEOUT or the
+    evaluation may need more memory than `mem_available` bytes. """
+    res = []
+    if estimate is None:
+        return res
+    if estimate['runtime'] is not None and to_float(config.timeout) > 0:
+        # EvalNE applies the timeout to each method execution, i.e. each method on each network and repeat
+        repeats, methods = get_work(config)[:2]
+        paths = [path for path in config.inpaths.split('\n') if path.strip() != '']
+        execs = max(1, len(paths) * repeats * methods)
+        per_exec = estimate['runtime'][0] / execs
+        if per_exec > to_float(config.timeout):
+            res.append('Methods are expected to take {} per execution, more than the TIMEOUT of {}!'
+                       .format(format_duration(per_exec), format_duration(to_float(config.timeout))))
+    if estimate['peak_rss'] is not None:
+        if estimate['peak_rss'][0] > mem_available:
+            res.append('Expected to need {} of RAM but only {} are available!'
+                       .format(format_bytes(estimate['peak_rss'][0]), format_bytes(mem_available)))
+        elif estimate['peak_rss'][2] > mem_available:
+            res.append('May need up to {} of RAM but only {} are available!'
+                       .format(format_bytes(estimate['peak_rss'][2]), format_bytes(mem_available)))
+    return res
+
+
+def format_estimate(estimate):
+    """ Returns a one line summary of an estimate, e.g. `Estimated runtime 1:20:00 (0:50:00-2:05:00), ...`. """
+    if estimate is None:
+        return 'Estimating runtime...'
+    if estimate['runtime'] is None and estimate['peak_rss'] is None:
+        return 'Not enough finished evaluations of this task to estimate the runtime ({} of {}).'.format(
+            estimate['runs'], MIN_RUNS)
+    parts = []
+    if estimate['runtime'] is not None:
+        parts.append('runtime {} ({}-{})'.format(*map(format_duration, estimate['runtime'])))
+    if estimate['peak_rss'] is not None:
+        parts.append('peak memory {} ({}-{})'.format(*map(format_bytes, estimate['peak_rss'])))
+    return 'Estimated {}, from {} previous runs.'.format(', '.join(parts), estimate['runs'])
+
+
+def format_duration(secs):
+    secs = int(round(secs))
+    return '{}:{:02d}:{:02d}'.format(secs // 3600, secs % 3600 // 60, secs % 60)
+
+
+def format_bytes(num):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if num < 1024:
+            return '{:.1f} {}'.format(num, unit)
+        num /= 1024
+    return '{:.1f} TB'.format(num)
+
+
+def to_float(val, default=0.0):
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return default
+
+
+# Shared estimator instance
+estimator = RunEstimator()
@@ -4,6 +4,7 @@
 # Contact: alexandru.mara@ugent.be
 # Date: 22/03/2021
 
+import os
 from collections import OrderedDict
 
 init_vals = OrderedDict({'task-dropdown': 'lp',
@@ -48,4 +49,8 @@ method_init_vals = OrderedDict({'m-lib-dropdown': 'other',
                                 'm-output-delim': ''})
 
 init_settings = OrderedDict({'ib-pythonpath': '',
-                             'ib-evalpath': ''})
+                             'ib-evalpath': '',
+                             'ib-maxjobs': 1,
+                             'ib-minmem': 10,
+                             'split-dropdown': 'none',
+                             'ib-parallel': os.cpu_count() or 1})
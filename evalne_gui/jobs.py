@@ -0,0 +1,407 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import json
+import time
+import uuid
+import psutil
+import datetime
+import threading
+from collections import OrderedDict
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, where only single process servers are supported
+    fcntl = None
+from evalne_gui.procinfo import EvalneProc, registry
+from evalne_gui.utils import LOG_TIME_FORMAT, get_jobs_dir, write_json, write_text
+
+
+# Possible states of a job
+JOB_STATES = ('queued', 'running', 'done', 'failed', 'cancelled', 'exited')
+
+# EvalNE names output folders `<task>_eval_<month><day>_<hour><min>`, so two evaluations started from the same folder
+# within the same minute would write to the same output folder. Launches are spaced by this many seconds. Sub-runs of
+# split evaluations run in their own folders and are not affected.
+LAUNCH_GAP = 60
+
+# Job fields added after the first version of the queue and their defaults
+JOB_DEFAULTS = {'group': None, 'cwd': None, 'parallel': 1, 'peak_rss': None}
+
+# The peak memory of a running job is persisted every time it grows by this factor
+PEAK_RSS_STEP = 1.1
+
+
+class JobQueue(object):
+    """ Persistent queue of EvalNE evaluations for one evaluation folder.
+
+    Each job is stored as a json file in the jobs folder of the GUI state, so queued jobs and the history of previous
+    ones survive GUI restarts. Jobs running when the GUI is restarted are adopted again through their pidfiles. The
+    exit code of an adopted job can not be recovered, so it is reported as `exited` with an unknown return code.
+
+    Evaluations split by network or method are submitted as a group of jobs sharing a run folder. A group takes a
+    single slot of `max_jobs` and runs up to `parallel` of its jobs at once. Every time one of them finishes, the logs
+    and results of the group are merged into its run folder so it is shown as a single run.
+
+    When the GUI is served by several worker processes, each of them has its own queue object for the same folder.
+    The jobs folder is the shared state: queues reload it whenever it changes, and only the process holding the lock
+    on `scheduler.lock` starts and monitors jobs. If that process exits, another one takes over on its next step.
+
+    Parameters
+    ----------
+    eval_path : string
+        The evaluation folder where jobs are executed.
+    """
+
+    def __init__(self, eval_path):
+        self.eval_path = eval_path
+        self.path = get_jobs_dir(eval_path)
+        self.config = {'max_jobs': 1, 'min_free_mem': 10}
+        self._jobs = OrderedDict()
+        self._procs = dict()
+        self._peaks = dict()
+        self._last_launch = 0
+        self._lock = threading.RLock()
+        self._mtime = None
+        self._lock_file = None
+        self._refresh()
+
+    def submit(self, exec_path, ini_path, group=None, parallel=1):
+        """ Adds a new evaluation of the config file `ini_path` to the queue and returns the job. Jobs of a `group`
+        run in the folder of their config file, otherwise they run in the evaluation folder. """
+        job_id = '{}_{}'.format(datetime.datetime.now().strftime('%Y%m%d_%H%M%S'), uuid.uuid4().hex[:6])
+        job = {'id': job_id,
+               'name': os.path.basename(ini_path) if group is None else
+               '{}/{}'.format(group, os.path.basename(os.path.dirname(ini_path))),
+               'group': group,
+               'cwd': None if group is None else os.path.dirname(ini_path),
+               'parallel': parallel,
+               'state': 'queued',
+               'exec_path': exec_path,
+               'ini_path': ini_path,
+               'console': os.path.join(self.path, job_id + '.out'),
+               'pidfile': os.path.join(self.path, job_id + '.pid'),
+               'submitted': time.time(),
+               'started': None,
+               'finished': None,
+               'returncode': None,
+               'peak_rss': None}
+        with self._lock:
+            self._jobs[job_id] = job
+            self._save(job)
+        return dict(job)
+
+    def submit_group(self, exec_path, ini_paths, group, parallel):
+        """ Adds the sub-configs of a split evaluation to the queue as a group. Each config file must be in its own
+        folder inside the run folder `group`. Returns the list of jobs. """
+        with self._lock:
+            return [self.submit(exec_path, ini_path, group, max(1, int(parallel))) for ini_path in ini_paths]
+
+    def cancel(self, job_id):
+        """ Cancels a queued job or kills a running one, including the method commands started by EvalNE. """
+        with self._lock:
+            # Changes made by the leader since the last step must not be overwritten
+            self._refresh()
+            job = self._jobs.get(job_id)
+            if job is None or job['state'] not in ('queued', 'running'):
+                return
+            if job['state'] == 'running':
+                self._get_proc(job).stop()
+                self._procs.pop(job_id, None)
+            self._finish(job, 'cancelled')
+
+    def configure(self, max_jobs=None, min_free_mem=None):
+        """ Sets the maximum number of concurrent jobs and the minimum % of free RAM needed to start a new one. """
+        with self._lock:
+            if max_jobs is not None:
+                self.config['max_jobs'] = max(1, int(max_jobs))
+            if min_free_mem is not None:
+                self.config['min_free_mem'] = max(0, min(100, int(min_free_mem)))
+            write_json(os.path.join(self.path, 'scheduler.json'), self.config)
+
+    def jobs(self):
+        """ Returns a list with a copy of all jobs, oldest first. """
+        with self._lock:
+            return [dict(job) for job in self._jobs.values()]
+
+    def running(self):
+        """ Returns a list with a copy of the running jobs, oldest first. """
+        return [job for job in self.jobs() if job['state'] == 'running']
+
+    def is_leader(self):
+        """ Returns True if this process is the one starting and monitoring the jobs. """
+        with self._lock:
+            return self._is_leader()
+
+    def get_proc(self, job):
+        """ Returns the process of a running job, see `EvalneProc`. """
+        with self._lock:
+            return self._get_proc(job)
+
+    def latest_console(self):
+        """ Returns the console output file of the job started last or None if no job was ever started. """
+        started = [job for job in self.jobs() if job['started'] is not None]
+        if len(started) == 0:
+            return None
+        return max(started, key=lambda job: job['started'])['console']
+
+    def step(self):
+        """ Updates the state of running jobs and starts queued ones if resources allow it. """
+        with self._lock:
+            self._refresh()
+            if not self._is_leader():
+                # Track the jobs started by the leader, so their processes can be monitored from this process
+                for job in self._jobs.values():
+                    if job['state'] == 'running':
+                        registry.get(job['pidfile'])
+                return
+            for job_id, proc in list(self._procs.items()):
+                # Reap the processes of jobs cancelled from other processes
+                if self._jobs[job_id]['state'] != 'running' and proc.poll() is not None:
+                    del self._procs[job_id]
+            for job in list(self._jobs.values()):
+                if job['state'] == 'running':
+                    self._check(job)
+                if job['state'] == 'running':
+                    self._update_peak_rss(job)
+            running = [job for job in self._jobs.values() if job['state'] == 'running']
+            units = set(job['group'] or job['id'] for job in running)
+            blocked = False
+            for job in [job for job in self._jobs.values() if job['state'] == 'queued']:
+                if job['group'] is not None and job['group'] in units:
+                    # Fill the running groups up to their core budget
+                    if sum(1 for r in running if r['group'] == job['group']) >= job['parallel'] or \
+                            not self._memory_available():
+                        continue
+                elif blocked or len(units) >= self.config['max_jobs'] or \
+                        not self._resources_available(len(units), job):
+                    # New jobs and groups are started in order
+                    blocked = True
+                    continue
+                self._start(job)
+                if job['state'] == 'running':
+                    running.append(job)
+                    units.add(job['group'] or job['id'])
+
+    def _resources_available(self, num_running, job):
+        """ Checks if enough memory and cores are free to start another job or group. """
+        if job['cwd'] is None and time.time() - self._last_launch < LAUNCH_GAP:
+            return False
+        if not self._memory_available():
+            return False
+        # The first job always starts, further ones only if the cores are not saturated
+        return num_running == 0 or psutil.getloadavg()[0] < psutil.cpu_count()
+
+    def _memory_available(self):
+        mem = psutil.virtual_memory()
+        return mem.available * 100 / mem.total >= self.config['min_free_mem']
+
+    def _start(self, job):
+        proc = EvalneProc(pidfile=job['pidfile'])
+        try:
+            proc.start('{} -m evalne {}'.format(job['exec_path'], job['ini_path']), job['console'],
+                       job['cwd'] or self.eval_path, True)
+        except (OSError, ValueError):
+            self._finish(job, 'failed')
+            return
+        self._procs[job['id']] = proc
+        if job['cwd'] is None:
+            self._last_launch = time.time()
+        job['state'] = 'running'
+        job['started'] = time.time()
+        self._save(job)
+
+    def _check(self, job):
+        """ Marks a running job as finished if its process has exited. """
+        proc = self._procs.get(job['id'])
+        if proc is not None:
+            returncode = proc.poll()
+            if returncode is None:
+                return
+            registry.unregister(job['pidfile'])
+            del self._procs[job['id']]
+            job['returncode'] = returncode
+            self._finish(job, 'done' if returncode == 0 else 'failed')
+        elif registry.get(job['pidfile']) is None:
+            # Adopted job that has exited, the return code is unknown
+            self._finish(job, 'exited')
+
+    def _update_peak_rss(self, job):
+        """ Tracks the peak memory used by the process tree of a running job. The in-memory peak is updated on every
+        step and persisted with the job when it grows by `PEAK_RSS_STEP`, so adopted jobs keep their peak. """
+        rss = self._get_proc(job).tree_rss()
+        peak = self._peaks.get(job['id'], job['peak_rss'] or 0)
+        if rss > peak:
+            self._peaks[job['id']] = rss
+            if rss >= (job['peak_rss'] or 0) * PEAK_RSS_STEP:
+                job['peak_rss'] = rss
+                self._save(job)
+
+    def _get_proc(self, job):
+        proc = self._procs.get(job['id'])
+        if proc is None:
+            proc = EvalneProc(registry.get(job['pidfile']), job['pidfile'])
+        return proc
+
+    def _finish(self, job, state):
+        if job['id'] in self._peaks:
+            job['peak_rss'] = max(job['peak_rss'] or 0, self._peaks.pop(job['id']))
+        job['state'] = state
+        job['finished'] = time.time()
+        self._save(job)
+        if job['group'] is not None:
+            self._merge_group(job['group'])
+
+    def _merge_group(self, group):
+        """ Concatenates the logs and results of the finished jobs of a group into its run folder. While jobs are
+        pending or if any failed, a last log line is added so the run is not reported as finished. """
+        jobs = [job for job in self._jobs.values() if job['group'] == group]
+        logs, outputs = [], []
+        for job in jobs:
+            run_path = get_sub_run(job['cwd'])
+            if job['state'] in ('queued', 'running') or run_path is None:
+                continue
+            try:
+                with open(os.path.join(run_path, 'eval.log')) as f:
+                    logs.append(f.read())
+                with open(os.path.join(run_path, 'eval_output.txt')) as f:
+                    outputs.append('\n\n====== Sub-run {} ======'.format(os.path.basename(job['cwd'])) + f.read())
+            except FileNotFoundError:
+                pass
+
+        pending = [job['name'] for job in jobs if job['state'] in ('queued', 'running')]
+        failed = [job['name'] for job in jobs if job['state'] in ('failed', 'cancelled')]
+        now = datetime.datetime.now().strftime(LOG_TIME_FORMAT)
+        if len(pending):
+            logs.append('{} - INFO: Waiting for sub-runs: {}\n'.format(now, ', '.join(pending)))
+        elif len(failed):
+            logs.append('{} - ERROR: Failed sub-runs: {}\n'.format(now, ', '.join(failed)))
+
+        run_path = os.path.join(self.eval_path, group)
+        write_text(os.path.join(run_path, 'eval.log'), ''.join(log if log.endswith('\n') else log + '\n'
+                                                               for log in logs))
+        write_text(os.path.join(run_path, 'eval_output.txt'), ''.join(outputs))
+
+    def _save(self, job):
+        write_json(os.path.join(self.path, job['id'] + '.json'), job)
+
+    def _is_leader(self):
+        """ Returns True if this process is the one starting and monitoring jobs, trying to become it otherwise. """
+        if fcntl is None or self._lock_file is not None:
+            return True
+        f = open(os.path.join(self.path, 'scheduler.lock'), 'a')
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return False
+        # The lock is held as long as the file stays open, i.e. until this process exits
+        self._lock_file = f
+        return True
+
+    def _refresh(self):
+        """ Reloads the jobs folder if it was modified, e.g. by another worker process. """
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime != self._mtime:
+            self._mtime = mtime
+            self._load()
+
+    def _load(self):
+        """ Reads the scheduler config and jobs persisted in the jobs folder. """
+        try:
+            with open(os.path.join(self.path, 'scheduler.json')) as f:
+                self.config.update(json.load(f))
+        except (FileNotFoundError, ValueError):
+            pass
+        jobs = []
+        for fname in os.listdir(self.path):
+            if fname.endswith('.json') and fname != 'scheduler.json':
+                try:
+                    with open(os.path.join(self.path, fname)) as f:
+                        jobs.append(dict(JOB_DEFAULTS, **json.load(f)))
+                except (FileNotFoundError, ValueError):
+                    continue
+        self._jobs = OrderedDict((job['id'], job) for job in sorted(jobs, key=lambda job: job['submitted']))
+        if not self._is_leader():
+            return
+        # Groups are merged when their jobs finish, so only check the jobs once all of them are loaded
+        for job in list(self._jobs.values()):
+            if job['state'] == 'running' and job['id'] not in self._procs:
+                # Adopt the process if it is still alive
+                self._check(job)
+
+
+class Scheduler(object):
+    """ Background thread that periodically steps the job queues of all evaluation folders in use.
+
+    Parameters
+    ----------
+    interval : float
+        Time in seconds between two consecutive steps.
+    """
+
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self._queues = dict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def get_queue(self, eval_path):
+        """ Returns the job queue of an evaluation folder. The scheduler is started on first use. """
+        self.start()
+        with self._lock:
+            queue = self._queues.get(eval_path)
+            if queue is None:
+                queue = JobQueue(eval_path)
+                self._queues[eval_path] = queue
+            return queue
+
+    def queues(self):
+        """ Returns a list with the job queues of all evaluation folders in use. """
+        with self._lock:
+            return list(self._queues.values())
+
+    def start(self):
+        """ Starts the scheduler thread, if it is not already running. """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name='evalne-gui-scheduler', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """ Stops the scheduler thread. Running jobs are not affected. """
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            for queue in self.queues():
+                try:
+                    queue.step()
+                except (OSError, psutil.Error):
+                    pass
+            self._stop.wait(self.interval)
+
+
+# Shared scheduler instance
+scheduler = Scheduler()
+
+
+def get_sub_run(path):
+    """ Returns the latest EvalNE run folder created inside `path` or None if there is none. """
+    try:
+        runs = sorted(fname for fname in os.listdir(path)
+                      if '_eval_' in fname and os.path.isdir(os.path.join(path, fname)))
+    except FileNotFoundError:
+        return None
+    return os.path.join(path, runs[-1]) if len(runs) else None
+
+
+def get_queue(eval_path):
+    """ Returns the job queue of an evaluation folder. """
+    return scheduler.get_queue(eval_path)
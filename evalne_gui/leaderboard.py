@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+# Two-sided 95% quantiles of the Student t distribution for 1 to 30 degrees of freedom, the normal one is used above
+T_975 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+         2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+         2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+Z_975 = 1.96
+
+# Metrics for which lower values are better
+LOWER_IS_BETTER = ('fp', 'fn', 'fallout', 'miss', 'eval_time')
+
+
+def aggregate_scores(methods, networks, values):
+    """ Aggregates the scores of each (method, network) pair, given as three aligned sequences with one entry per score.
+
+    Returns
+    -------
+    method_vals : ndarray
+        The distinct methods, the rows of the aggregated arrays.
+    network_vals : ndarray
+        The distinct networks, the columns of the aggregated arrays.
+    stats : dict
+        A dict with the `count`, `mean`, `std` (sample standard deviation, NaN for single scores) and `ci` (half width
+        of the 95% confidence interval of the mean, NaN for single scores) of each pair as (methods x networks)
+        arrays. Pairs without scores have a count of 0 and NaN values.
+    """
+    # Only loaded when the leaderboard is shown, numpy slows down the GUI startup
+    import numpy as np
+    method_vals, m = np.unique(np.asarray(methods, dtype=str), return_inverse=True)
+    network_vals, n = np.unique(np.asarray(networks, dtype=str), return_inverse=True)
+    values = np.asarray(values, dtype=float)
+    shape = (len(method_vals), len(network_vals))
+    cell = m * shape[1] + n
+
+    count = np.bincount(cell, minlength=shape[0] * shape[1]).astype(float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.bincount(cell, weights=values, minlength=count.size) / count
+        # Squared deviations from the mean of each pair, more stable than the sum of squares
+        sq = np.bincount(cell, weights=(values - mean[cell]) ** 2, minlength=count.size)
+        std = np.sqrt(sq / (count - 1))
+        dof = np.maximum(count - 1, 1).astype(int)
+        t = np.where(dof <= len(T_975), np.array(T_975)[np.minimum(dof, len(T_975)) - 1], Z_975)
+        ci = t * std / np.sqrt(count)
+    std[count < 2] = np.nan
+    ci[count < 2] = np.nan
+    return method_vals, network_vals, {'count': count.reshape(shape).astype(int), 'mean': mean.reshape(shape),
+                                       'std': std.reshape(shape), 'ci': ci.reshape(shape)}
+
+
+def rank_methods(mean, lower_is_better=False):
+    """ Returns the rank of each method (rows) on each network (columns) by mean score, 1 being the best, and the
+    average rank of each method over the networks it was evaluated on. Tied methods share the average of their ranks
+    and missing scores are not ranked (NaN). """
+    import numpy as np
+    scores = mean if lower_is_better else -mean
+    missing = np.isnan(scores)
+    # Rank = number of better scores + (number of equal scores + 1) / 2, compared pairwise for all methods at once
+    better = np.sum(scores[None, :, :] < scores[:, None, :], axis=1)
+    equal = np.sum(scores[None, :, :] == scores[:, None, :], axis=1)
+    ranks = better + (equal + 1) / 2
+    ranks[missing] = np.nan
+    rated = (~missing).sum(axis=1)
+    avg_rank = np.full(len(ranks), np.nan)
+    avg_rank[rated > 0] = np.nansum(ranks, axis=1)[rated > 0] / rated[rated > 0]
+    return ranks, avg_rank
+
+
+def get_leaderboard(rows, metric):
+    """ Returns the leaderboard of a list of (run, sub_run, network, method, metric, repeat, value) score rows of a
+    single metric, see `ResultStore.query`. Every row is a sample: runs that report each experiment repeat contribute
+    one per repeat, the others their average over repeats.
+
+    Returns
+    -------
+    leaderboard : dict
+        A dict with the `methods` sorted by average rank (best first), the `networks`, the `count`, `mean`, `std` and
+        `ci` arrays of `aggregate_scores` and the `ranks` and `avg_rank` of `rank_methods`, all in the same order.
+    """
+    import numpy as np
+    if len(rows) == 0:
+        return None
+    methods, networks, stats = aggregate_scores([row[3] for row in rows], [row[2] for row in rows],
+                                                [row[6] for row in rows])
+    ranks, avg_rank = rank_methods(stats['mean'], metric in LOWER_IS_BETTER)
+    order = np.argsort(np.where(np.isnan(avg_rank), np.inf, avg_rank), kind='stable')
+    res = {name: values[order] for name, values in stats.items()}
+    res.update({'methods': methods[order].tolist(), 'networks': networks.tolist(), 'ranks': ranks[order],
+                'avg_rank': avg_rank[order]})
+    return res
+
+
+def format_score(mean, ci, count):
+    """ Returns a `mean ± ci (n)` description of the aggregated scores of a method on a network. """
+    import numpy as np
+    if count == 0:
+        return ''
+    if np.isnan(ci):
+        return '{:.4f} (n={})'.format(mean, count)
+    return '{:.4f} ± {:.4f} (n={})'.format(mean, ci, count)
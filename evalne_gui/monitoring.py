@@ -6,14 +6,15 @@
 
 import os
 import json
-import psutil
-import plotly.graph_objects as go
 
 from evalne_gui.app import app
 from dash.dependencies import Input, Output
-from dash import dcc, State, html
-from collections import deque
-from evalne_gui.utils import get_ui_proc, get_evalne_proc, read_file
+from dash import dcc, State, html, Patch, callback_context, no_update
+from dash.exceptions import PreventUpdate
+from datetime import datetime, timedelta
+from evalne_gui.utils import tail_file
+from evalne_gui.jobs import get_queue
+from evalne_gui.sampler import sampler
 from evalne_gui.init_values import *
 
 
@@ -21,14 +22,15 @@ from evalne_gui.init_values import *
 #      Plot variables
 # --------------------------
 
-X1 = deque(maxlen=20)
-X1.append(0)
-X2 = deque(maxlen=20)
-X2.append(0)
-Y = deque(maxlen=20)
-Y.append(0)
-Z = deque(maxlen=20)
-Z.append(0)
+# Time windows of resource usage history that can be displayed (in seconds)
+history_opts = [{'label': 'Last minute', 'value': 60},
+                {'label': 'Last 10 minutes', 'value': 600},
+                {'label': 'Last hour', 'value': 3600},
+                {'label': 'Last day', 'value': 24 * 3600},
+                {'label': 'Last week', 'value': 7 * 24 * 3600}]
+
+# Maximum number of bytes of the evaluation output kept in the browser
+SCROLLBACK = 256 * 1024
 
 
 def generate_table(tblid, data, cols=None, title=None):
@@ -71,13 +73,21 @@ monitoring_layout = html.Div([
     html.Hr(className='sectionHr'),
     html.Br(),
 
+    html.Div(
+        children=[
+            html.Label(['History:']),
+            dcc.Dropdown(id='history-window', options=history_opts, value=60, clearable=False, persistence=True),
+        ],
+        style={'width': '22%', 'margin-left': 'auto', 'margin-bottom': '10px'},
+    ),
+
     html.Div(
         children=[
             html.Div(
                 id='cpu-div',
                 className='plot-area',
                 children=[
-                    dcc.Graph(id='cpu-graph', animate=True),
+                    dcc.Graph(id='cpu-graph'),
                     html.Div(id='cpu-table'),
                 ],
                 style={'width': '48%', 'margin-right': '4%'}
@@ -87,7 +97,7 @@ monitoring_layout = html.Div([
                 id='mem-div',
                 className='plot-area',
                 children=[
-                    dcc.Graph(id='mem-graph', animate=True),
+                    dcc.Graph(id='mem-graph'),
                     html.Div(id='mem-table'),
                 ],
                 style={'width': '48%'}
@@ -126,6 +136,22 @@ monitoring_layout = html.Div([
         style={'display': 'flex'},
     ),
 
+    # --------------------------
+    #      Method Processes
+    # --------------------------
+    html.H3(children='EvalNE Methods', className='section-title'),
+    html.Hr(className='sectionHr'),
+    html.Br(),
+
+    html.Div(
+        id='methods-div',
+        className='plot-area',
+        children=[
+            html.Center(id='methods-current'),
+            html.Div(id='methods-table'),
+        ],
+    ),
+
     # --------------------------
     #     Evaluation Output
     # --------------------------
@@ -135,7 +161,7 @@ monitoring_layout = html.Div([
 
     html.Div(
         children=[
-            html.Pre(id='console-out', className='bash')
+            html.Pre(id='console-out', className='bash', children=[])
         ],
         style={'margin': '10px 30px 30px 30px'},
     ),
@@ -144,6 +170,8 @@ monitoring_layout = html.Div([
     #       Data storage
     # --------------------------
     dcc.Store(id='settings-data', storage_type='local'),
+    dcc.Store(id='console-state'),
+    dcc.Store(id='graph-state'),
 
 ])
 
@@ -153,61 +181,42 @@ monitoring_layout = html.Div([
 # --------------------------
 
 @app.callback(Output('cpu-graph', 'figure'),
-              Input('plot-update-interval', 'n_intervals'))
-def update_graph_live1(n):
-    """ Periodically updates the CPU usage graph. """
-
-    X1.append(X1[-1] + 1)
-    Y.append(psutil.cpu_percent())
-
-    fig = go.Figure()
-
-    fig.update_xaxes(title_text="", range=[min(X1), max(X1)], showticklabels=False)
-    fig.update_yaxes(title_text="", range=[0, 100])
-
-    fig.add_trace({
-        'x': list(X1),
-        'y': list(Y),
-        'name': 'CPU Usage',
-        'mode': 'lines',
-        'type': 'scatter',
-        'fill': 'tozeroy',
-        'line_color': 'limegreen'
-    })
-
-    fig.update_layout(title='CPU Usage (%)', showlegend=False, autosize=True, height=300,
-                      margin={'l': 10, 'r': 10, 'b': 10, 't': 50})
-
-    return fig
-
-
-@app.callback(Output('mem-graph', 'figure'),
-              Input('plot-update-interval', 'n_intervals'))
-def update_graph_live2(n):
-    """ Periodically updates the RAM usage graph. """
-
-    X2.append(X1[-1] + 1)
-    Z.append(psutil.virtual_memory()[2])
-
-    fig = go.Figure()
-
-    fig.update_xaxes(title_text="", range=[min(X2), max(X2)], showticklabels=False)
-    fig.update_yaxes(title_text="", range=[0, 100])
-
-    fig.add_trace({
-        'x': list(X2),
-        'y': list(Z),
-        'name': 'CPU Usage',
-        'mode': 'lines',
-        'type': 'scatter',
-        'fill': 'tozeroy',
-        'line_color': 'gold'
-    })
-
-    fig.update_layout(title='Memory Usage (%)', showlegend=False, autosize=True, height=300,
-                      margin={'l': 10, 'r': 10, 'b': 10, 't': 50})
-
-    return fig
+              Output('mem-graph', 'figure'),
+              Output('cpu-graph', 'extendData'),
+              Output('mem-graph', 'extendData'),
+              Output('graph-state', 'data'),
+              Input('plot-update-interval', 'n_intervals'),
+              Input('history-window', 'value'),
+              State('graph-state', 'data'))
+def update_graphs_live(n, window, state):
+    """ Periodically updates the CPU and RAM usage graphs. The figures are only sent when the history window changes,
+    on each tick only the new samples are sent and the browser drops the ones that fall out of the window. """
+
+    ctx = callback_context
+    start = sampler.latest()['time'] - window
+    resolution = sampler.series.resolution(start)
+    button_id = ctx.triggered[0]['prop_id'].split('.')[0] if ctx.triggered else None
+
+    if state is None or button_id == 'history-window' or state['window'] != window or \
+            state['resolution'] != resolution:
+        # Redraw the whole figures
+        _, times, values = sampler.series.window(start)
+        state = {'window': window, 'resolution': resolution, 'last': times[-1] if len(times) else start}
+        return [get_usage_figure('CPU Usage (%)', times, values['cpu_percent'], 'limegreen'),
+                get_usage_figure('Memory Usage (%)', times, values['mem_percent'], 'gold'),
+                no_update, no_update, state]
+
+    # Only send the samples taken since the last update
+    times, values = sampler.series.since(resolution, state['last'])
+    if len(times) == 0:
+        raise PreventUpdate
+    state['last'] = times[-1]
+    max_points = min(int(window // resolution), sampler.series.maxlen(resolution))
+    x = [datetime.fromtimestamp(t) for t in times]
+    return [no_update, no_update,
+            [{'x': [x], 'y': [values['cpu_percent']]}, [0], max_points],
+            [{'x': [x], 'y': [values['mem_percent']]}, [0], max_points],
+            state]
 
 
 @app.callback(
@@ -217,14 +226,15 @@ def update_graph_live2(n):
 def update_tables(n):
     """ Periodically updates the info shown in the tables under each plot. """
 
-    mem = psutil.virtual_memory()
-    memlst = [mem.used / (1024 * 1024 * 1024), mem.available / (1024 * 1024 * 1024), mem.total / (1024 * 1024 * 1024)]
+    snapshot = sampler.latest()
+    memlst = [snapshot['mem_used'] / (1024 * 1024 * 1024), snapshot['mem_available'] / (1024 * 1024 * 1024),
+              snapshot['mem_total'] / (1024 * 1024 * 1024)]
 
     res = [
         generate_table('cpu-info',
                        dict(list(zip(
                            ['Load average (1 min): ', 'Load average (5 min): ', 'Load average (15 min): '],
-                           ['{:.2f} %'.format(x / psutil.cpu_count() * 100) for x in psutil.getloadavg()]))),
+                           ['{:.2f} %'.format(x / snapshot['cpu_count'] * 100) for x in snapshot['load_avg']]))),
                        None),
         generate_table('mem-info',
                        dict(list(zip(
@@ -238,13 +248,27 @@ def update_tables(n):
 @app.callback(
     Output('proc-table', 'children'),
     Output('proc2-table', 'children'),
-    Input('plot-update-interval', 'n_intervals'))
-def update_tables(n):
+    Input('plot-update-interval', 'n_intervals'),
+    State('settings-data', 'data'))
+def update_proc_tables(n, settings_data):
     """ Periodically updates the EvalNE-UI and EvalNE proc info tables. """
 
+    # Make sure the jobs of the current evaluation folder are tracked (e.g. after a GUI restart)
+    if settings_data is None:
+        settings_data = [val for val in init_settings.values()]
+    else:
+        settings_data = json.loads(settings_data)
+    if settings_data[1] == '':
+        eval_path = os.getcwd()
+    else:
+        eval_path = settings_data[1]
+    if os.path.isdir(eval_path):
+        get_queue(eval_path)
+
     # Get process info for the tables
-    ui_proc_info = get_ui_proc().info()
-    evalne_proc_info = get_evalne_proc().info()
+    snapshot = sampler.latest()
+    ui_proc_info = snapshot['ui_proc']
+    evalne_proc_info = snapshot['evalne_proc']
 
     return [
         generate_table('proc-info', ui_proc_info, None, 'EvalNE-UI Process Info'),
@@ -252,12 +276,48 @@ def update_tables(n):
     ]
 
 
+@app.callback(
+    Output('methods-current', 'children'),
+    Output('methods-table', 'children'),
+    Input('plot-update-interval', 'n_intervals'))
+def update_methods_table(n):
+    """ Periodically updates the resources used by the EvalNE process tree per method and the method running. """
+
+    usage = sampler.latest()['evalne_methods']
+    if len(usage['methods']) == 0:
+        return html.H4('No evaluation running'), []
+    if usage['current'] is None:
+        current = 'No method running, EvalNE is preprocessing the networks, running baselines or computing scores'
+    else:
+        current = 'Running method {} for {}'.format(usage['current'][0],
+                                                     str(timedelta(seconds=round(usage['current'][1]))))
+
+    cols = ['Method', 'Processes', 'CPU', 'Memory', 'Threads', 'Read', 'Written']
+    rows = [[m['name'], m['procs'], '{:.1f} %'.format(m['cpu_percent']), format_gb(m['rss']), m['threads'],
+             format_gb(m['read_bytes']), format_gb(m['write_bytes'])] for m in usage['methods']]
+    totals = ['Total', sum(m['procs'] for m in usage['methods']),
+              '{:.1f} %'.format(sum(m['cpu_percent'] for m in usage['methods'])),
+              format_gb(sum(m['rss'] for m in usage['methods'])), sum(m['threads'] for m in usage['methods']),
+              format_gb(sum(m['read_bytes'] for m in usage['methods'])),
+              format_gb(sum(m['write_bytes'] for m in usage['methods']))]
+    table = html.Table(
+        id='methods-info',
+        className='plot-tables',
+        children=[html.Tr([html.Th(col) for col in cols])] +
+                 [html.Tr([html.Td(v) for v in row]) for row in rows + [totals]],
+    )
+    return html.H4(current), table
+
+
 @app.callback(
     Output('console-out', 'children'),
+    Output('console-state', 'data'),
     Input('plot-update-interval', 'n_intervals'),
-    State('settings-data', 'data'))
-def update_output(n, settings_data):
-    """ Periodically updates the evaluation output section by reading a `console.out` file. """
+    State('settings-data', 'data'),
+    State('console-state', 'data'))
+def update_output(n, settings_data, state):
+    """ Periodically updates the evaluation output section by following the console output of the latest job. Only the lines
+    appended since the last update are sent to the browser, which keeps at most `SCROLLBACK` bytes. """
 
     if settings_data is None:
         settings_data = [val for val in init_settings.values()]
@@ -267,5 +327,67 @@ def update_output(n, settings_data):
         eval_path = os.getcwd()
     else:
         eval_path = settings_data[1]
-    text = read_file(eval_path, 'console.out', console=True)
-    return text.replace('\n', '\nfoo@bar:~$ ')
+    fpath = os.path.join(eval_path, 'console.out')
+    if os.path.isdir(eval_path):
+        fpath = get_queue(eval_path).latest_console() or fpath
+
+    if state is None or state['path'] != fpath:
+        state = {'path': fpath, 'offset': None, 'inode': None, 'chunks': []}
+    res = tail_file(fpath, state['offset'], state['inode'], SCROLLBACK)
+
+    if res is None:
+        if state['inode'] == -1:
+            raise PreventUpdate
+        state.update({'offset': None, 'inode': -1, 'chunks': []})
+        return ['Output not found! Start an evaluation to monitor its output...'], state
+
+    text, state['offset'], state['inode'], reset = res
+    text = text.replace('\n', '\nfoo@bar:~$ ')
+    if reset:
+        state['chunks'] = [len(text)]
+        return [text], state
+    if text == '':
+        raise PreventUpdate
+
+    # Append the new output and drop the oldest one to keep the scrollback bounded
+    patch = Patch()
+    patch.append(text)
+    state['chunks'].append(len(text))
+    while len(state['chunks']) > 1 and sum(state['chunks']) > SCROLLBACK:
+        del patch[0]
+        state['chunks'].pop(0)
+    return patch, state
+
+
+# --------------------------
+#      Other Functions
+# --------------------------
+
+def format_gb(num):
+    return '{:.2f} GB'.format(num / (1024 * 1024 * 1024))
+
+
+def get_usage_figure(title, times, values, color):
+    """ Returns a filled line plot of a resource usage percentage over time. """
+    # Plotly is only needed to draw the figures, importing it lazily speeds up the GUI startup
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+
+    fig.update_xaxes(title_text="", showticklabels=True)
+    fig.update_yaxes(title_text="", range=[0, 100])
+
+    fig.add_trace({
+        'x': [datetime.fromtimestamp(t) for t in times],
+        'y': values,
+        'name': title,
+        'mode': 'lines',
+        'type': 'scatter',
+        'fill': 'tozeroy',
+        'line_color': color
+    })
+
+    fig.update_layout(title=title, showlegend=False, autosize=True, height=300,
+                      margin={'l': 10, 'r': 10, 'b': 10, 't': 50})
+
+    return fig
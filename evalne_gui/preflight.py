@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import time
+import operator
+import threading
+from collections import OrderedDict
+
+
+# Maximum time spent reading each file, larger files are only partially checked
+PREFLIGHT_TIME_LIMIT = 5
+
+# Size of the blocks in which files are read
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Number of parse errors reported per file, the rest are only counted
+MAX_ERRORS = 5
+
+# Number of file reports kept in memory, keyed by path, size, modification time and parsing options
+CACHE_SIZE = 64
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def preflight(conf_dict, eval_path, time_limit=PREFLIGHT_TIME_LIMIT):
+    """ Checks the networks of a dashboard config before launching EvalNE. Each edge list, and for node
+    classification each label file, is read with the separator and comment character given for its network the same
+    way EvalNE reads it. Relative paths are resolved from the evaluation folder.
+
+    Returns
+    -------
+    errors : list
+        A list of strings describing the problems that would make the evaluation fail.
+    reports : list
+        A list with one (name, edgelist report, labels report or None) tuple per network, see `check_edgelist`.
+    """
+    errors = []
+    names = conf_dict['ib-nwnames'].split()
+    paths = [path.strip() for path in conf_dict['network-paths'].split('\n') if path.strip() != '']
+    labels = [path.strip() for path in conf_dict['network-nodelabels'].split('\n') if path.strip() != '']
+    seps = parse_separators(conf_dict['ib-separator'])
+    comments = parse_separators(conf_dict['ib-comment'])
+    if len(names) == 0:
+        errors.append('No networks given!')
+    for option, values in (('INPATHS', paths), ('SEPARATORS', seps), ('COMMENTS', comments)):
+        if len(values) != len(names):
+            errors.append('{} networks named but {} {} given!'.format(len(names), len(values), option))
+    if '' in seps + comments:
+        errors.append('Empty separators and comment characters are not allowed, use `\\s` for blanks!')
+    if conf_dict['task-dropdown'] == 'nc' and len(labels) != len(names):
+        errors.append('{} networks named but {} LABELPATHS given!'.format(len(names), len(labels)))
+    if 'save' in (conf_dict['nw-prep-checklist2'] or []) and conf_dict['input-prep-delim'].strip('\'') == '':
+        errors.append('A DELIMITER is required to save the preprocessed networks!')
+    if len(errors):
+        return errors, []
+
+    reports = []
+    weight_type = int if conf_dict['task-dropdown'] == 'sp' else float
+    for i, name in enumerate(names):
+        report = check_edgelist(os.path.join(eval_path, paths[i]), seps[i], comments[i], weight_type, time_limit)
+        errors.extend('{}: {}'.format(name, err) for err in report['errors'])
+        label_report = None
+        if conf_dict['task-dropdown'] == 'nc':
+            label_report = check_labels(os.path.join(eval_path, labels[i]), seps[i], comments[i], time_limit)
+            errors.extend('{} labels: {}'.format(name, err) for err in label_report['errors'])
+        reports.append((name, report, label_report))
+    return errors, reports
+
+
+def check_edgelist(path, delimiter=',', comments='#', weight_type=float, time_limit=PREFLIGHT_TIME_LIMIT):
+    """ Reads an edge list like `networkx.read_edgelist` does for EvalNE: lines with fewer than two fields are
+    skipped, node ids must be integers and an optional third column holds the edge weight. Files are streamed in
+    chunks and reading stops after `time_limit` seconds, so only part of very large files is checked.
+
+    Returns
+    -------
+    report : dict
+        A dict with the file `size`, the number of `nodes`, `edges` (edge lines), `self_loops` and `skipped` lines,
+        the `fraction` of the file checked and a list of `errors`.
+    """
+    key = ('edgelist', delimiter, comments, weight_type.__name__)
+    report = get_cached(path, key)
+    if report is not None:
+        return report
+    report = new_report(path)
+    nodes = set()
+    num_errors = 0
+    for lineno, lines in read_chunks(path, report, time_limit):
+        if comments and any(comments in line for line in lines):
+            lines = [line[:line.find(comments)] if comments in line else line for line in lines]
+        # Count the separators instead of splitting each line, creating a list per line makes parsing much slower
+        lines = [line.strip() for line in lines if line]
+        counts = [line.count(delimiter) for line in lines]
+        if max(counts, default=0) == 0:
+            # Happens for every line when the separator is wrong, no need to check them one by one
+            report['skipped'] += len(lines)
+            continue
+        try:
+            # Fast path for chunks without errors where all lines have the same number of columns
+            ncols = counts[0] + 1
+            if counts.count(counts[0]) != len(counts) or ncols not in (2, 3):
+                raise ValueError
+            fields = delimiter.join(lines).split(delimiter)
+            src = list(map(int, fields[0::ncols]))
+            dst = list(map(int, fields[1::ncols]))
+            if ncols == 3:
+                list(map(weight_type, fields[2::3]))
+        except ValueError:
+            num_errors = check_edge_lines(report, nodes, num_errors, lineno, lines, delimiter, weight_type)
+        else:
+            report['edges'] += len(lines)
+            report['self_loops'] += sum(map(operator.eq, src, dst))
+            nodes.update(src)
+            nodes.update(dst)
+    report['nodes'] = len(nodes)
+    finish_report(report, num_errors)
+    if report['exists'] and report['edges'] == 0 and num_errors == 0:
+        report['errors'].append('the network is empty, the separator `{}` might be incorrect'.format(delimiter))
+    set_cached(path, key, report)
+    return report
+
+
+def check_labels(path, delimiter=',', comments='#', time_limit=PREFLIGHT_TIME_LIMIT):
+    """ Reads a node label file like `numpy.loadtxt` does for EvalNE: every line must hold a node id and a label,
+    both numbers. Returns a report like `check_edgelist` with the number of `labels` instead of nodes and edges. """
+    key = ('labels', delimiter, comments)
+    report = get_cached(path, key)
+    if report is not None:
+        return report
+    report = new_report(path)
+    report['labels'] = 0
+    num_errors = 0
+    for lineno, lines in read_chunks(path, report, time_limit):
+        for i, line in enumerate(lines):
+            if comments:
+                line = line.split(comments, 1)[0]
+            line = line.strip()
+            if line == '':
+                continue
+            fields = line.split(delimiter)
+            if len(fields) != 2:
+                num_errors = add_error(report, num_errors, lineno + i, 'found {} columns, expected a node id and a '
+                                                                       'label'.format(len(fields)))
+                continue
+            try:
+                float(fields[0]), float(fields[1])
+            except ValueError:
+                num_errors = add_error(report, num_errors, lineno + i, 'values `{}` are not numbers'.format(line))
+                continue
+            report['labels'] += 1
+    finish_report(report, num_errors)
+    if report['exists'] and report['labels'] == 0 and num_errors == 0:
+        report['errors'].append('no labels found')
+    set_cached(path, key, report)
+    return report
+
+
+def check_edge_lines(report, nodes, num_errors, lineno, lines, delimiter, weight_type):
+    """ Checks the edge list lines one by one, used for the chunks that have errors or mixed numbers of columns.
+    Comments must be removed already. Returns the updated number of errors. """
+    for i, line in enumerate(lines):
+        if not line:
+            continue
+        fields = line.strip().split(delimiter)
+        if len(fields) < 2:
+            report['skipped'] += 1
+            continue
+        try:
+            src, dst = int(fields[0]), int(fields[1])
+        except ValueError:
+            num_errors = add_error(report, num_errors, lineno + i, 'node ids `{}` and `{}` are not integers'
+                                   .format(fields[0], fields[1]))
+            continue
+        if len(fields) > 3:
+            num_errors = add_error(report, num_errors, lineno + i, 'found {} columns, expected 2 or 3'
+                                   .format(len(fields)))
+            continue
+        if len(fields) == 3:
+            try:
+                weight_type(fields[2])
+            except ValueError:
+                num_errors = add_error(report, num_errors, lineno + i, 'weight `{}` is not of type {}'
+                                       .format(fields[2], weight_type.__name__))
+                continue
+        report['edges'] += 1
+        if src == dst:
+            report['self_loops'] += 1
+        nodes.add(src)
+        nodes.add(dst)
+    return num_errors
+
+
+def read_chunks(path, report, time_limit):
+    """ Yields the lines of a text file in chunks of about `CHUNK_SIZE` bytes, as (number of the first line, list of
+    lines) pairs, until the end of the file or the time limit is reached. The fraction of the file read is kept up to
+    date in the report. """
+    if not os.path.isfile(path):
+        report['exists'] = False
+        return
+    report['size'] = os.path.getsize(path)
+    start = time.time()
+    lineno = 1
+    read = 0
+    rest = b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            read += len(chunk)
+            lines = (rest + chunk).split(b'\n')
+            rest = lines.pop()
+            lines = b'\n'.join(lines).decode('utf-8', errors='replace').split('\n')
+            yield lineno, lines
+            lineno += len(lines)
+            report['fraction'] = read / report['size']
+            if time.time() - start > time_limit:
+                return
+    if rest:
+        yield lineno, [rest.decode('utf-8', errors='replace')]
+    report['fraction'] = 1.0
+
+
+def new_report(path):
+    return {'path': path, 'exists': True, 'size': 0, 'fraction': 0.0, 'nodes': 0, 'edges': 0, 'self_loops': 0,
+            'skipped': 0, 'errors': []}
+
+
+def add_error(report, num_errors, lineno, msg):
+    """ Records a parse error, only the first `MAX_ERRORS` are kept. Returns the updated number of errors. """
+    if num_errors < MAX_ERRORS:
+        report['errors'].append('line {}: {}'.format(lineno, msg))
+    return num_errors + 1
+
+
+def finish_report(report, num_errors):
+    if not report['exists']:
+        report['errors'].append('file `{}` not found'.format(report['path']))
+    elif num_errors > MAX_ERRORS:
+        report['errors'].append('{} more lines with errors'.format(num_errors - MAX_ERRORS))
+
+
+def format_report(name, report, label_report=None):
+    """ Returns a one line summary of the checks of a network, e.g. `BlogCatalog: 10,312 nodes, 333,983 edges`. """
+    res = '{}: {:,} nodes, {:,} edges'.format(name, report['nodes'], report['edges'])
+    if report['self_loops']:
+        res += ', {:,} self-loops'.format(report['self_loops'])
+    if report['skipped']:
+        res += ', {:,} lines skipped'.format(report['skipped'])
+    if label_report is not None:
+        res += ', {:,} labels'.format(label_report['labels'])
+    if report['fraction'] < 1:
+        res += ' (first {:.0%} of the file checked)'.format(report['fraction'])
+    return res
+
+
+def parse_separators(text):
+    """ Parses a list of separators or comment characters as EvalNE does, e.g. `',' '\\t'` gives `[',', '\\t']`. """
+    res = []
+    for sep in text.split():
+        sep = sep.strip('\'')
+        res.append({'\\t': '\t', '\\s': ' ', '\\n': '\n'}.get(sep, sep))
+    return res
+
+
+def get_cached(path, key):
+    """ Returns the cached report for a file if it did not change since it was checked, or None otherwise. """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    with _cache_lock:
+        entry = _cache.get((path,) + key)
+        if entry is None or entry[0] != (st.st_size, st.st_mtime_ns):
+            return None
+        _cache.move_to_end((path,) + key)
+        return entry[1]
+
+
+def set_cached(path, key, report):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    with _cache_lock:
+        _cache[(path,) + key] = ((st.st_size, st.st_mtime_ns), report)
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
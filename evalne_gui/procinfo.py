@@ -5,15 +5,140 @@
 # Date: 28/04/2022
 
 import os
+import json
 import shlex
 import psutil
-from subprocess import Popen
+import threading
+from subprocess import STDOUT
+
+
+class ProcRegistry(object):
+    """ Keeps track of the processes launched by the GUI without having to scan all processes in the system.
+
+    Each process is identified by a pidfile which stores its PID and creation time. The handles are kept in memory and
+    the pidfiles allow tracked processes to be recovered after a GUI restart. Before being returned, a process is
+    always revalidated by PID and creation time, so PIDs reused by the OS are never mistaken for tracked processes.
+    """
+
+    def __init__(self):
+        self._procs = dict()
+        self._lock = threading.Lock()
+
+    def register(self, pidfile, proc):
+        """ Starts tracking `proc` and persists its PID and creation time to `pidfile`. """
+        data = {'pid': proc.pid, 'create_time': proc.create_time(), 'cmd': proc.cmdline()}
+        tmp = pidfile + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, pidfile)
+        with self._lock:
+            self._procs[pidfile] = proc
+
+    def unregister(self, pidfile):
+        """ Stops tracking the process associated with `pidfile` and removes the pidfile. """
+        with self._lock:
+            self._procs.pop(pidfile, None)
+        try:
+            os.remove(pidfile)
+        except FileNotFoundError:
+            pass
+
+    def get(self, pidfile):
+        """ Returns the live process associated with `pidfile` or None. The pidfile is read only if the process is
+        not already tracked in memory, e.g. after a GUI restart. """
+        with self._lock:
+            proc = self._procs.get(pidfile)
+        if proc is None:
+            proc = self._load(pidfile)
+        if proc is not None and not self._alive(proc):
+            self.unregister(pidfile)
+            proc = None
+        return proc
+
+    def latest(self, folder=None):
+        """ Returns the most recently started live process among the tracked ones or None. If a folder is provided,
+        only pidfiles in that folder are considered. Processes that have exited are no longer tracked, so their
+        pidfiles are not read again. """
+        with self._lock:
+            pidfiles = [pidfile for pidfile in self._procs.keys()
+                        if folder is None or os.path.dirname(pidfile) == folder]
+        procs = [proc for proc in map(self.get, pidfiles) if proc is not None]
+        if len(procs) == 0:
+            return None
+        return max(procs, key=lambda proc: proc.create_time())
+
+    def _load(self, pidfile):
+        """ Reads a pidfile and returns the corresponding process if it is still the same one that was registered. """
+        try:
+            with open(pidfile) as f:
+                data = json.load(f)
+            proc = psutil.Process(data['pid'])
+            if abs(proc.create_time() - data['create_time']) > 0.01:
+                # The PID has been reused by another process
+                raise psutil.NoSuchProcess(data['pid'])
+        except FileNotFoundError:
+            return None
+        except (psutil.Error, ValueError, KeyError):
+            self.unregister(pidfile)
+            return None
+        with self._lock:
+            self._procs[pidfile] = proc
+        return proc
+
+    @staticmethod
+    def _alive(proc):
+        """ Checks if a process is still running. Processes started by the GUI are reaped once they exit. """
+        try:
+            if isinstance(proc, psutil.Popen) and proc.poll() is not None:
+                return False
+            return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
+        except psutil.Error:
+            return False
+
+
+# Shared registry of the processes started by the GUI
+registry = ProcRegistry()
+
+
+def sample_tree(proc):
+    """ Returns the resource usage of a process and all its children, one dict per process with its `pid`, `ppid`,
+    `cmdline`, `create_time`, resident memory `rss`, `cpu_time` (user and system, including reaped children),
+    `read_bytes`, `write_bytes`, `threads` and `open_files`. Processes that exit while being inspected are skipped. """
+    try:
+        procs = [proc] + proc.children(recursive=True)
+    except psutil.Error:
+        return []
+    res = []
+    for p in procs:
+        try:
+            with p.oneshot():
+                cpu = p.cpu_times()
+                try:
+                    io = p.io_counters()
+                except (AttributeError, psutil.AccessDenied):
+                    # Not available on macOS
+                    io = None
+                res.append({'pid': p.pid,
+                            'ppid': p.ppid(),
+                            'cmdline': p.cmdline(),
+                            'create_time': p.create_time(),
+                            'rss': p.memory_info().rss,
+                            'cpu_time': cpu.user + cpu.system + getattr(cpu, 'children_user', 0) +
+                            getattr(cpu, 'children_system', 0),
+                            'read_bytes': io.read_bytes if io else 0,
+                            'write_bytes': io.write_bytes if io else 0,
+                            'threads': p.num_threads(),
+                            'open_files': p.num_fds() if hasattr(p, 'num_fds') else p.num_handles()})
+        except psutil.Error:
+            continue
+    return res
 
 
 class EvalneProc(object):
 
-    def __init__(self, proc=None):
+    def __init__(self, proc=None, pidfile=None):
         self._proc = proc
+        self._pidfile = pidfile
 
     def start(self, cmd, console_out, cwd=None, verbose=True):
         """ Starts a new process, if one is not already running, to execute the cmd command.
@@ -38,25 +163,41 @@ class EvalneProc(object):
         Done
 
         """
-        if self.running:
+        if not self.running():
             if cwd is None:
                 cwd = os.getcwd()
             if verbose:
                 sto = open(console_out, 'w')
-                ste = open(console_out, 'w')
             else:
-                devnull = open(os.devnull, 'w')
-                sto = devnull
-                ste = devnull
+                sto = open(os.devnull, 'w')
 
-            self._proc = Popen(shlex.split(cmd), stdout=sto, stderr=ste, cwd=cwd)
+            self._proc = psutil.Popen(shlex.split(cmd), stdout=sto, stderr=STDOUT, cwd=cwd)
+            sto.close()
+            if self._pidfile is not None:
+                registry.register(self._pidfile, self._proc)
 
     def stop(self):
-        """ Stops the process, if it is currently running. """
-        if self.running:
-            self._proc.kill()
+        """ Stops the process and all its children, if it is currently running. """
+        if self.running():
+            try:
+                children = self._proc.children(recursive=True)
+            except psutil.Error:
+                children = []
+            # Kill the parent first, so it does not start new children while they are being killed
+            for proc in [self._proc] + children:
+                try:
+                    proc.kill()
+                except psutil.Error:
+                    pass
+            psutil.wait_procs([self._proc] + children, timeout=5)
+            if self._pidfile is not None:
+                registry.unregister(self._pidfile)
             self._proc = None
 
+    def poll(self):
+        """ Returns the exit code of a process launched with `start` or None if it is still running. """
+        return self._proc.poll()
+
     def info(self):
         """ Returns a summary of the main process stats as a dict. """
         pinfo = {
@@ -71,5 +212,13 @@ class EvalneProc(object):
         }
         return pinfo
 
+    def tree_rss(self):
+        """ Returns the resident memory in bytes of the process and all its children, or 0 if it is not running. """
+        return sum(sample['rss'] for sample in self.sample_tree())
+
+    def sample_tree(self):
+        """ Returns the resource usage of the process and all its children, see `sample_tree`. """
+        return sample_tree(self._proc) if self._proc else []
+
     def running(self):
         return True if self._proc else False
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import time
+import shlex
+from evalne_gui.config import EvalConfig
+
+
+# Group of the EvalNE process itself, which also runs the baselines and computes the scores
+EVALNE_GROUP = 'EvalNE'
+
+# Group of the child processes that do not match any method command
+OTHER_GROUP = 'Other'
+
+
+class TreeMonitor(object):
+    """ Aggregates the resource usage of an EvalNE process tree per method.
+
+    EvalNE runs each method as a child process with the method command of the config and its placeholders (e.g.
+    `{inputgraph}`) filled in. Every child of the EvalNE process is matched to the method whose command has the most
+    literal arguments in common with it, and its own children are counted for the same method. CPU usage is computed
+    from the CPU time consumed by each process between two consecutive updates.
+    """
+
+    def __init__(self):
+        self._cpu_times = dict()
+        self._methods = dict()
+
+    def update(self, tree, cwd=None):
+        """ Returns the usage of a process tree aggregated per method.
+
+        Parameters
+        ----------
+        tree : list
+            The usage of each process in the tree, with the EvalNE process first, see `procinfo.sample_tree`.
+        cwd : string
+            The working directory of the EvalNE process, used to find its config file.
+
+        Returns
+        -------
+        usage : dict
+            A dict with a list of `methods`, each a dict with the `name`, number of `procs`, `cpu_percent`, `rss`,
+            `threads`, `read_bytes` and `write_bytes` of a method, and the `current` method as a (name, seconds
+            running) tuple or None if no method is running.
+        """
+        now = time.time()
+        if len(tree) == 0:
+            self._cpu_times = dict()
+            return {'methods': [], 'current': None}
+        root = tree[0]
+        methods = self._get_methods(root['cmdline'], cwd)
+        procs = {proc['pid']: proc for proc in tree}
+
+        groups = dict()
+        current = None
+        cpu_times = dict()
+        for proc in tree:
+            # Find the child of the EvalNE process this process descends from
+            child = proc
+            while child['pid'] != root['pid'] and child['ppid'] != root['pid'] and child['ppid'] in procs:
+                child = procs[child['ppid']]
+            if proc['pid'] == root['pid']:
+                name = EVALNE_GROUP
+            else:
+                name = match_method(child['cmdline'], methods)
+                if name != OTHER_GROUP and proc is child and (current is None or child['create_time'] > current[1]):
+                    current = (name, child['create_time'])
+
+            # CPU used since the last update, or since the process started if it is new
+            key = (proc['pid'], proc['create_time'])
+            last_time, last_cpu = self._cpu_times.get(key, (proc['create_time'], 0.0))
+            cpu_times[key] = (now, proc['cpu_time'])
+            cpu_percent = (proc['cpu_time'] - last_cpu) * 100 / max(now - last_time, 1e-3)
+
+            group = groups.setdefault(name, {'name': name, 'procs': 0, 'cpu_percent': 0.0, 'rss': 0, 'threads': 0,
+                                             'read_bytes': 0, 'write_bytes': 0})
+            group['procs'] += 1
+            group['cpu_percent'] += max(cpu_percent, 0.0)
+            for field in ('rss', 'threads', 'read_bytes', 'write_bytes'):
+                group[field] += proc[field]
+        self._cpu_times = cpu_times
+
+        return {'methods': sorted(groups.values(), key=lambda group: group['rss'], reverse=True),
+                'current': None if current is None else (current[0], now - current[1])}
+
+    def _get_methods(self, cmdline, cwd):
+        """ Returns the (name, literal arguments) of the methods in the config file of an EvalNE command line. The
+        config is only parsed again if it changes. """
+        if len(cmdline) == 0:
+            return []
+        path = cmdline[-1] if cwd is None else os.path.join(cwd, cmdline[-1])
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+        cached = self._methods.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(path) as f:
+                config = EvalConfig.from_ini(f.read())
+        except (OSError, ValueError):
+            methods = []
+        else:
+            methods = [(method.name, get_literal_args(method.cmd)) for method in config.methods if not method.is_empty]
+        self._methods = {path: (mtime, methods)}
+        return methods
+
+
+def get_literal_args(cmd):
+    """ Returns the arguments of a method command that do not contain placeholders, the executable as a file name. """
+    try:
+        args = shlex.split(cmd)
+    except ValueError:
+        args = cmd.split()
+    args = [arg for arg in args if '{' not in arg]
+    if len(args):
+        args[0] = os.path.basename(args[0])
+    return args
+
+
+def match_method(cmdline, methods):
+    """ Returns the name of the method whose command matches a command line best, i.e. all its literal arguments are
+    in the command line and it has the most of them, or `OTHER_GROUP` if none matches. """
+    args = set(cmdline)
+    if len(cmdline):
+        args.add(os.path.basename(cmdline[0]))
+    best, best_len = OTHER_GROUP, 0
+    for name, literals in methods:
+        if len(literals) > best_len and all(arg in args for arg in literals):
+            best, best_len = name, len(literals)
+    return best
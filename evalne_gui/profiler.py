@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import re
+import glob
+import json
+import time
+import logging
+import zipfile
+import datetime
+import threading
+from evalne_gui.utils import get_state_dir, write_json
+from evalne_gui.catalog import catalog
+from evalne_gui.jobs import scheduler, get_sub_run, get_queue
+
+
+logger = logging.getLogger(__name__)
+
+
+# Name of the resource profile written in the folder of each run
+PROFILE_FILE = 'resource_profile.npz'
+
+# Columns of a resource profile, all summed over the process tree of the evaluation
+COLUMNS = (('time', 'float64'),          # sampling time (seconds since epoch)
+           ('rss', 'int64'),             # resident memory (bytes)
+           ('cpu_time', 'float64'),      # user + system CPU time (seconds, cumulative)
+           ('read_bytes', 'int64'),      # bytes read by the live processes (cumulative)
+           ('write_bytes', 'int64'),     # bytes written by the live processes (cumulative)
+           ('threads', 'int32'),
+           ('open_files', 'int32'),
+           ('procs', 'int32'))
+
+# Number of samples after which a profile is written to disk while the job runs
+FLUSH_EVERY = 30
+
+# Seconds after the last log line of a run during which its profiles may still be written
+PROFILE_GRACE = 60
+
+# Start time EvalNE puts in the name of the folder of a run, without a year
+RUN_STAMP = re.compile(r'_eval_(\d{4}_\d{4})$')
+
+
+class ProfileRecorder(object):
+    """ Background thread that records the resource usage of every running evaluation for its whole lifetime.
+
+    The process tree of each job is sampled, so the method commands EvalNE shells out to are included. The samples
+    are kept in memory and periodically written as a compressed columnar file, see `COLUMNS`, into the run folder
+    created by EvalNE. Only the process that starts and monitors the jobs of a folder records their profiles.
+
+    Parameters
+    ----------
+    interval : float
+        Time in seconds between two consecutive samples. Profiles are not recorded if 0.
+    flush_every : int
+        Number of samples after which the profile of a running job is written to disk.
+    """
+
+    def __init__(self, interval=1.0, flush_every=FLUSH_EVERY):
+        self.interval = interval
+        self.flush_every = flush_every
+        self._profiles = dict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """ Starts the recording thread, if it is not already running and recording is enabled. """
+        with self._lock:
+            if self.interval > 0 and (self._thread is None or not self._thread.is_alive()):
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name='evalne-gui-profiler', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """ Stops the recording thread. """
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            start = time.time()
+            try:
+                self._step()
+            except Exception:
+                # Keep recording, an unexpected error must not stop the thread for the rest of the process
+                logger.exception('Error recording resource profiles')
+            self._stop.wait(max(0.0, self.interval - (time.time() - start)))
+
+    def _step(self):
+        """ Takes a sample of each running job and writes the profiles of the jobs that have finished. """
+        running = set()
+        for queue in scheduler.queues():
+            if not queue.is_leader():
+                continue
+            for job in queue.running():
+                profile = self._profiles.get(job['id'])
+                if profile is None:
+                    profile = JobProfile(job, queue.eval_path)
+                    self._profiles[job['id']] = profile
+                profile.add(queue.get_proc(job).sample_tree())
+                if profile.unsaved >= self.flush_every:
+                    profile.flush()
+                running.add(job['id'])
+        for job_id in list(self._profiles.keys()):
+            if job_id not in running:
+                self._profiles.pop(job_id).flush()
+
+
+class JobProfile(object):
+    """ The resource usage samples of a job, see `COLUMNS`.
+
+    Parameters
+    ----------
+    job : dict
+        The job being profiled.
+    eval_path : string
+        The evaluation folder of the job.
+    """
+
+    def __init__(self, job, eval_path):
+        self.job = job
+        self.eval_path = eval_path
+        self.run_path = None
+        self.unsaved = 0
+        self.columns = {name: [] for name, _ in COLUMNS}
+
+    def add(self, procs):
+        """ Adds a sample given the usage of each process in the tree, see `procinfo.sample_tree`. """
+        if len(procs) == 0:
+            return
+        self.columns['time'].append(time.time())
+        for name, _ in COLUMNS[1:-1]:
+            self.columns[name].append(sum(proc[name] for proc in procs))
+        self.columns['procs'].append(len(procs))
+        self.unsaved += 1
+
+    def flush(self):
+        """ Writes the profile to the run folder, once EvalNE has created it. """
+        if self.unsaved == 0:
+            return
+        if self.run_path is None:
+            self.run_path = find_run_path(self.job, self.eval_path)
+            if self.run_path is None:
+                return
+            # Continue the profile recorded before a GUI restart
+            old = read_profile(os.path.join(self.run_path, PROFILE_FILE))
+            if old is not None:
+                for name, _ in COLUMNS:
+                    self.columns[name] = old[name].tolist() + self.columns[name]
+        write_profile(os.path.join(self.run_path, PROFILE_FILE), self.columns)
+        self.unsaved = 0
+
+
+class ProfileIndex(object):
+    """ Persistent index of the resource profiles of the runs of an evaluation folder.
+
+    Looking for the profiles of a run means listing its sub-runs, so each run is only looked at until it has finished
+    and its profiles can no longer change, see `PROFILE_GRACE`. The index is kept in memory and mirrored to a json file
+    in the GUI state folder, which is read again when another process updates it.
+
+    Parameters
+    ----------
+    filename : string
+        Name of the json file where the index is persisted.
+    """
+
+    version = 1
+
+    def __init__(self, filename='profiles.json'):
+        self._filename = filename
+        self._cache = dict()
+        self._lock = threading.Lock()
+
+    def update(self, eval_path, running=()):
+        """ Returns a dict mapping the name of every run in `eval_path` to the paths of its profiles. Only the new runs,
+        the `running` ones, split evaluations with pending sub-runs and the runs whose log changed less than
+        `PROFILE_GRACE` seconds ago are looked at.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the evaluation folder does not exist.
+        """
+        runs = catalog.update(eval_path)
+        # The folders of split evaluations are created when they are queued
+        active = set(running) | set(job['group'] for job in get_queue(eval_path).jobs()
+                                    if job['group'] is not None and job['state'] in ('queued', 'running'))
+        with self._lock:
+            index = self._get_index(eval_path)
+            changed = False
+            for name in set(index['runs']) - set(runs):
+                del index['runs'][name]
+                changed = True
+            now = time.time()
+            for name, entry in runs.items():
+                if name in index['runs'] and index['runs'][name]['final']:
+                    continue
+                run_path = os.path.join(eval_path, name)
+                new_entry = {'paths': [os.path.relpath(path, eval_path) for path in get_run_profiles(run_path)],
+                             'final': name not in active and now - entry['log_mtime'] / 1e9 > PROFILE_GRACE}
+                if new_entry != index['runs'].get(name):
+                    index['runs'][name] = new_entry
+                    changed = True
+            if changed:
+                path = os.path.join(get_state_dir(eval_path), self._filename)
+                try:
+                    write_json(path, index)
+                    self._cache[eval_path] = (index, os.stat(path).st_mtime_ns)
+                except OSError:
+                    pass
+            return {name: [os.path.join(eval_path, path) for path in entry['paths']]
+                    for name, entry in index['runs'].items()}
+
+    def _get_index(self, eval_path):
+        """ Returns the index of `eval_path`, reading the persisted one if it is new or has been updated by another
+        process. """
+        path = os.path.join(eval_path, '.evalne_gui', self._filename)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        index, cached_mtime = self._cache.get(eval_path, (None, None))
+        if index is None or (mtime is not None and mtime != cached_mtime):
+            index = None
+            try:
+                with open(path) as f:
+                    index = json.load(f)
+                if index.get('version') != self.version:
+                    index = None
+            except (OSError, ValueError):
+                pass
+            if index is None:
+                index = {'version': self.version, 'runs': dict()}
+            self._cache[eval_path] = (index, mtime)
+        return index
+
+
+def find_run_path(job, eval_path):
+    """ Returns the run folder EvalNE created for a job, or None if it does not exist yet. Sub-runs of split
+    evaluations have their own folder. Other runs are matched by the start time EvalNE puts in the folder name, the
+    first one from the minute the job was started on is the job's. Launches are spaced by more than a minute by the
+    job queue. """
+    if job['cwd'] is not None:
+        return get_sub_run(job['cwd'])
+    started = datetime.datetime.fromtimestamp(job['started']).replace(second=0, microsecond=0).timestamp()
+    runs = []
+    for fname in os.listdir(eval_path):
+        path = os.path.join(eval_path, fname)
+        start_time = get_run_start(fname, job['started'])
+        if start_time is not None and start_time >= started and os.path.isdir(path) and \
+                os.stat(path).st_mtime >= job['started'] - 60:
+            runs.append((start_time, fname))
+    if len(runs) == 0:
+        return None
+    return os.path.join(eval_path, min(runs)[1])
+
+
+def get_run_start(fname, ref_time):
+    """ Returns the start time in the name of an EvalNE run folder as a timestamp, or None for other names. The name
+    has no year, so the one giving the time closest to `ref_time` is used. """
+    match = RUN_STAMP.search(fname)
+    if match is None:
+        return None
+    year = datetime.datetime.fromtimestamp(ref_time).year
+    times = []
+    for y in (year - 1, year, year + 1):
+        try:
+            times.append(datetime.datetime.strptime('{}_{}'.format(y, match.group(1)), '%Y_%m%d_%H%M').timestamp())
+        except ValueError:
+            # 29th of February of a year that is not a leap year
+            continue
+    if len(times) == 0:
+        return None
+    return min(times, key=lambda t: abs(t - ref_time))
+
+
+def write_profile(path, columns):
+    """ Atomically writes a profile as a compressed numpy file with one array per column. """
+    # Only the profiler thread and the results tab need numpy, importing it lazily speeds up the GUI startup
+    import numpy as np
+    tmp = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp, 'wb') as f:
+        np.savez_compressed(f, **{name: np.array(columns[name], dtype=dtype) for name, dtype in COLUMNS})
+    os.replace(tmp, path)
+
+
+def read_profile(path):
+    """ Returns the columns of a profile as a dict of arrays, or None if the file is missing or corrupted. """
+    import numpy as np
+    try:
+        with np.load(path) as data:
+            return {name: data[name] for name, _ in COLUMNS}
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+
+def get_run_profiles(run_path):
+    """ Returns the paths of the profiles of a run, one per sub-run for split evaluations. """
+    path = os.path.join(run_path, PROFILE_FILE)
+    if os.path.isfile(path):
+        return [path]
+    return sorted(glob.glob(os.path.join(run_path, '*', '*_eval_*', PROFILE_FILE)))
+
+
+def summarize_profiles(paths):
+    """ Returns the peak and mean usage of a run given the paths of its profiles, or None if there are none. Profiles
+    of sub-runs are added up over time.
+
+    Returns
+    -------
+    summary : dict
+        A dict with the `duration` in seconds, the `peak_rss` and `mean_rss` in bytes, the `peak_cpu` and `mean_cpu`
+        in cores, the total `read_bytes` and `write_bytes` and the `max_threads` and `max_open_files`.
+    """
+    import numpy as np
+    profiles = [profile for profile in map(read_profile, paths) if profile is not None and len(profile['time']) > 1]
+    if len(profiles) == 0:
+        return None
+
+    # Put the samples of all profiles in bins of the sampling interval and add them up
+    step = min(float(np.median(np.diff(profile['time']))) for profile in profiles) or 1.0
+    times, rss, cores, threads, files = [], [], [], [], []
+    cpu_time, read_bytes, write_bytes = 0.0, 0, 0
+    for profile in profiles:
+        t = profile['time']
+        times.append(t)
+        rss.append(profile['rss'])
+        threads.append(profile['threads'])
+        files.append(profile['open_files'])
+        # CPU time and IO are cumulative, processes exiting can make them decrease
+        cpu = np.maximum(np.diff(profile['cpu_time']), 0)
+        cpu_time += cpu.sum()
+        cores.append(np.concatenate(([0.0], cpu / np.maximum(np.diff(t), 1e-3))))
+        read_bytes += int(np.maximum(np.diff(profile['read_bytes']), 0).sum())
+        write_bytes += int(np.maximum(np.diff(profile['write_bytes']), 0).sum())
+    bins, idx = np.unique(np.floor(np.concatenate(times) / step), return_inverse=True)
+    totals = [np.bincount(idx, weights=np.concatenate(col), minlength=len(bins))
+              for col in (rss, cores, threads, files)]
+    start = min(t[0] for t in times)
+    end = max(t[-1] for t in times)
+    return {'duration': float(end - start),
+            'peak_rss': float(totals[0].max()),
+            'mean_rss': float(totals[0].mean()),
+            'peak_cpu': float(totals[1].max()),
+            'mean_cpu': float(cpu_time / max(end - start, 1e-3)),
+            'read_bytes': read_bytes,
+            'write_bytes': write_bytes,
+            'max_threads': int(totals[2].max()),
+            'max_open_files': int(totals[3].max())}
+
+
+def format_summary(summary):
+    """ Returns a one line description of the usage summary of a run. """
+    return ('Peak memory {:.2f} GB (mean {:.2f} GB), peak CPU {:.1f} cores (mean {:.1f}), {:.1f} MB read, {:.1f} MB '
+            'written, up to {} threads and {} open files over {}').format(
+        summary['peak_rss'] / 2 ** 30, summary['mean_rss'] / 2 ** 30, summary['peak_cpu'], summary['mean_cpu'],
+        summary['read_bytes'] / 2 ** 20, summary['write_bytes'] / 2 ** 20, summary['max_threads'],
+        summary['max_open_files'], datetime.timedelta(seconds=round(summary['duration'])))
+
+
+# Shared profile index
+profiles = ProfileIndex()
+
+# Shared recorder instance
+profiler = ProfileRecorder()
@@ -6,14 +6,53 @@
 
 import os
 import json
+import zlib
+import datetime
+import threading
+from collections import OrderedDict
 
 from evalne_gui.app import app
 from dash.dependencies import Input, Output
-from dash import dcc, State, html
-from evalne_gui.utils import get_logged_evals, read_file
+from dash import dcc, State, html, dash_table, ALL, MATCH, callback_context, no_update
+from dash.exceptions import PreventUpdate
+from evalne_gui.utils import read_file_head
+from evalne_gui.catalog import get_logged_evals
+from evalne_gui.jobs import get_queue
+from evalne_gui.profiler import profiles, get_run_profiles, summarize_profiles, format_summary
+from evalne_gui.timeline import timelines, get_timeline, get_method_times
+from evalne_gui.resultstore import result_store
+from evalne_gui.leaderboard import get_leaderboard, format_score
+from evalne_gui.session import sessions, get_session_id
 from evalne_gui.init_values import *
 
 
+# Bytes of each log/results file sent to the browser when a run is opened and every time `Load more` is clicked
+CHUNK_SIZE = 64 * 1024
+
+# Number of finished jobs shown in the queue table
+JOB_HISTORY = 10
+
+# Number of most recent runs shown in the resource usage plot
+USAGE_HISTORY = 20
+
+# Maximum number of score rows shown in the results explorer table
+EXPLORER_ROWS = 10000
+
+# Views of the results explorer, as (label, index column, columns column) with None for the flat table
+EXPLORER_VIEWS = (('Table', None, None),
+                  ('Methods x Networks', 'method', 'network'),
+                  ('Methods x Runs', 'method', 'run'),
+                  ('Networks x Runs', 'network', 'run'))
+
+# Resource usage summaries of the runs, keyed by the path, size and mtime of their profiles
+_usage_cache = dict()
+_usage_lock = threading.Lock()
+
+# Phases of the runs, keyed by the mtime of their logs
+_timeline_cache = dict()
+_timeline_lock = threading.Lock()
+
+
 results_layout = html.Div([
 
     dcc.Interval(
@@ -22,6 +61,19 @@ results_layout = html.Div([
         n_intervals=0
     ),
 
+    html.H3(children='Evaluation Queue', className='section-title'),
+    html.Hr(className='sectionHr'),
+    html.Br(),
+
+    html.Div(
+        id='job-queue-div',
+        className='plot-area',
+        children=[
+            html.Div(id='job-queue-table'),
+        ],
+    ),
+    html.Br(),
+
     html.H3(children='Evaluation Runs and Results', className='section-title'),
     html.Hr(className='sectionHr'),
     html.Br(),
@@ -34,10 +86,103 @@ results_layout = html.Div([
         ],
     ),
 
+    html.Br(),
+    html.H3(children='Results Explorer', className='section-title'),
+    html.Hr(className='sectionHr'),
+    html.Br(),
+
+    html.Div(
+        id='results-explorer-div',
+        className='plot-area',
+        children=[
+            html.Div(
+                children=[
+                    html.Div([html.Label(['Metric:']),
+                              dcc.Dropdown(id='explorer-metric', options=[], persistence=True)],
+                             style={'width': '22%'}),
+                    html.Div([html.Label(['Networks:']),
+                              dcc.Dropdown(id='explorer-networks', options=[], multi=True, persistence=True)],
+                             style={'width': '22%'}),
+                    html.Div([html.Label(['Methods:']),
+                              dcc.Dropdown(id='explorer-methods', options=[], multi=True, persistence=True)],
+                             style={'width': '22%'}),
+                    html.Div([html.Label(['Runs:']),
+                              dcc.Dropdown(id='explorer-runs', options=[], multi=True, persistence=True)],
+                             style={'width': '22%'}),
+                ],
+                style={'display': 'flex', 'justify-content': 'space-between'}
+            ),
+            html.Br(),
+            dcc.RadioItems(
+                id='explorer-view',
+                options=[{'label': label, 'value': i} for i, (label, _, _) in enumerate(EXPLORER_VIEWS)],
+                value=1,
+                inline=True,
+                persistence=True,
+                inputStyle={'margin-left': '20px', 'margin-right': '5px'},
+            ),
+            html.Br(),
+            html.Div(id='explorer-table'),
+        ],
+    ),
+
+    html.Br(),
+    html.H3(children='Leaderboard', className='section-title'),
+    html.Hr(className='sectionHr'),
+    html.Br(),
+
+    html.Div(
+        id='leaderboard-div',
+        className='plot-area',
+        children=[
+            html.Div(
+                children=[
+                    html.Div([html.Label(['Metric:']),
+                              dcc.Dropdown(id='leaderboard-metric', options=[], value=None,
+                                           clearable=False, persistence=True)],
+                             style={'width': '22%'}),
+                    html.Div([html.Label(['Runs (all if empty):']),
+                              dcc.Dropdown(id='leaderboard-runs', options=[], multi=True, persistence=True)],
+                             style={'width': '74%'}),
+                ],
+                style={'display': 'flex', 'justify-content': 'space-between'}
+            ),
+            html.Br(),
+            html.Div(id='leaderboard-table'),
+            dcc.Graph(id='leaderboard-graph', style={'display': 'none'}),
+        ],
+    ),
+
+    html.Br(),
+    html.Div(
+        id='run-usage-div',
+        className='plot-area',
+        children=[
+            dcc.Graph(id='run-usage-graph'),
+        ],
+        style={'display': 'none'}
+    ),
+
+    html.Br(),
+    html.Div(
+        id='method-time-div',
+        className='plot-area',
+        children=[
+            dcc.Graph(id='method-time-graph'),
+        ],
+        style={'display': 'none'}
+    ),
+
     # --------------------------
     #       Data storage
     # --------------------------
     dcc.Store(id='settings-data', storage_type='local'),
+    dcc.Store(id='run-usage-checksum'),
+    dcc.Store(id='method-time-checksum'),
+    dcc.Store(id='explorer-checksum'),
+    dcc.Store(id='eval-tabs-runs'),
+    dcc.Store(id='eval-tabs-summaries'),
+    dcc.Store(id='job-queue-checksum'),
 
 ])
 
@@ -46,29 +191,82 @@ results_layout = html.Div([
 #         Callbacks
 # --------------------------
 
+@app.callback(Output('job-queue-table', 'children'),
+              Output('job-queue-checksum', 'data'),
+              Input('res-update-interval', 'n_intervals'),
+              Input({'type': 'job-cancel', 'index': ALL}, 'n_clicks'),
+              State('settings-data', 'data'),
+              State('job-queue-checksum', 'data'))
+def update_queue(n, cancel_clicks, settings_data, old_checksum):
+    """ Updates the `Evaluation Queue` table and cancels jobs when their Cancel button is pressed. Only active jobs and
+    the last `JOB_HISTORY` finished ones are shown. """
+
+    eval_path = get_results_path(settings_data)
+    if not os.path.isdir(eval_path):
+        jobs = []
+    else:
+        queue = get_queue(eval_path)
+        for t in callback_context.triggered:
+            # Buttons are recreated with every table update, so only real clicks have n_clicks > 0
+            if t['prop_id'].startswith('{') and t['value']:
+                queue.cancel(json.loads(t['prop_id'].rsplit('.', 1)[0])['index'])
+        jobs = queue.jobs()
+
+    active = [job for job in jobs if job['state'] in ('queued', 'running')]
+    finished = [job for job in jobs if job['state'] not in ('queued', 'running')]
+    finished = sorted(finished, key=lambda job: job['finished'], reverse=True)[:JOB_HISTORY]
+    rows = [get_job_row(job) for job in active[::-1] + finished]
+
+    checksum = zlib.crc32(json.dumps(rows).encode())
+    if checksum == old_checksum:
+        raise PreventUpdate
+
+    cols = ['Job', 'Config', 'State', 'Submitted', 'Started', 'Finished', 'Exit Code', '']
+    table = html.Table(
+        children=[
+            html.Tr(
+                children=[
+                    html.Th(col) for col in cols
+                ],
+                style={'border-top': 'hidden'},
+            )
+        ] + [
+            html.Tr(
+                children=[html.Td(v) for v in row] + [
+                    html.Td(html.Button('Cancel', id={'type': 'job-cancel', 'index': row[0]},
+                                        className='btn btn-square btn-sm', n_clicks=0)
+                            if row[2] in ('queued', 'running') else '')
+                ]
+            ) for row in rows
+        ],
+        style={'width': '100%', 'display': 'inline-table'}
+    )
+    return table, checksum
+
+
 @app.callback(Output('eval-tabs-table', 'children'),
+              Output('eval-tabs-runs', 'data'),
               Input('res-update-interval', 'n_intervals'),
-              State('settings-data', 'data'))
-def update_table(n, settings_data):
-    """ Updates the `Runs and Results` table. """
+              State('settings-data', 'data'),
+              State('eval-tabs-runs', 'data'))
+def update_table(n, settings_data, rendered_runs):
+    """ Updates the `Runs and Results` table. The table is only rebuilt when runs are added or removed, so rows the
+    user has opened stay open. """
 
     # Table header
     cols = ['Filename', 'Status', 'Runtime', 'Start Time', 'End Time']
 
     # Read eval_path from settings and get the evaluations logged there
-    if settings_data is None:
-        settings_data = [val for val in init_settings.values()]
-    else:
-        settings_data = json.loads(settings_data)
-    if settings_data[1] == '':
-        eval_path = os.getcwd()
-    else:
-        eval_path = settings_data[1]
+    eval_path = get_results_path(settings_data)
     try:
         rows = get_logged_evals(eval_path)
     except FileNotFoundError:
         rows = []
 
+    runs = [row[0] for row in rows]
+    if runs == rendered_runs:
+        raise PreventUpdate
+
     # Present evaluations as rows in a table
     table = [
         html.Table(
@@ -85,43 +283,461 @@ def update_table(n, settings_data):
     ]
 
     # Dash Tables cannot have expandable rows, so workaround having each row be a table in itself
-    table += [
-        html.Details(
-            children=[
-                html.Summary(
-                    children=[
-                        html.Table(
-                            children=[
-                                html.Tr(
-                                    children=[
-                                        html.Td(v) for v in row
-                                    ],
-                                    style={'border-top': 'hidden'}
-                                )
-                            ],
-                            style={'width': '100%', 'display': 'inline-table'}
-                        )
-                    ],
-                    style={'display': 'flex'}
-                ),
-                # Hidden content
-                html.Div(
-                    children=[
-                        html.H4(['Evaluation Log']),
-                        html.Pre(id='log-out', className='bash', children=read_file(os.path.join(eval_path, row[0]),
-                                                                                    'eval.log')),
-                        html.Br(),
-                        html.Br(),
-                        html.H4(['Evaluation Results']),
-                        html.Pre(id='res-out', className='bash', children=read_file(os.path.join(eval_path, row[0]),
-                                                                                    'eval_output.txt')),
-                        html.Br(),
-                        html.Br(),
-                    ],
-                    style={'margin-left': '10%', 'margin-right': '10%'}
-                )
-            ],
-            open=False,
-        ) for row in rows]
+    table += [get_run_row(row) for row in rows]
+
+    return table, runs
+
+
+@app.callback(Output({'type': 'run-summary', 'index': ALL}, 'children'),
+              Output('eval-tabs-summaries', 'data'),
+              Input('res-update-interval', 'n_intervals'),
+              State('settings-data', 'data'),
+              State('eval-tabs-summaries', 'data'))
+def update_summaries(n, settings_data, old_checksums):
+    """ Updates the status, runtime and end time of the runs in the table. Only rows that changed are sent. """
+
+    eval_path = get_results_path(settings_data)
+    try:
+        rows = {row[0]: row for row in get_logged_evals(eval_path)}
+    except FileNotFoundError:
+        rows = {}
+    old_checksums = old_checksums or {}
+
+    res = []
+    checksums = {}
+    for output in callback_context.outputs_list[0]:
+        name = output['id']['index']
+        row = rows.get(name)
+        if row is None:
+            res.append(no_update)
+            continue
+        checksums[name] = zlib.crc32(json.dumps(row).encode())
+        if old_checksums.get(name) == checksums[name]:
+            res.append(no_update)
+        else:
+            res.append([html.Td(v) for v in row])
+
+    if checksums == old_checksums:
+        raise PreventUpdate
+    return res, checksums
 
-    return table
+
+@app.callback(Output('explorer-metric', 'options'),
+              Output('explorer-networks', 'options'),
+              Output('explorer-methods', 'options'),
+              Output('explorer-runs', 'options'),
+              Output('leaderboard-metric', 'options'),
+              Output('leaderboard-metric', 'value'),
+              Output('leaderboard-runs', 'options'),
+              Output('explorer-checksum', 'data'),
+              Input('res-update-interval', 'n_intervals'),
+              State('settings-data', 'data'),
+              State('explorer-checksum', 'data'),
+              State('leaderboard-metric', 'value'))
+def update_result_store(n, settings_data, old_checksum, metric):
+    """ Ingests the results of new or changed runs into the result store and updates the explorer and leaderboard
+    filters. The leaderboard metric defaults to the metric to maximize of the session's dashboard config. """
+
+    eval_path = get_results_path(settings_data)
+    try:
+        result_store.update(eval_path)
+    except FileNotFoundError:
+        raise PreventUpdate
+
+    # Filter values are recomputed even without changes, the evaluation folder may have been switched
+    options = [result_store.distinct(eval_path, column) for column in ('metric', 'network', 'method', 'run')]
+    options[3] = options[3][::-1]
+    checksum = zlib.crc32(json.dumps([eval_path, options]).encode())
+    if checksum == old_checksum:
+        raise PreventUpdate
+    options = [[{'label': val, 'value': val} for val in vals] for vals in options]
+    if not metric:
+        metric = sessions.get(get_session_id(), 'conf:maximize-dropdown', init_vals['maximize-dropdown'])
+    else:
+        metric = no_update
+    return options + [options[0], metric, options[3], checksum]
+
+
+@app.callback(Output('explorer-table', 'children'),
+              Input('explorer-metric', 'value'),
+              Input('explorer-networks', 'value'),
+              Input('explorer-methods', 'value'),
+              Input('explorer-runs', 'value'),
+              Input('explorer-view', 'value'),
+              Input('explorer-checksum', 'data'),
+              State('settings-data', 'data'))
+def update_explorer_table(metric, networks, methods, runs, view, checksum, settings_data):
+    """ Shows the scores in the result store that match the filters, as a flat table or pivoted. All views can be
+    sorted and filtered further from the table header. """
+
+    if checksum is None:
+        raise PreventUpdate
+    eval_path = get_results_path(settings_data)
+    filters = {'metric': [metric] if metric else None, 'network': networks, 'method': methods, 'run': runs}
+    _, index, columns = EXPLORER_VIEWS[view or 0]
+
+    if index is None:
+        rows = result_store.query(eval_path, filters, limit=EXPLORER_ROWS + 1)
+        names = ['Run', 'Sub-run', 'Network', 'Method', 'Metric', 'Repeat', 'Value']
+        data = [dict(zip(names, row)) for row in rows[:EXPLORER_ROWS]]
+        note = 'Showing the first {} scores, use the filters to narrow them down.'.format(EXPLORER_ROWS) \
+            if len(rows) > EXPLORER_ROWS else '{} scores.'.format(len(rows))
+    else:
+        if not metric:
+            return html.P('Select a metric to pivot the scores.')
+        index_vals, column_vals, table = result_store.pivot(eval_path, index, columns, filters)
+        names = [index.capitalize()] + column_vals
+        data = []
+        for idx in index_vals:
+            row = {names[0]: idx}
+            row.update({col: round(table[(idx, col)][0], 4) for col in column_vals if (idx, col) in table})
+            data.append(row)
+        note = 'Mean {} over all matching scores.'.format(metric)
+
+    if len(data) == 0:
+        return html.P('No results found.')
+    return [
+        html.P(note),
+        dash_table.DataTable(
+            columns=[{'name': name, 'id': name} for name in names],
+            data=data,
+            sort_action='native',
+            filter_action='native',
+            page_size=25,
+            style_table={'overflowX': 'auto'},
+            style_cell={'textAlign': 'left'},
+        ),
+    ]
+
+
+@app.callback(Output('leaderboard-table', 'children'),
+              Output('leaderboard-graph', 'figure'),
+              Output('leaderboard-graph', 'style'),
+              Input('leaderboard-metric', 'value'),
+              Input('leaderboard-runs', 'value'),
+              Input('explorer-checksum', 'data'),
+              State('settings-data', 'data'))
+def update_leaderboard(metric, runs, checksum, settings_data):
+    """ Ranks the methods on each network by their mean score over the selected runs and experiment repeats. """
+
+    if checksum is None or not metric:
+        raise PreventUpdate
+    eval_path = get_results_path(settings_data)
+    rows = result_store.query(eval_path, {'metric': [metric], 'run': runs})
+    board = get_leaderboard(rows, metric)
+    if board is None:
+        return html.P('No {} scores found.'.format(metric)), no_update, {'display': 'none'}
+
+    names = ['Rank', 'Method'] + board['networks']
+    data = []
+    for i, method in enumerate(board['methods']):
+        row = {'Rank': round(float(board['avg_rank'][i]), 2), 'Method': method}
+        row.update({net: format_score(board['mean'][i, j], board['ci'][i, j], board['count'][i, j])
+                    for j, net in enumerate(board['networks'])})
+        data.append(row)
+    table = [
+        html.P('Mean {} ± 95% confidence interval (number of scores) over {} runs. Methods are sorted by their average '
+               'rank over the networks.'.format(metric, len(set(row[0] for row in rows)))),
+        dash_table.DataTable(
+            columns=[{'name': name, 'id': name} for name in names],
+            data=data,
+            sort_action='native',
+            page_size=25,
+            style_table={'overflowX': 'auto'},
+            style_cell={'textAlign': 'left'},
+        ),
+    ]
+    return table, get_leaderboard_figure(board, metric), {}
+
+
+@app.callback(Output('run-usage-graph', 'figure'),
+              Output('run-usage-div', 'style'),
+              Output('run-usage-checksum', 'data'),
+              Input('res-update-interval', 'n_intervals'),
+              State('settings-data', 'data'),
+              State('run-usage-checksum', 'data'))
+def update_usage_graph(n, settings_data, old_checksum):
+    """ Plots the peak and mean memory and CPU used by the most recent runs with a resource profile. """
+
+    eval_path = get_results_path(settings_data)
+    try:
+        rows = get_logged_evals(eval_path)
+        paths = profiles.update(eval_path, set(row[0] for row in rows if row[1] == 'Running'))
+    except FileNotFoundError:
+        rows = []
+    runs = []
+    for row in rows:
+        if len(paths.get(row[0], [])) == 0:
+            continue
+        summary = get_usage_summary(os.path.join(eval_path, row[0]), paths[row[0]])
+        if summary is not None:
+            runs.append((row[0], summary))
+        if len(runs) == USAGE_HISTORY:
+            break
+
+    checksum = zlib.crc32(json.dumps(runs).encode())
+    if checksum == old_checksum:
+        raise PreventUpdate
+    if len(runs) == 0:
+        return no_update, {'display': 'none'}, checksum
+    return get_usage_figure(runs[::-1]), {}, checksum
+
+
+@app.callback(Output('method-time-graph', 'figure'),
+              Output('method-time-div', 'style'),
+              Output('method-time-checksum', 'data'),
+              Input('res-update-interval', 'n_intervals'),
+              State('settings-data', 'data'),
+              State('method-time-checksum', 'data'))
+def update_method_time_graph(n, settings_data, old_checksum):
+    """ Plots the time spent in each method and phase of the evaluation, added up over all runs. """
+
+    eval_path = get_results_path(settings_data)
+    try:
+        events = timelines.update(eval_path)
+    except FileNotFoundError:
+        events = dict()
+
+    # The phases only change when a log does, which also changes its mtime
+    checksum = zlib.crc32(json.dumps([eval_path, sorted((run, mtime) for run, (_, mtime) in events.items())]).encode())
+    if checksum == old_checksum:
+        raise PreventUpdate
+    runs = [get_run_timeline(eval_path, run, events[run]) for run in events]
+    runs = [phases for phases in runs if len(phases)]
+    totals = get_method_times(runs)
+    if len(totals) == 0:
+        return no_update, {'display': 'none'}, checksum
+    return get_method_time_figure(totals, len(runs)), {}, checksum
+
+
+@app.callback(Output({'type': 'run-body', 'index': MATCH}, 'children'),
+              Output({'type': 'run-more', 'index': MATCH}, 'style'),
+              Output({'type': 'run-size', 'index': MATCH}, 'data'),
+              Input({'type': 'run-details', 'index': MATCH}, 'n_clicks'),
+              Input({'type': 'run-more', 'index': MATCH}, 'n_clicks'),
+              State({'type': 'run-size', 'index': MATCH}, 'data'),
+              State('settings-data', 'data'),
+              prevent_initial_call=True)
+def load_run_details(details_clicks, more_clicks, size, settings_data):
+    """ Loads the log and results of a run when its row is first opened and extends them on `Load more`. """
+
+    ctx = callback_context
+    button_ids = [json.loads(t['prop_id'].rsplit('.', 1)[0]) for t in ctx.triggered]
+    if size and all(button_id['type'] == 'run-details' for button_id in button_ids):
+        # Already loaded, the click just collapsed the row or happened inside it
+        raise PreventUpdate
+    size = (size or 0) + CHUNK_SIZE
+
+    eval_path = get_results_path(settings_data)
+    run_path = os.path.join(eval_path, button_ids[0]['index'])
+    log, log_left = read_file_head(run_path, 'eval.log', size)
+    res, res_left = read_file_head(run_path, 'eval_output.txt', size)
+
+    summary = get_usage_summary(run_path, get_run_profiles(run_path))
+    try:
+        events = timelines.update(eval_path).get(button_ids[0]['index'])
+    except FileNotFoundError:
+        events = None
+    phases = get_run_timeline(eval_path, button_ids[0]['index'], events) if events is not None else []
+    body = [
+        html.H4(['Resource Usage']),
+        html.P(format_summary(summary) if summary is not None else 'No resource profile recorded for this run.'),
+        html.Br(),
+    ]
+    if len(phases):
+        body += [
+            html.H4(['Timeline']),
+            dcc.Graph(figure=get_timeline_figure(phases)),
+            html.Br(),
+        ]
+    body += [
+        html.H4(['Evaluation Log']),
+        html.Pre(className='bash', children=log + get_truncated_note(log_left)),
+        html.Br(),
+        html.Br(),
+        html.H4(['Evaluation Results']),
+        html.Pre(className='bash', children=res + get_truncated_note(res_left)),
+        html.Br(),
+    ]
+    more_style = {'display': 'none'} if log_left == 0 and res_left == 0 else {}
+    return body, more_style, size
+
+
+# --------------------------
+#      Other Functions
+# --------------------------
+
+def get_results_path(settings_data):
+    """ Returns the evaluation folder from the settings data. """
+    if settings_data is None:
+        settings_data = [val for val in init_settings.values()]
+    else:
+        settings_data = json.loads(settings_data)
+    if settings_data[1] == '':
+        eval_path = os.getcwd()
+    else:
+        eval_path = settings_data[1]
+    return eval_path
+
+
+def get_usage_summary(run_path, paths):
+    """ Returns the resource usage summary of a run given the paths of its profiles, see `summarize_profiles`.
+    Summaries are only recomputed when the profiles of the run change. """
+    if len(paths) == 0:
+        return None
+    try:
+        key = tuple((path, os.stat(path).st_size, os.stat(path).st_mtime_ns) for path in paths)
+    except FileNotFoundError:
+        return None
+    with _usage_lock:
+        if _usage_cache.get(run_path, (None,))[0] == key:
+            return _usage_cache[run_path][1]
+    summary = summarize_profiles(paths)
+    with _usage_lock:
+        _usage_cache[run_path] = (key, summary)
+    return summary
+
+
+def get_usage_figure(runs):
+    """ Returns a bar plot with the peak and mean memory (left axis) and CPU (right axis) of a list of (run name,
+    usage summary) tuples. """
+    # Plotly is only needed to draw the figures, importing it lazily speeds up the GUI startup
+    import plotly.graph_objects as go
+
+    names = [name for name, _ in runs]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=names, y=[s['peak_rss'] / 2 ** 30 for _, s in runs], name='Peak memory (GB)',
+                         marker_color='gold', offsetgroup=0))
+    fig.add_trace(go.Bar(x=names, y=[s['mean_rss'] / 2 ** 30 for _, s in runs], name='Mean memory (GB)',
+                         marker_color='khaki', offsetgroup=1))
+    fig.add_trace(go.Bar(x=names, y=[s['peak_cpu'] for _, s in runs], name='Peak CPU (cores)',
+                         marker_color='limegreen', offsetgroup=2, yaxis='y2'))
+    fig.add_trace(go.Bar(x=names, y=[s['mean_cpu'] for _, s in runs], name='Mean CPU (cores)',
+                         marker_color='lightgreen', offsetgroup=3, yaxis='y2'))
+
+    fig.update_layout(title='Resource Usage per Run', barmode='group', autosize=True, height=400,
+                      yaxis={'title': 'Memory (GB)'},
+                      yaxis2={'title': 'CPU (cores)', 'overlaying': 'y', 'side': 'right'},
+                      legend={'orientation': 'h', 'y': -0.3},
+                      margin={'l': 10, 'r': 10, 'b': 10, 't': 50})
+    return fig
+
+
+def get_run_timeline(eval_path, run, events):
+    """ Returns the phases of a run given its events and the mtime of its log, see `timeline.get_timeline`. Phases of
+    running evaluations end at the last write to the log. Phases are only computed again when the log changes. """
+    key = (eval_path, run)
+    with _timeline_lock:
+        if _timeline_cache.get(key, (None,))[0] == events[1]:
+            return _timeline_cache[key][1]
+    phases = get_timeline(*events)
+    with _timeline_lock:
+        _timeline_cache[key] = (events[1], phases)
+    return phases
+
+
+def get_timeline_figure(phases):
+    """ Returns a Gantt chart of the phases of a run, one row per network and one color per method or phase. """
+    import plotly.graph_objects as go
+
+    start = min(phase['start'] for phase in phases)
+    lanes = list(OrderedDict.fromkeys(phase['lane'] for phase in phases))
+    fig = go.Figure()
+    for name in OrderedDict.fromkeys(phase['name'] for phase in phases):
+        sel = [phase for phase in phases if phase['name'] == name]
+        fig.add_trace(go.Bar(
+            y=[phase['lane'] for phase in sel],
+            x=[phase['end'] - phase['start'] for phase in sel],
+            base=[phase['start'] - start for phase in sel],
+            orientation='h', name=name,
+            customdata=[str(datetime.timedelta(seconds=round(phase['end'] - phase['start']))) for phase in sel],
+            hovertemplate='%{y}: ' + name + ' (%{customdata})<extra></extra>'))
+
+    fig.update_layout(barmode='overlay', autosize=True, height=150 + 30 * len(lanes),
+                      xaxis={'title': 'Time since start (s)'},
+                      yaxis={'categoryorder': 'array', 'categoryarray': lanes[::-1]},
+                      legend={'orientation': 'h', 'y': -0.3},
+                      margin={'l': 10, 'r': 10, 'b': 10, 't': 10})
+    return fig
+
+
+def get_method_time_figure(totals, num_runs):
+    """ Returns a bar plot of the total time in hours spent in each method or phase, given as an ordered dict. """
+    import plotly.graph_objects as go
+
+    names = list(totals.keys())
+    fig = go.Figure(go.Bar(x=names, y=[secs / 3600 for secs in totals.values()], marker_color='lightskyblue',
+                           customdata=[str(datetime.timedelta(seconds=round(secs))) for secs in totals.values()],
+                           hovertemplate='%{x}: %{customdata}<extra></extra>'))
+    fig.update_layout(title='Time per Method ({} run{})'.format(num_runs, '' if num_runs == 1 else 's'),
+                      autosize=True, height=400, yaxis={'title': 'Time (hours)'},
+                      margin={'l': 10, 'r': 10, 'b': 10, 't': 50})
+    return fig
+
+
+def get_leaderboard_figure(board, metric):
+    """ Returns a bar plot of the mean score of each method on each network with its 95% confidence interval. """
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for j, net in enumerate(board['networks']):
+        fig.add_trace(go.Bar(x=board['methods'], y=board['mean'][:, j], name=net,
+                             error_y={'type': 'data', 'array': board['ci'][:, j], 'visible': True}))
+    fig.update_layout(barmode='group', autosize=True, height=400, yaxis={'title': metric},
+                      legend={'orientation': 'h', 'y': -0.3},
+                      margin={'l': 10, 'r': 10, 'b': 10, 't': 10})
+    return fig
+
+
+def get_job_row(job):
+    """ Returns the values of a job shown in the queue table. """
+    def fmt(t):
+        return '' if t is None else datetime.datetime.fromtimestamp(t).strftime('%d-%m-%y %H:%M:%S')
+    returncode = '' if job['returncode'] is None else job['returncode']
+    return [job['id'], job['name'], job['state'], fmt(job['submitted']), fmt(job['started']),
+            fmt(job['finished']), returncode]
+
+
+def get_truncated_note(remaining):
+    """ Returns the note appended to a file whose content has been partially loaded. """
+    if remaining == 0:
+        return ''
+    return '\n[... {:.1f} KB more, use `Load more` to continue ...]'.format(remaining / 1024)
+
+
+def get_run_row(row):
+    """ Returns an expandable row for a run. The log and results are only loaded when the row is opened. """
+    return html.Details(
+        id={'type': 'run-details', 'index': row[0]},
+        children=[
+            html.Summary(
+                children=[
+                    html.Table(
+                        children=[
+                            html.Tr(
+                                id={'type': 'run-summary', 'index': row[0]},
+                                children=[
+                                    html.Td(v) for v in row
+                                ],
+                                style={'border-top': 'hidden'}
+                            )
+                        ],
+                        style={'width': '100%', 'display': 'inline-table'}
+                    )
+                ],
+                style={'display': 'flex'}
+            ),
+            # Hidden content
+            html.Div(
+                children=[
+                    html.Div(id={'type': 'run-body', 'index': row[0]}),
+                    html.Button('Load more', id={'type': 'run-more', 'index': row[0]},
+                                className='btn btn-square btn-sm', n_clicks=0, style={'display': 'none'}),
+                    html.Br(),
+                    html.Br(),
+                    dcc.Store(id={'type': 'run-size', 'index': row[0]}, data=0),
+                ],
+                style={'margin-left': '10%', 'margin-right': '10%'}
+            )
+        ],
+    )
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import re
+import sqlite3
+import threading
+from evalne_gui.utils import get_state_dir
+from evalne_gui.catalog import catalog
+
+
+# Name of the database created in the GUI state folder of each evaluation folder
+RESULTS_DB = 'results.sqlite'
+
+# Columns of the scores table that can be filtered, sorted and pivoted on
+COLUMNS = ('run', 'network', 'method', 'metric', 'repeat', 'value')
+
+SUB_RUN_HEADER = re.compile(r'^====== Sub-run (.+) ======$')
+NETWORK_HEADER = re.compile(r'^(.+) Network$')
+TABULAR_HEADER = re.compile(r'^Evaluation results \((.+)\):$')
+
+
+class ResultStore(object):
+    """ SQLite store of the scores of all runs in an evaluation folder.
+
+    The `eval_output.txt` of each run is parsed into (run, network, method, metric, repeat, value) rows, see
+    `parse_output`. On each update, only the outputs whose size or mtime changed since they were ingested are read
+    again, and runs removed from the folder are dropped. The database lives in the GUI state folder, so it persists
+    across restarts and is shared by all processes serving the folder.
+    """
+
+    def __init__(self):
+        self._conns = dict()
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def update(self, eval_path):
+        """ Ingests the outputs of the runs in `eval_path` that are new or have changed. Returns the number of runs
+        ingested or removed.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the evaluation folder does not exist.
+        """
+        runs = catalog.update(eval_path)
+        with self._lock:
+            conn = self._get_conn(eval_path)
+            ingested = {run: (size, mtime) for run, size, mtime in conn.execute('SELECT run, size, mtime FROM runs')}
+            removed = set(ingested) - set(runs)
+            updated = []
+            for run in runs:
+                path = os.path.join(eval_path, run, 'eval_output.txt')
+                try:
+                    st = os.stat(path)
+                    if ingested.get(run) == (st.st_size, st.st_mtime_ns):
+                        continue
+                    with open(path) as f:
+                        updated.append((run, st, parse_output(f.read())))
+                except OSError:
+                    continue
+            if len(removed) == 0 and len(updated) == 0:
+                return 0
+            # A single transaction, committing each run would sync the database as many times
+            with conn:
+                for run in removed:
+                    conn.execute('DELETE FROM scores WHERE run = ?', (run,))
+                    conn.execute('DELETE FROM runs WHERE run = ?', (run,))
+                for run, st, rows in updated:
+                    conn.execute('DELETE FROM scores WHERE run = ?', (run,))
+                    conn.executemany('INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                                     [(run,) + row for row in rows])
+                    conn.execute('INSERT OR REPLACE INTO runs VALUES (?, ?, ?)', (run, st.st_size, st.st_mtime_ns))
+            return len(removed) + len(updated)
+
+    def distinct(self, eval_path, column):
+        """ Returns the sorted distinct values of a column of the scores table, over the rows with a numeric value. """
+        if column not in COLUMNS:
+            raise ValueError('Unknown column `{}`'.format(column))
+        with self._lock:
+            conn = self._get_conn(eval_path)
+            return [row[0] for row in conn.execute('SELECT DISTINCT {0} FROM scores WHERE {0} IS NOT NULL AND value IS '
+                                                   'NOT NULL ORDER BY {0}'.format(column))]
+
+    def query(self, eval_path, filters=None, order_by=('run', 'network', 'method'), descending=False, limit=None):
+        """ Returns the rows of the scores table with a numeric value that match the filters.
+
+        Parameters
+        ----------
+        eval_path : string
+            The evaluation folder.
+        filters : dict, optional
+            Maps column names to the list of values to keep. Columns with an empty list or None are not filtered.
+        order_by : tuple, optional
+            Columns to sort the rows by.
+        descending : bool, optional
+            If True, the rows are sorted in descending order.
+        limit : int, optional
+            Maximum number of rows returned.
+
+        Returns
+        -------
+        rows : list
+            A list of (run, sub_run, network, method, metric, repeat, value) tuples.
+        """
+        where, args = get_where(filters)
+        if any(column not in COLUMNS for column in order_by):
+            raise ValueError('Unknown columns `{}`'.format(order_by))
+        order = ', '.join('{} {}'.format(column, 'DESC' if descending else 'ASC') for column in order_by)
+        sql = 'SELECT run, sub_run, network, method, metric, repeat, value FROM scores WHERE value IS NOT NULL{} ' \
+              'ORDER BY {}'.format(where, order)
+        if limit is not None:
+            sql += ' LIMIT {:d}'.format(limit)
+        with self._lock:
+            return self._get_conn(eval_path).execute(sql, args).fetchall()
+
+    def pivot(self, eval_path, index, columns, filters=None):
+        """ Returns the mean value of the rows matching the filters grouped by two columns, e.g. methods x networks.
+
+        Returns
+        -------
+        index_vals : list
+            The values of the `index` column, the rows of the pivot table.
+        column_vals : list
+            The values of the `columns` column, the columns of the pivot table.
+        table : dict
+            Maps (index value, column value) tuples to the mean value and the number of rows averaged.
+        """
+        if index not in COLUMNS or columns not in COLUMNS:
+            raise ValueError('Unknown columns `{}`, `{}`'.format(index, columns))
+        where, args = get_where(filters)
+        sql = 'SELECT {0}, {1}, AVG(value), COUNT(value) FROM scores WHERE value IS NOT NULL{2} GROUP BY {0}, {1}'\
+            .format(index, columns, where)
+        with self._lock:
+            rows = self._get_conn(eval_path).execute(sql, args).fetchall()
+        index_vals = sorted(set(row[0] for row in rows), key=str)
+        column_vals = sorted(set(row[1] for row in rows), key=str)
+        return index_vals, column_vals, {(row[0], row[1]): (row[2], row[3]) for row in rows}
+
+    def _get_conn(self, eval_path):
+        """ Returns the connection to the database of `eval_path`. Connections are not shared by forked workers. """
+        if self._pid != os.getpid():
+            self._conns = dict()
+            self._pid = os.getpid()
+        conn = self._conns.get(eval_path)
+        if conn is None:
+            conn = sqlite3.connect(os.path.join(get_state_dir(eval_path), RESULTS_DB), timeout=10,
+                                   check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS runs (run TEXT PRIMARY KEY, size INTEGER, mtime INTEGER)')
+            conn.execute('CREATE TABLE IF NOT EXISTS scores (run TEXT, sub_run TEXT, network TEXT, method TEXT, '
+                         'metric TEXT, repeat INTEGER, value REAL, text TEXT)')
+            conn.execute('CREATE INDEX IF NOT EXISTS scores_run ON scores (run)')
+            conn.execute('CREATE INDEX IF NOT EXISTS scores_metric ON scores (metric, network, method)')
+            self._conns[eval_path] = conn
+        return conn
+
+
+def get_where(filters):
+    """ Returns the SQL condition, starting with ` AND`, and its arguments for a dict of column filters. """
+    where, args = '', []
+    for column, values in (filters or {}).items():
+        if column not in COLUMNS:
+            raise ValueError('Unknown column `{}`'.format(column))
+        if values:
+            where += ' AND {} IN ({})'.format(column, ', '.join('?' * len(values)))
+            args += list(values)
+    return where, args
+
+
+def parse_output(text):
+    """ Parses the scores in the content of an `eval_output.txt`, either written for all metrics or as one table per
+    metric. Outputs of split evaluations merged by the job queue contain one section per sub-run.
+
+    Returns
+    -------
+    rows : list
+        A list of (sub_run, network, method, metric, repeat, value, text) tuples. The value is None for non numeric
+        scores, e.g. the `edge_embed_method`, which are kept as text. The repeat is None for scores averaged over the
+        experiment repeats, which is what EvalNE writes unless all repeats are requested.
+    """
+    rows = []
+    sub_run, network, method, metric, header = None, None, None, None, None
+    for line in text.split('\n'):
+        line = line.rstrip('\r')
+        if line.strip() == '' or line.startswith('---'):
+            continue
+        match = SUB_RUN_HEADER.match(line)
+        if match is not None:
+            sub_run, network, method, metric, header = match.group(1), None, None, None, None
+            continue
+        match = TABULAR_HEADER.match(line)
+        if match is not None:
+            network, method, metric, header = None, None, match.group(1), None
+            continue
+        if metric is not None:
+            # Tabular output: a header row with the networks followed by one row per method
+            cells = line.split('\t')
+            if header is None:
+                header = cells[1:]
+            else:
+                for net, cell in zip(header, cells[1:]):
+                    rows += get_rows(sub_run, net, cells[0], metric, cell)
+            continue
+        match = NETWORK_HEADER.match(line)
+        if match is not None and not line.startswith(' '):
+            network, method = match.group(1), None
+        elif not line.startswith(' ') and line.endswith(':'):
+            method = line[:-1]
+        elif network is not None and method is not None and ':' in line:
+            name, cell = line.split(':', 1)
+            rows += get_rows(sub_run, network, method, name.strip(), cell)
+    return rows
+
+
+def get_rows(sub_run, network, method, metric, cell):
+    """ Returns the rows of a single score cell, one per repeat if the cell is a list of values. """
+    cell = cell.strip()
+    if cell.startswith('[') and cell.endswith(']'):
+        values = cell[1:-1].replace(',', ' ').replace("'", ' ').split()
+        return [(sub_run, network, method, metric, i, to_value(val), None if to_value(val) is not None else val)
+                for i, val in enumerate(values)]
+    value = to_value(cell)
+    return [(sub_run, network, method, metric, None, value, None if value is not None else cell)]
+
+
+def to_value(cell):
+    """ Returns a score as a float, or None if it is not numeric or missing. """
+    try:
+        value = float(cell)
+    except ValueError:
+        return None
+    return None if value != value else value
+
+
+# Shared result store
+result_store = ResultStore()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import time
+import psutil
+import threading
+from collections import deque
+from evalne_gui.utils import get_ui_proc, get_evalne_proc
+from evalne_gui.procinfo import EvalneProc
+from evalne_gui.timeseries import TimeSeriesStore
+from evalne_gui.proctree import TreeMonitor
+
+
+# Resolution in seconds and number of points kept for the CPU and RAM history (1 sec. for 1h and 1 min. for 1 week)
+RETENTION = ((1, 3600), (60, 7 * 24 * 60))
+
+
+class ResourceSampler(object):
+    """ Background thread that samples system and process resources at a fixed rate and stores them in a ring buffer.
+
+    Dash callbacks should never query psutil directly. Instead, they read the latest snapshot from this sampler so
+    that the cost of monitoring is independent of the number of connected clients and callbacks. The CPU and RAM usage
+    are additionally stored in a multi-resolution time series from which clients can request any time window.
+
+    Parameters
+    ----------
+    interval : float
+        Time in seconds between two consecutive samples.
+    maxlen : int
+        Maximum number of snapshots kept in the ring buffer.
+    retention : tuple of tuples
+        A (resolution in seconds, number of points) tuple per tier of the CPU and RAM history. The resolution of the
+        first tier should match `interval`.
+    """
+
+    def __init__(self, interval=1.0, maxlen=60, retention=RETENTION):
+        self.interval = interval
+        self.series = TimeSeriesStore(['cpu_percent', 'mem_percent'], retention)
+        self._buffer = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._ui_proc = None
+        self._tree = TreeMonitor()
+
+    def start(self):
+        """ Starts the sampling thread, if it is not already running. """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name='evalne-gui-sampler', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """ Stops the sampling thread. """
+        self._stop.set()
+
+    def latest(self):
+        """ Returns the most recent snapshot as a dict. The sampler is started on first use. """
+        self.start()
+        if len(self._buffer) == 0:
+            # No sample taken yet, take one synchronously so the caller always gets data
+            self._buffer.append(self._sample())
+        return self._buffer[-1]
+
+    def history(self):
+        """ Returns a list with all the snapshots currently in the ring buffer, oldest first. """
+        self.start()
+        return list(self._buffer)
+
+    def _run(self):
+        # First call to cpu_percent only sets the reference point
+        psutil.cpu_percent(None)
+        while not self._stop.is_set():
+            start = time.time()
+            try:
+                snapshot = self._sample()
+            except psutil.Error:
+                pass
+            else:
+                self._buffer.append(snapshot)
+                self.series.add(snapshot['time'], snapshot)
+            self._stop.wait(max(0.0, self.interval - (time.time() - start)))
+
+    def _sample(self):
+        """ Collects a single snapshot of the system and process resources. """
+        if self._ui_proc is None:
+            # Keep the same handle so that per process cpu_percent is computed between consecutive samples
+            self._ui_proc = get_ui_proc()
+
+        mem = psutil.virtual_memory()
+        evalne_info, evalne_methods = self._evalne_info()
+        snapshot = {
+            'time': time.time(),
+            'cpu_percent': psutil.cpu_percent(None),
+            'cpu_count': psutil.cpu_count(),
+            'load_avg': psutil.getloadavg(),
+            'mem_percent': mem.percent,
+            'mem_used': mem.used,
+            'mem_available': mem.available,
+            'mem_total': mem.total,
+            'ui_proc': self._ui_proc.info(),
+            'evalne_proc': evalne_info,
+            'evalne_methods': evalne_methods,
+        }
+        return snapshot
+
+    def _evalne_info(self):
+        """ Returns the EvalNE process info and the usage of its process tree per method, see `TreeMonitor`. The
+        processes can terminate at any time while being inspected. """
+        try:
+            proc = get_evalne_proc()
+            info = proc.info()
+            methods = self._tree.update(proc.sample_tree(), info['CWD'] if proc.running() else None)
+        except psutil.Error:
+            return EvalneProc().info(), self._tree.update([])
+        return info, methods
+
+
+# Shared sampler instance used by all callbacks
+sampler = ResourceSampler()
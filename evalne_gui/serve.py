@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import logging
+
+
+# Production servers supported, in order of preference when none is specified
+SERVERS = ('gunicorn', 'waitress')
+
+
+def serve(server, host, port, workers=1, threads=8, backend='auto', on_start=None):
+    """ Serves a WSGI application with a production server. Gunicorn runs `workers` processes with `threads` threads
+    each, while waitress runs a single process with `threads` threads.
+
+    Parameters
+    ----------
+    server : object
+        The WSGI application, e.g. the Flask server of the Dash app.
+    host : string
+        Interface to bind to.
+    port : int
+        Port to listen on.
+    workers : int
+        Number of worker processes, only supported by gunicorn.
+    threads : int
+        Number of threads per worker process.
+    backend : string
+        The production server to use, one of `SERVERS` or `auto` to use the first one installed.
+    on_start : callable
+        Function called without arguments in each process serving requests, before the first request.
+
+    Raises
+    ------
+    ImportError
+        If the requested server, or none of the supported ones for `auto`, is installed.
+    ValueError
+        If more than one worker is requested from a server that does not support it.
+    """
+    if backend == 'auto':
+        backend = get_available_server(workers)
+    if backend == 'gunicorn':
+        serve_gunicorn(server, host, port, workers, threads, on_start)
+    elif backend == 'waitress':
+        if workers > 1:
+            raise ValueError('Waitress runs a single worker process, use gunicorn for more workers!')
+        serve_waitress(server, host, port, threads, on_start)
+    else:
+        raise ValueError('Unknown server `{}`! Supported servers are: {}.'.format(backend, ', '.join(SERVERS)))
+
+
+def get_available_server(workers=1):
+    """ Returns the first supported server installed that can run the requested number of workers. """
+    for backend in SERVERS:
+        if backend == 'waitress' and workers > 1:
+            continue
+        try:
+            __import__(backend)
+            return backend
+        except ImportError:
+            continue
+    raise ImportError('No production server installed! Install one with `pip install evalne_gui[serve]`.')
+
+
+def serve_waitress(server, host, port, threads, on_start=None):
+    import waitress
+    if on_start is not None:
+        on_start()
+    logging.getLogger('waitress').setLevel(logging.ERROR)
+    waitress.serve(server, host=host, port=port, threads=threads)
+
+
+def serve_gunicorn(server, host, port, workers, threads, on_start=None):
+    from gunicorn.app.base import BaseApplication
+
+    class GunicornApp(BaseApplication):
+        """ Runs a WSGI application with the given config instead of the gunicorn command line arguments. """
+
+        def __init__(self, options):
+            self.options = options
+            super(GunicornApp, self).__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return server
+
+    options = {'bind': '{}:{}'.format(host, port),
+               'workers': workers,
+               'threads': threads,
+               'worker_class': 'gthread',
+               # Callbacks can take a while on large evaluation folders
+               'timeout': 120}
+    if on_start is not None:
+        # Background threads do not survive the fork, so they are started in each worker
+        options['post_worker_init'] = lambda worker: on_start()
+    GunicornApp(options).run()
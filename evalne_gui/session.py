@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from flask import g, request, has_request_context
+
+
+# Cookie holding the session id, the only session state kept by the browser
+SESSION_COOKIE = 'evalne_gui_session'
+
+# Sessions not updated for this many seconds are removed when the database is opened
+SESSION_TTL = 90 * 24 * 3600
+
+# Default location of the SQLite session database
+DEFAULT_SESSION_DB = os.path.join(os.path.expanduser('~'), '.evalne_gui', 'sessions.sqlite')
+
+
+class SessionStore(object):
+    """ Server-side store for the GUI state of each browser session, e.g. the dashboard config values.
+
+    Values are kept in memory by default. If a database path is set, they are stored in SQLite instead, so they
+    survive GUI restarts and are shared by all worker processes when the GUI is served by several of them. Values
+    must be json serializable.
+
+    Parameters
+    ----------
+    path : string
+        Path of the SQLite database or None to keep the values in memory only.
+    ttl : float
+        Sessions whose values have not been updated for this many seconds are removed from the database when it is
+        opened.
+    """
+
+    def __init__(self, path=None, ttl=SESSION_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._data = dict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def get(self, session_id, key, default=None):
+        """ Returns the value stored under `key` for the given session or `default` if there is none. """
+        with self._lock:
+            if self.path is None:
+                value = self._data.get((session_id, key))
+            else:
+                row = self._get_conn().execute('SELECT value FROM sessions WHERE session_id = ? AND key = ?',
+                                               (session_id, key)).fetchone()
+                value = None if row is None else row[0]
+        return default if value is None else json.loads(value)
+
+    def set(self, session_id, key, value):
+        """ Stores `value` under `key` for the given session. """
+        value = json.dumps(value)
+        with self._lock:
+            if self.path is None:
+                self._data[(session_id, key)] = value
+            else:
+                with self._get_conn() as conn:
+                    conn.execute('INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)',
+                                 (session_id, key, value, time.time()))
+
+    def get_many(self, session_id, keys):
+        """ Returns a dict with the values stored under each of `keys` for the given session, missing keys excluded. """
+        with self._lock:
+            if self.path is None:
+                values = {key: self._data[(session_id, key)] for key in keys if (session_id, key) in self._data}
+            else:
+                rows = self._get_conn().execute('SELECT key, value FROM sessions WHERE session_id = ? AND key IN ({})'
+                                                .format(', '.join('?' * len(keys))), [session_id] + list(keys))
+                values = dict(rows.fetchall())
+        return {key: json.loads(value) for key, value in values.items()}
+
+    def set_many(self, session_id, items):
+        """ Stores each (key, value) pair of the `items` dict for the given session in a single transaction. """
+        items = [(key, json.dumps(value)) for key, value in items.items()]
+        with self._lock:
+            if self.path is None:
+                self._data.update({(session_id, key): value for key, value in items})
+            else:
+                with self._get_conn() as conn:
+                    conn.executemany('INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)',
+                                     [(session_id, key, value, time.time()) for key, value in items])
+
+    def _get_conn(self):
+        """ Returns the connection to the database of this process. Connections are not shared by forked workers. """
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS sessions (session_id TEXT, key TEXT, value TEXT, '
+                               'updated REAL, PRIMARY KEY (session_id, key))')
+            with self._conn:
+                self._conn.execute('DELETE FROM sessions WHERE session_id IN (SELECT session_id FROM sessions '
+                                   'GROUP BY session_id HAVING MAX(updated) < ?)', (time.time() - self.ttl,))
+            self._pid = os.getpid()
+        return self._conn
+
+
+def init_app(server):
+    """ Makes the Flask server assign a new session id to every request without one and send it as a cookie, so
+    browsers never share a session. """
+    @server.before_request
+    def get_session_cookie():
+        g.evalne_session_id = request.cookies.get(SESSION_COOKIE) or uuid.uuid4().hex
+
+    @server.after_request
+    def set_session_cookie(response):
+        if SESSION_COOKIE not in request.cookies:
+            response.set_cookie(SESSION_COOKIE, g.evalne_session_id, max_age=10 * 365 * 24 * 3600, httponly=True,
+                                samesite='Lax')
+        return response
+
+
+def get_session_id():
+    """ Returns the session id of the browser that issued the current request.
+
+    Raises
+    ------
+    RuntimeError
+        If called outside of a request, sessions are only defined for browsers.
+    """
+    if not has_request_context():
+        raise RuntimeError('Session ids are only available while handling a request')
+    return g.get('evalne_session_id') or request.cookies.get(SESSION_COOKIE)
+
+
+# Shared session store
+sessions = SessionStore()
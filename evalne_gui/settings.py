@@ -13,6 +13,7 @@ from dash import callback_context
 from dash import dcc, State, html
 from dash.dependencies import Input, Output
 from evalne_gui.init_values import *
+from evalne_gui.jobs import get_queue
 
 
 settings_layout = html.Div([
@@ -66,6 +67,59 @@ settings_layout = html.Div([
             html.Br(),
         ]
     ),
+    html.Br(),
+
+    # --------------------------
+    #      Job scheduling
+    # --------------------------
+    html.H3(children='Job Scheduling', className='section-title'),
+    html.Hr(className='sectionHr'),
+    html.Br(),
+
+    # Settings for the evaluation queue
+    html.Div(
+        className='plot-area',
+        children=[
+            html.Div(
+                children=[
+                    html.Label(['Max. number of concurrent evaluations:']),
+                    dcc.Input(id="ib-maxjobs", className='input-box', type="number", value=init_settings['ib-maxjobs'],
+                              min=1, step=1, persistence=True),
+                ],
+            ),
+            html.Br(),
+            html.Div(
+                children=[
+                    html.Label(['Min. free RAM (%) required to start a queued evaluation:']),
+                    dcc.Input(id="ib-minmem", className='input-box', type="number", value=init_settings['ib-minmem'],
+                              min=0, max=100, step=1, persistence=True),
+                ],
+            ),
+            html.Br(),
+            html.Div(
+                children=[
+                    html.Label(['Split evaluations into parallel sub-runs:']),
+                    dcc.Dropdown(
+                        id='split-dropdown',
+                        options=[{'label': 'Do not split', 'value': 'none'},
+                                 {'label': 'One sub-run per network', 'value': 'network'},
+                                 {'label': 'One sub-run per method', 'value': 'method'}],
+                        value=init_settings['split-dropdown'],
+                        persistence=True,
+                    ),
+                ],
+            ),
+            html.Br(),
+            html.Div(
+                children=[
+                    html.Label(['Max. number of parallel sub-runs per evaluation (core budget):']),
+                    dcc.Input(id="ib-parallel", className='input-box', type="number",
+                              value=init_settings['ib-parallel'], min=1, step=1, persistence=True),
+                ],
+            ),
+            html.Br(),
+        ]
+    ),
 
     # --------------------------
     #       Data storage
@@ -94,15 +148,26 @@ def refresh_config(data, nclick, old_data):
             res = [val for val in init_settings.values()]
             return res, json.dumps(res)
         else:
-            # Triggered when changing tabs/restarting
+            # Triggered when changing tabs/restarting, settings stored by older versions may lack some values
             od = json.loads(old_data)
-            return od, old_data
+            od += [val for val in init_settings.values()][len(od):]
+            return od, json.dumps(od)
     else:
         button_id = ctx.triggered[0]['prop_id'].split('.')[0]
         if button_id == 'set-default':
             # Triggered by user click
             res = [val for val in init_settings.values()]
-            return res, json.dumps(res)
         else:
             # Triggered when any value is changed in conf
-            return data, json.dumps(data)
+            res = data
+        if button_id in ('set-default', 'ib-maxjobs', 'ib-minmem'):
+            configure_queue(res)
+        return res, json.dumps(res)
+
+
+def configure_queue(settings):
+    """ Applies the job scheduling settings to the queue of the evaluation folder, if it exists. Queues of other
+    folders are configured when an evaluation is submitted to them. """
+    eval_path = os.getcwd() if settings[1] == '' else settings[1]
+    if os.path.isdir(eval_path) and settings[2] is not None and settings[3] is not None:
+        get_queue(eval_path).configure(settings[2], settings[3])
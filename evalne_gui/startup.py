@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import sys
+import time
+import subprocess
+
+
+def get_import_times(module='evalne_gui.index'):
+    """ Imports `module` in a fresh interpreter with `-X importtime` and returns the wall-clock time of the import in
+    seconds together with a list of (module name, self time, cumulative time) tuples, times in seconds. """
+    code = 'import time; t = time.perf_counter(); import {}; print(time.perf_counter() - t)'.format(module)
+    start = time.perf_counter()
+    res = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True)
+    if res.returncode != 0:
+        raise RuntimeError('Importing `{}` failed:\n{}'.format(module, res.stderr[-2000:]))
+    try:
+        total = float(res.stdout.strip().split('\n')[-1])
+    except ValueError:
+        total = time.perf_counter() - start
+
+    imports = []
+    for line in res.stderr.split('\n'):
+        # Lines look like `import time:       228 |        228 |   evalne_gui`, times in microseconds
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cum_us, name = line[len('import time:'):].split('|')
+        imports.append((name.strip(), int(self_us) / 1e6, int(cum_us) / 1e6))
+    return total, imports
+
+
+def startup_report(module='evalne_gui.index', top=15):
+    """ Returns a report of the time spent importing `module` and the top-level packages it pulls in. """
+    total, imports = get_import_times(module)
+    # Aggregate the self time of all submodules by top-level package
+    packages = dict()
+    for name, self_time, _ in imports:
+        pkg = name.split('.')[0]
+        packages[pkg] = packages.get(pkg, 0) + self_time
+    own = [(name, self_time, cum_time) for name, self_time, cum_time in imports if name.startswith('evalne_gui')]
+
+    lines = ['Cold import of `{}`: {:.3f} s'.format(module, total), '',
+             'Top {} packages by import time (self time summed over submodules):'.format(top)]
+    for pkg, t in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append('  {:<40} {:8.1f} ms'.format(pkg, t * 1000))
+    lines += ['', 'EvalNE-GUI modules (self / cumulative):']
+    for name, self_time, cum_time in own:
+        lines.append('  {:<40} {:8.1f} ms {:8.1f} ms'.format(name, self_time * 1000, cum_time * 1000))
+    return '\n'.join(lines)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import re
+import math
+import itertools
+from collections import OrderedDict
+
+
+# Config options that can be swept, with the dashboard field they set and their type
+SWEEP_PARAMS = OrderedDict({'LP_NUM_EDGE_SPLITS': ('ib-exprep', int),
+                            'NC_NUM_NODE_SPLITS': ('ib-rpnf', int),
+                            'NR_EDGE_SAMP_FRAC': ('ib-frace', float),
+                            'EMBED_DIM': ('ib-embdim', int),
+                            'TIMEOUT': ('ib-timeout', int),
+                            'SEED': ('ib-seed', int),
+                            'LP_MODEL': ('ib-lpmodel', str),
+                            'TRAINTEST_FRAC': ('ib-trainfrac', float),
+                            'TRAINVALID_FRAC': ('ib-validfrac', float),
+                            'FE_RATIO': ('ib-negratio', float)})
+
+# Maximum number of runs a sweep can generate
+MAX_SWEEP_RUNS = 1000
+
+
+def parse_sweep(text):
+    """ Parses a sweep definition with one `OPTION = values` line per swept option. Values are either a list split by
+    blanks (e.g. `EMBED_DIM = 64 128 256`), an inclusive range with step (e.g. `TRAINTEST_FRAC = 0.5:0.9:0.1`) or,
+    for random and Latin hypercube sweeps, a continuous range (e.g. `TRAINTEST_FRAC = 0.5:0.9`).
+
+    Returns
+    -------
+    params : OrderedDict
+        A dict mapping each option to a list of values or to a (low, high) tuple for continuous ranges.
+
+    Raises
+    ------
+    ValueError
+        If a line can not be parsed.
+    """
+    params = OrderedDict()
+    for line in text.split('\n'):
+        line = line.split('#')[0].strip()
+        if line == '':
+            continue
+        if '=' not in line:
+            raise ValueError('Sweep line `{}` should be of the form `OPTION = values`!'.format(line))
+        option, values = [val.strip() for val in line.split('=', 1)]
+        option = option.upper()
+        if option not in SWEEP_PARAMS:
+            raise ValueError('Option `{}` can not be swept! Accepted options are: {}.'
+                             .format(option, ', '.join(SWEEP_PARAMS.keys())))
+        dtype = SWEEP_PARAMS[option][1]
+        try:
+            if ':' in values and dtype is not str:
+                bounds = [dtype(val) for val in values.split(':')]
+                if len(bounds) == 3 and bounds[2] > 0:
+                    params[option] = get_range(*bounds)
+                elif len(bounds) == 2 and dtype is int:
+                    params[option] = list(range(bounds[0], bounds[1] + 1))
+                elif len(bounds) == 2:
+                    params[option] = (bounds[0], bounds[1])
+                else:
+                    raise ValueError
+            else:
+                params[option] = [dtype(val) for val in values.split()]
+        except ValueError:
+            raise ValueError('Incorrect values `{}` for option `{}`!'.format(values, option))
+        if len(params[option]) == 0:
+            raise ValueError('No values given for option `{}`!'.format(option))
+    return params
+
+
+def get_range(start, stop, step):
+    """ Returns the values from start to stop (inclusive) in increments of step. """
+    num = int(math.floor((stop - start) / step + 1e-9)) + 1
+    return [type(start)(round(start + i * step, 10)) for i in range(max(num, 0))]
+
+
+def expand_sweep(params, mode='grid', samples=10, seed=None):
+    """ Expands the parsed sweep into a list of dicts mapping each option to one value. Grid sweeps generate the
+    Cartesian product of all values. Random and Latin hypercube (`lhs`) sweeps draw `samples` combinations, with
+    duplicates removed.
+
+    Raises
+    ------
+    ValueError
+        If the sweep generates no or more than `MAX_SWEEP_RUNS` runs, or a continuous range is used in a grid sweep.
+    """
+    # Numpy is only needed here, importing it lazily speeds up the GUI startup
+    import numpy as np
+    options = list(params.keys())
+    rng = np.random.default_rng(seed)
+    if mode == 'grid':
+        if any(isinstance(params[option], tuple) for option in options):
+            raise ValueError('Grid sweeps require a step or a list of values for every option!')
+        num = int(np.prod([len(params[option]) for option in options]))
+        if num > MAX_SWEEP_RUNS:
+            raise ValueError('The sweep generates {} runs, the maximum is {}!'.format(num, MAX_SWEEP_RUNS))
+        combs = list(itertools.product(*[params[option] for option in options]))
+    elif mode in ('random', 'lhs'):
+        if samples > MAX_SWEEP_RUNS:
+            raise ValueError('The sweep generates {} runs, the maximum is {}!'.format(samples, MAX_SWEEP_RUNS))
+        cols = []
+        for option in options:
+            if mode == 'lhs':
+                # One sample in each of `samples` equally sized strata, in random order
+                u = (rng.permutation(samples) + rng.random(samples)) / samples
+            else:
+                u = rng.random(samples)
+            cols.append(get_values(params[option], u, SWEEP_PARAMS[option][1]))
+        combs = list(OrderedDict.fromkeys(zip(*cols)))
+    else:
+        raise ValueError('Unknown sweep mode `{}`!'.format(mode))
+    if len(options) == 0 or len(combs) == 0:
+        raise ValueError('The sweep does not generate any run!')
+    return [OrderedDict(zip(options, comb)) for comb in combs]
+
+
+def get_values(values, u, dtype):
+    """ Maps an array of numbers in [0, 1) to values of a list or of a continuous (low, high) range. """
+    if isinstance(values, tuple):
+        res = values[0] + u * (values[1] - values[0])
+        return [int(round(val)) if dtype is int else round(float(val), 6) for val in res]
+    return [values[int(i)] for i in u * len(values)]
+
+
+def apply_sweep(conf_dict, point):
+    """ Returns a copy of the dashboard config with the values of one point of the sweep set. """
+    conf_dict = dict(conf_dict)
+    for option, val in point.items():
+        key = SWEEP_PARAMS[option][0]
+        conf_dict[key] = '{}:1'.format(val) if key == 'ib-negratio' else val
+    return conf_dict
+
+
+def get_point_name(index, point):
+    """ Returns a folder safe name for a point of the sweep, e.g. `003_embed_dim=128_seed=1`. """
+    name = '_'.join('{}={}'.format(option.lower(), val) for option, val in point.items())
+    return '{:03d}_{}'.format(index, re.sub(r'[^\w.=-]', '_', name))
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import re
+import json
+import datetime
+import threading
+from collections import OrderedDict
+from evalne_gui.utils import LOG_TIME_FORMAT, get_state_dir, write_json
+from evalne_gui.catalog import catalog
+
+
+# Log lines parsed into events, as (kind, regex) tuples. The regex groups are the event arguments.
+EVENT_PATTERNS = (
+    ('start', re.compile(r'^Evaluation start$')),
+    ('end', re.compile(r'^Evaluation end')),
+    ('network', re.compile(r'^====== Evaluating (.+) network ======$')),
+    ('repeat', re.compile(r'^------ Repetition (\d+) of experiment ------$')),
+    ('tuned', re.compile(r'^Validation score for method `(.+)_(?:average|hadamard|weighted_l1|weighted_l2)` is')),
+    ('tuned', re.compile(r'^NC shuffle \d+: Validation score for `(.+)` is')),
+    ('failed', re.compile(r'^Exception occurred while evaluating (?:params? `.*` for )?method `(.+?)`')),
+    ('failed', re.compile(r'^NC shuffle \d+: All param combinations for `(.+)` have failed')),
+)
+
+# Number of bytes at the end of the parsed part of a log that are compared to detect rewritten logs
+TAIL_SIZE = 256
+
+LOG_LINE = re.compile(r'^(\d\d-\d\d-\d\d \d\d:\d\d:\d\d) - (\w+): (.*)$')
+
+# Phases of an evaluation that are not a method
+SETUP = 'Setup'
+PREPROCESS = 'Load & preprocess'
+SPLIT = 'Split, baselines & methods'
+SCORE = 'Train & score'
+
+
+class TimelineIndex(object):
+    """ Persistent and incremental index of the events logged by each run of an evaluation folder.
+
+    Each `eval.log` is parsed into a list of events, see `EVENT_PATTERNS`. The run catalog tells which logs have
+    changed, only those are read and only the bytes appended since the last update, so following a running evaluation
+    is cheap. Logs rewritten since they were parsed are detected by comparing the last bytes parsed and are parsed
+    again. The events of every run are kept in memory and mirrored to a json file in the GUI state folder, which is
+    written at most once per update.
+
+    Parameters
+    ----------
+    filename : string
+        Name of the json file where the index is persisted.
+    """
+
+    version = 2
+
+    def __init__(self, filename='timelines.json'):
+        self._filename = filename
+        self._cache = dict()
+        self._lock = threading.Lock()
+
+    def update(self, eval_path):
+        """ Brings the index of `eval_path` up to date and returns a dict mapping run names to the list of their
+        (time, kind, argument) events and the mtime of their log.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the evaluation folder does not exist.
+        """
+        runs = catalog.update(eval_path)
+        with self._lock:
+            index = self._get_index(eval_path)
+            changed = False
+            for name in set(index['runs']) - set(runs):
+                del index['runs'][name]
+                changed = True
+            for name, run in runs.items():
+                entry = index['runs'].get(name)
+                if run['log_size'] < 0 or (entry is not None and entry['size'] == run['log_size'] and
+                                           entry['mtime'] == run['log_mtime']):
+                    continue
+                try:
+                    with open(os.path.join(eval_path, name, 'eval.log'), 'rb') as f:
+                        entry = self._check_entry(f, entry, run['log_size'])
+                        f.seek(entry['offset'])
+                        data = f.read()
+                except FileNotFoundError:
+                    continue
+                # Only parse complete lines, the rest is read again on the next update
+                data = data[:data.rfind(b'\n') + 1]
+                offset = entry['offset'] + len(data)
+                tail = (bytes.fromhex(entry['tail']) + data[-TAIL_SIZE:])[-TAIL_SIZE:].hex()
+                index['runs'][name] = {'offset': offset,
+                                       'tail': tail,
+                                       'events': entry['events'] + parse_events(data.decode('utf-8', errors='replace')),
+                                       'size': run['log_size'],
+                                       'mtime': run['log_mtime']}
+                changed = True
+            if changed:
+                try:
+                    write_json(os.path.join(get_state_dir(eval_path), self._filename), index)
+                except OSError:
+                    pass
+            return {name: (entry['events'], entry['mtime'] / 1e9) for name, entry in index['runs'].items()}
+
+    @staticmethod
+    def _check_entry(f, entry, size):
+        """ Returns the entry of a log if the bytes it has parsed are still the start of the log, or an empty entry
+        if the log is new, truncated or rewritten. Logs of split evaluations are rewritten with more content when a
+        sub-run finishes, see `JobQueue._merge_group`, so comparing the sizes is not enough. """
+        empty = {'offset': 0, 'tail': '', 'events': []}
+        if entry is None or size < entry['offset']:
+            return empty
+        tail = bytes.fromhex(entry['tail'])
+        f.seek(entry['offset'] - len(tail))
+        if f.read(len(tail)) != tail:
+            return empty
+        return entry
+
+    def _get_index(self, eval_path):
+        """ Returns the index of `eval_path`, reading the persisted one the first time. """
+        index = self._cache.get(eval_path)
+        if index is None:
+            try:
+                with open(os.path.join(eval_path, '.evalne_gui', self._filename)) as f:
+                    index = json.load(f)
+                if index.get('version') != self.version:
+                    index = None
+            except (OSError, ValueError):
+                pass
+            if index is None:
+                index = {'version': self.version, 'runs': dict()}
+            self._cache[eval_path] = index
+        return index
+
+
+def parse_events(text):
+    """ Returns the (time, kind, argument) events in the text of an EvalNE log. Lines without a timestamp, e.g. the
+    tracebacks of exceptions, and lines with other messages are skipped. """
+    events = []
+    for line in text.split('\n'):
+        match = LOG_LINE.match(line.rstrip('\r'))
+        if match is None:
+            continue
+        for kind, pattern in EVENT_PATTERNS:
+            event = pattern.match(match.group(3))
+            if event is not None:
+                t = datetime.datetime.strptime(match.group(1), LOG_TIME_FORMAT).timestamp()
+                events.append((t, kind, event.group(1) if event.groups() else None))
+                break
+    return events
+
+
+def get_timeline(events, end_time=None):
+    """ Turns the events of a run into a list of phases, each a dict with its `lane` (the network evaluated), `name`
+    (a method or one of the other phases) and `start` and `end` times.
+
+    EvalNE only logs when a network or repetition starts and when the tuning of a method finishes or fails, so a method
+    phase spans from the previous event to its last validation score or error. The edge split, the baselines and the
+    methods that are not tuned are part of the phase before it, the training of the last tuned method on the full
+    train split and the scoring make up the `Train & score` phase. Phases still running end at `end_time`.
+    """
+    phases = []
+    sub_runs = sum(1 for event in events if event[1] == 'start')
+    sub_run, network = 0, None
+    current = None
+
+    def close(t, name=None):
+        if current is None:
+            return
+        lane, default, start = current
+        name = name or default
+        last = phases[-1] if len(phases) else None
+        if last is not None and last['lane'] == lane and last['name'] == name and last['end'] == start:
+            # Several validation scores or errors of the same method
+            last['end'] = t
+        else:
+            phases.append({'lane': lane, 'name': name, 'start': start, 'end': t})
+
+    def lane():
+        name = network or SETUP
+        return name if sub_runs < 2 else '{}: {}'.format(sub_run, name)
+
+    for t, kind, arg in events:
+        if kind == 'start':
+            close(t)
+            sub_run += 1
+            network = None
+            current = (lane(), SETUP, t)
+        elif kind == 'end':
+            close(t)
+            current = None
+        elif kind == 'network':
+            close(t)
+            network = arg
+            current = (lane(), PREPROCESS, t)
+        elif kind == 'repeat':
+            close(t)
+            current = (lane(), SPLIT, t)
+        elif current is not None:
+            # A method has been tuned or has failed, what follows is the next method or the final training
+            close(t, arg if kind == 'tuned' else '{} (failed)'.format(arg))
+            current = (current[0], SCORE, t)
+    if current is not None and end_time is not None:
+        close(max(end_time, current[2]))
+    return phases
+
+
+def get_method_times(timelines):
+    """ Returns an ordered dict with the total time in seconds spent in each phase over a list of timelines, longest
+    first. """
+    totals = dict()
+    for phases in timelines:
+        for phase in phases:
+            totals[phase['name']] = totals.get(phase['name'], 0) + phase['end'] - phase['start']
+    return OrderedDict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+# Shared timeline index
+timelines = TimelineIndex()
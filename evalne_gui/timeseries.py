@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import threading
+from collections import deque
+
+
+class TimeSeriesStore(object):
+    """ In-memory multi-resolution store for a set of numeric time series sampled together.
+
+    Samples are kept at full resolution in the first tier and averaged into fixed size buckets in the following ones.
+    Each tier has a bounded number of points, so memory usage is constant regardless of how long the GUI runs.
+
+    Parameters
+    ----------
+    names : list of strings
+        The names of the series stored.
+    retention : tuple of tuples
+        A (resolution in seconds, number of points) tuple per tier, finest first. The resolution of the first tier is
+        the sampling interval. Default keeps 1 sec. samples for an hour and 1 min. averages for a week.
+
+    Examples
+    --------
+    Store two samples and read them back:
+
+    >>> ts = TimeSeriesStore(['cpu'])
+    >>> ts.add(0, {'cpu': 10})
+    >>> ts.add(1, {'cpu': 20})
+    >>> ts.window(0)
+    (1, [0, 1], {'cpu': [10, 20]})
+
+    """
+
+    def __init__(self, names, retention=((1, 3600), (60, 7 * 24 * 60))):
+        self.names = list(names)
+        self._lock = threading.Lock()
+        self._tiers = []
+        for resolution, maxlen in retention:
+            self._tiers.append({'resolution': resolution,
+                                'time': deque(maxlen=maxlen),
+                                'values': {name: deque(maxlen=maxlen) for name in self.names},
+                                'bucket': None,
+                                'sums': dict.fromkeys(self.names, 0.0),
+                                'count': 0})
+
+    def add(self, t, values):
+        """ Adds a sample taken at time `t` (in seconds) with the given dict of values. """
+        with self._lock:
+            self._append(self._tiers[0], t, values)
+            for tier in self._tiers[1:]:
+                bucket = t - t % tier['resolution']
+                if tier['bucket'] is not None and bucket != tier['bucket']:
+                    # The previous bucket is complete, store its average
+                    self._append(tier, tier['bucket'], {name: tier['sums'][name] / tier['count']
+                                                        for name in self.names})
+                    tier['sums'] = dict.fromkeys(self.names, 0.0)
+                    tier['count'] = 0
+                tier['bucket'] = bucket
+                for name in self.names:
+                    tier['sums'][name] += values[name]
+                tier['count'] += 1
+
+    def window(self, start, end=None):
+        """ Returns the resolution, times and values of the samples in [start, end] from the finest tier that covers
+        the window. If no tier covers it, the tier with the oldest data is used. """
+        with self._lock:
+            tier = self._select_tier(start)
+            times, values = self._slice(tier, start, end)
+            return tier['resolution'], times, values
+
+    def resolution(self, start):
+        """ Returns the resolution of the tier used by `window` for a window starting at `start`. """
+        with self._lock:
+            return self._select_tier(start)['resolution']
+
+    def maxlen(self, resolution):
+        """ Returns the maximum number of points stored at the given resolution. """
+        for tier in self._tiers:
+            if tier['resolution'] == resolution:
+                return tier['time'].maxlen
+        raise ValueError('No tier with resolution {}'.format(resolution))
+
+    def since(self, resolution, start):
+        """ Returns the times and values of the samples strictly newer than `start` stored at the given resolution. """
+        with self._lock:
+            for tier in self._tiers:
+                if tier['resolution'] == resolution:
+                    return self._slice(tier, start, None, strict=True)
+            raise ValueError('No tier with resolution {}'.format(resolution))
+
+    def _select_tier(self, start):
+        candidates = [tier for tier in self._tiers if len(tier['time']) > 0]
+        if len(candidates) == 0:
+            return self._tiers[0]
+        for tier in candidates:
+            # A tier that is not full yet holds all the samples taken so far. A full one covers the window if its
+            # oldest sample is at most one sample newer than the start, e.g. the last hour of a one hour tier.
+            if tier['time'][0] <= start + tier['resolution'] or len(tier['time']) < tier['time'].maxlen:
+                return tier
+        return min(candidates, key=lambda tier: tier['time'][0])
+
+    def _slice(self, tier, start, end, strict=False):
+        times = []
+        values = [[] for _ in self.names]
+        # Walk backwards from the newest sample, windows are usually much shorter than the retention
+        series = [reversed(tier['values'][name]) for name in self.names]
+        for t, *vals in zip(reversed(tier['time']), *series):
+            if t < start or (strict and t == start):
+                break
+            if end is not None and t > end:
+                continue
+            times.append(t)
+            for lst, val in zip(values, vals):
+                lst.append(val)
+        times.reverse()
+        return times, {name: lst[::-1] for name, lst in zip(self.names, values)}
+
+    @staticmethod
+    def _append(tier, t, values):
+        tier['time'].append(t)
+        for name, series in tier['values'].items():
+            series.append(values[name])
@@ -6,33 +6,71 @@
 
 import io
 import os
+import re
+import copy
+import json
 import shlex
 import psutil
 import base64
-import datetime
+import hashlib
+import binascii
+import threading
 import configparser
-import numpy as np
-from subprocess import Popen, run
+from subprocess import run
 from collections import OrderedDict
-from evalne_gui.procinfo import EvalneProc
-from evalne_gui.init_values import init_vals
+from evalne_gui.config import EvalConfig
+from evalne_gui.procinfo import EvalneProc, registry
+
+
+# Format of the timestamps in EvalNE logs e.g. `22-03-21 15:30:05 - INFO: Evaluation start`
+LOG_TIME_FORMAT = '%d-%m-%y %H:%M:%S'
+
+# Number of parsed config files kept in memory, keyed by content hash
+CONFIG_CACHE_SIZE = 32
+_config_cache = OrderedDict()
+_config_cache_lock = threading.Lock()
 
 
 def get_ui_proc():
     return EvalneProc(psutil.Process())
 
 
-def get_evalne_proc():
-    p = search_process('-m evalne')
-    return EvalneProc(p)
+def get_evalne_proc(eval_path=None):
+    """ Returns the latest EvalNE process started from the given evaluation folder. If no folder is provided, the
+    latest EvalNE process started by the GUI is returned. """
+    if eval_path is None:
+        return EvalneProc(registry.latest())
+    return EvalneProc(registry.latest(get_jobs_dir(eval_path)))
+
+
+def get_state_dir(eval_path):
+    """ Returns the folder, inside the evaluation folder, where the GUI keeps its indices and caches. """
+    path = os.path.join(eval_path, '.evalne_gui')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def get_jobs_dir(eval_path):
+    """ Returns the folder where the evaluation jobs, their pidfiles and console outputs are stored. """
+    path = os.path.join(get_state_dir(eval_path), 'jobs')
+    os.makedirs(path, exist_ok=True)
+    return path
 
 
-def search_process(process_name):
-    """ Searches for a running process with the provided name. """
-    for proc in psutil.process_iter():
-        if process_name in shlex.join(proc.cmdline()):
-            return proc
-    return None
+def write_json(path, data):
+    """ Atomically writes `data` as json to `path`, so readers never see a partially written file. """
+    tmp = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def write_text(path, text):
+    """ Atomically writes a string to `path`, so readers never see a partially written file. """
+    tmp = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp, 'w') as f:
+        f.write(text)
+    os.replace(tmp, path)
 
 
 def evalne_installed(exec_path):
@@ -61,324 +99,134 @@ def import_config_file(contents):
     return config
 
 
+def parse_config(contents):
+    """ Decodes and parses an uploaded config file into an `EvalConfig`. Results are cached by content hash so the
+    callbacks handling the same upload share a single parse.
+
+    Raises
+    ------
+    ValueError
+        If the contents are not a valid EvalNE config file.
+    """
+    key = hashlib.sha1(contents.encode('utf-8')).hexdigest()
+    with _config_cache_lock:
+        if key in _config_cache:
+            _config_cache.move_to_end(key)
+            res = _config_cache[key]
+        else:
+            try:
+                res = EvalConfig.from_parser(import_config_file(contents))
+            except (ValueError, UnicodeDecodeError, configparser.Error, binascii.Error) as e:
+                res = ValueError('Invalid config file: {}'.format(e))
+            _config_cache[key] = res
+            if len(_config_cache) > CONFIG_CACHE_SIZE:
+                _config_cache.popitem(last=False)
+    if isinstance(res, ValueError):
+        raise res
+    # Callers may modify the values, so they get their own copy
+    return copy.deepcopy(res)
+
+
+def is_valid_config(contents):
+    """ Returns True if the contents of an uploaded file are a valid EvalNE config file. """
+    try:
+        parse_config(contents)
+        return True
+    except ValueError:
+        return False
+
+
 def get_config_vals(contents):
     """ Reads an input conf file and returns the values found as a list. Does not return NE method related values. """
-    # Read the config file
-    config = import_config_file(contents)
-
-    # Parse baselines
-    bl_1, bl_2 = parse_bl(config.get('BASELINES', 'lp_baselines'))
-
-    conf_vals = OrderedDict({'task-dropdown': config.get('GENERAL', 'task'),
-                             'ee-dropdown': parse_list(
-                                 config.get('GENERAL', 'edge_embedding_methods'), init_vals['ee-dropdown']),
-                             'ib-exprep': parse_val(
-                                 config.get('GENERAL', 'lp_num_edge_splits'), init_vals['ib-exprep'], int),
-                             'ib-frace': parse_val(
-                                 config.get('GENERAL', 'nr_edge_samp_frac'), init_vals['ib-frace'], float),
-                             'ib-rpnf': parse_val(
-                                 config.get('GENERAL', 'nc_num_node_splits'), init_vals['ib-rpnf'], int),
-                             'ib-fracn': config.get('GENERAL', 'nc_node_fracs'),
-                             'ib-lpmodel': config.get('GENERAL', 'lp_model'),
-                             'ib-embdim': parse_val(
-                                 config.get('GENERAL', 'embed_dim'), init_vals['ib-embdim'], int),
-                             'ib-timeout': parse_val(
-                                 config.get('GENERAL', 'timeout'), init_vals['ib-timeout'], int),
-                             'ib-seed': parse_val(
-                                 config.get('GENERAL', 'seed'), init_vals['ib-seed'], int),
-                             'ib-trainfrac': parse_val(
-                                 config.get('EDGESPLIT', 'traintest_frac'), init_vals['ib-trainfrac'], float),
-                             'ib-validfrac': parse_val(
-                                 config.get('EDGESPLIT', 'trainvalid_frac'), init_vals['ib-validfrac'], float),
-                             'splitalg-dropdown': config.get('EDGESPLIT', 'split_alg'),
-                             'negsamp-dropdown': 'ow' if config.getboolean('EDGESPLIT', 'owa') else 'cw',
-                             'ib-negratio': '1:1' if config.get('EDGESPLIT', 'fe_ratio') == ''
-                             else '{}:1'.format(config.get('EDGESPLIT', 'fe_ratio')),
-                             'ib-nwnames': config.get('NETWORKS', 'names'),
-                             'network-paths': config.get('NETWORKS', 'inpaths'),
-                             'network-nodelabels': config.get('NETWORKS', 'labelpaths'),
-                             'network-types': 'dir' if config.getboolean('NETWORKS', 'directed') else 'undir',
-                             'ib-separator': config.get('NETWORKS', 'separators'),
-                             'ib-comment': config.get('NETWORKS', 'comments'),
-                             'nw-prep-checklist': ['rel' if config.getboolean('PREPROCESSING', 'relabel') else '',
-                                                   'selfloops' if config.getboolean('PREPROCESSING', 'del_selfloops') else ''],
-                             'nw-prep-checklist2': ['save' if config.getboolean('PREPROCESSING', 'save_prep_nw') else '',
-                                                    'stats' if config.getboolean('PREPROCESSING', 'write_stats') else ''],
-                             'input-prep-delim': config.get('PREPROCESSING', 'delimiter'),
-                             'baselines-checklist': bl_1,
-                             'baselines-checklist2': bl_2,
-                             'neighbourhood-dropdown': config.get('BASELINES', 'neighbourhood'),
-                             'maximize-dropdown': config.get('REPORT', 'maximize'),
-                             'scores-dropdown': config.get('REPORT', 'scores'),
-                             'curves-dropdown': config.get('REPORT', 'curves'),
-                             'ib-precatk': config.get('REPORT', 'precatk_vals')})
-
-    return [val for val in conf_vals.values()]
+    return list(parse_config(contents).to_values()[0].values())
 
 
 def get_config_methods(contents):
     """ Reads an input config file and returns the NE method parameter values as a list. """
-    # Read the config file
-    config = import_config_file(contents)
-
-    num_other_methods = len(config.get('OTHER METHODS', 'names_other').split())
-    tune_params = pop_empty_line(config.get('OTHER METHODS', 'tune_params_other').split('\n'))
-    tune_params.extend([''] * (num_other_methods - len(tune_params)))
-
-    method_vals = OrderedDict({'m-lib-dropdown': ['other'] * num_other_methods,
-                               'm-name': config.get('OTHER METHODS', 'names_other').split(),
-                               'm-type-dropdown': config.get('OTHER METHODS', 'embtype_other').split(),
-                               'm-opts': parse_opts(config.get('OTHER METHODS', 'write_weights_other'),
-                                                    config.get('OTHER METHODS', 'write_dir_other')),
-                               'm-cmd': pop_empty_line(config.get('OTHER METHODS', 'methods_other').split('\n')),
-                               'm-tune': tune_params,
-                               'm-input-delim': config.get('OTHER METHODS', 'input_delim_other').split(),
-                               'm-output-delim': config.get('OTHER METHODS', 'output_delim_other').split()})
-
-    # Add the opne methods
-    num_opne_methods = len(config.get('OPENNE METHODS', 'names_opne').split())
-    tune_opne = pop_empty_line(config.get('OPENNE METHODS', 'tune_params_opne').split('\n'))
-    tune_opne.extend([''] * (num_opne_methods - len(tune_opne)))
-
-    method_vals['m-lib-dropdown'].extend(['opne'] * num_opne_methods)
-    method_vals['m-name'].extend(config.get('OPENNE METHODS', 'names_opne').split())
-    method_vals['m-type-dropdown'].extend(['ne'] * num_opne_methods)
-    method_vals['m-opts'].extend([('', '') for val in range(num_opne_methods)])
-    method_vals['m-cmd'].extend(pop_empty_line(config.get('OPENNE METHODS', 'methods_opne').split('\n')))
-    method_vals['m-tune'].extend(tune_opne)
-    method_vals['m-input-delim'].extend([' '] * num_opne_methods)
-    method_vals['m-output-delim'].extend([' '] * num_opne_methods)
-
-    return [val for val in method_vals.values()]
-
-
-def pop_empty_line(lst):
-    if lst[-1] == '':
-        return lst[:-1]
-    return lst
+    return list(parse_config(contents).to_values()[1].values())
 
 
 def get_num_methods(contents):
     """ Reads an input config file and returns the number of NE methods. """
-    # Read the config file
-    config = import_config_file(contents)
-    num_methods = len(config.get('OTHER METHODS', 'names_other').split()) + \
-                  len(config.get('OPENNE METHODS', 'names_opne').split())
-    return num_methods
-
-
-def parse_opts(str_weights, str_dir):
-    """ Parses config file strings and returns a list of tuples for write weights and write dir. """
-    l1 = str_weights.lower().split()
-    l2 = str_dir.lower().split()
-    if len(l1) == 0:
-        res = []
-    else:
-        for i in range(len(l1)):
-            l1[i] = 'weights' if l1[i] == 'true' else ''
-            l2[i] = 'dir' if l1[i] == 'true' else ''
-    res = list(zip(l1, l2))
-    return res
-
-
-def parse_bl(str_val):
-    """ Parse the baselines string into two lists with the appropriate methods. If katz includes a numerical value
-     it will also add that as a method which is incorrect. """
-    lst = str_val.split()
-    lst1 = []
-    lst2 = []
-    for l in lst:
-        if 'common' in l or 'jaccard' in l or 'adamic' in l or 'cosine' in l or 'resource' in l or 'preferential' in l:
-            lst1.append(l)
-        else:
-            lst2.append(l)
-    return lst1, lst2
-
-
-def parse_val(str_val, default_val, dtype):
-    """ Parses a string as the specified type or returns a default value if string is empty. """
-    if str_val == '' or str_val.lower() == 'none':
-        res = default_val
-    else:
-        res = dtype(str_val)
-    return res
-
-
-def parse_list(str_list, default_val, dtype=str):
-    """ Parses a string as a list of objects of given type. A default values is returned if the string is empty. """
-    lst = str_list.split()
-    if len(lst) == 0 or lst[0] == '' or lst[0] == 'None':
-        res = default_val
-    else:
-        res = list(map(dtype, lst))
-    return res
+    return parse_config(contents).num_methods
 
 
 def export_config_file(conf_path, conf_dict, methods_dict):
     """ Creates an EvalNE config file and populates options with the provided input values. """
-    # Split method dict in opne and non-opne methods
-    opne_dict, other_dict = split_method_types(methods_dict)
+    EvalConfig.from_values(conf_dict, methods_dict).write(conf_path)
 
-    config = configparser.ConfigParser()
-    config.optionxform = str
-    config['GENERAL'] = {'TASK': conf_dict['task-dropdown'],
-                         'LP_NUM_EDGE_SPLITS': get_edge_splits(conf_dict),
-                         'NC_NUM_NODE_SPLITS': conf_dict['ib-rpnf'] if conf_dict['task-dropdown'] == 'nc' else '',
-                         'NC_NODE_FRACS': get_node_fracs(conf_dict),
-                         'NR_EDGE_SAMP_FRAC': conf_dict['ib-frace'] if conf_dict['task-dropdown'] == 'nr' else '',
-                         'EDGE_EMBEDDING_METHODS': '' if conf_dict['task-dropdown'] == 'nc'
-                         else get_list(conf_dict['ee-dropdown'], ' '),
-                         'LP_MODEL': conf_dict['ib-lpmodel'],
-                         'EMBED_DIM': conf_dict['ib-embdim'],
-                         'TIMEOUT': '' if conf_dict['ib-timeout'] == 0 else conf_dict['ib-timeout'],
-                         'VERBOSE': 'False',
-                         'SEED': conf_dict['ib-seed']}
-    config['NETWORKS'] = {'NAMES': conf_dict['ib-nwnames'],
-                          'INPATHS': conf_dict['network-paths'],
-                          'DIRECTED': 'True' if conf_dict['network-types'] == 'dir' else 'False',
-                          'SEPARATORS': conf_dict['ib-separator'],
-                          'COMMENTS': conf_dict['ib-comment'],
-                          'LABELPATHS': conf_dict['network-nodelabels']}
-    config['PREPROCESSING'] = {'RELABEL': 'True' if 'rel' in conf_dict['nw-prep-checklist'] else 'False',
-                               'DEL_SELFLOOPS': 'True' if 'selfloops' in conf_dict['nw-prep-checklist'] else 'False',
-                               'SAVE_PREP_NW': 'True' if 'save' in conf_dict['nw-prep-checklist2'] else 'False',
-                               'WRITE_STATS': 'True' if 'stats' in conf_dict['nw-prep-checklist2'] else 'False',
-                               'DELIMITER': conf_dict['input-prep-delim']}
-    config['EDGESPLIT'] = {'TRAINTEST_FRAC': conf_dict['ib-trainfrac'],
-                           'TRAINVALID_FRAC': conf_dict['ib-validfrac'],
-                           'SPLIT_ALG': conf_dict['splitalg-dropdown'],
-                           'OWA': 'True' if conf_dict['negsamp-dropdown'] == 'ow' else 'False',
-                           'FE_RATIO': float(conf_dict['ib-negratio'].split(':')[0])}
-    config['BASELINES'] = {'LP_BASELINES': get_list(conf_dict['baselines-checklist']+conf_dict['baselines-checklist2'],
-                                                    '\n'),
-                           'NEIGHBOURHOOD': conf_dict['neighbourhood-dropdown']}
-    config['OPENNE METHODS'] = opne_dict
-    config['OTHER METHODS'] = other_dict
-    config['REPORT'] = {'MAXIMIZE': conf_dict['maximize-dropdown'],
-                        'SCORES': conf_dict['scores-dropdown'],
-                        'CURVES': '' if conf_dict['curves-dropdown'] == 'none' else conf_dict['curves-dropdown'],
-                        'PRECATK_VALS': conf_dict['ib-precatk']}
-    with open(conf_path, 'w') as configfile:
-        config.write(configfile)
-
-
-def get_node_fracs(conf_dict):
-    """ For NC tasks converts % of train nodes to a fraction in [0-1). Returns an empty string for other tasks. """
-    if conf_dict['task-dropdown'] == 'nc':
-        aux = []
-        for val in conf_dict['ib-fracn'].split():
-            if int(val) > 1.0:
-                aux.append(str(int(val) / 100))
-            else:
-                aux.append(val)
-        res = ' '.join(aux)
-    else:
-        res = ''
-    return res
-
-
-def get_edge_splits(conf_dict):
-    """ Returns the number of experiment repeats for LP and SP tasks and an empty string for the rest. """
-    if conf_dict['task-dropdown'] == 'nc' or conf_dict['task-dropdown'] == 'nr':
-        res = ''
-    else:
-        res = conf_dict['ib-exprep']
-    return res
 
-
-def get_list(lst, joinchar):
-    """ Given a list of values and a separator character returns a string representation of the list. """
-    return '' if len(lst) == 0 else joinchar.join(lst)
-
-
-def split_method_types(methods_dict):
-    """ Given a dict of confing method parameters and values returns two dicts for OpenNE and non-OpenNE methods."""
-    if len(methods_dict['m-lib-dropdown']) == 0:
-        # No methods to evaluate
-        opne_dict = {'NAMES_OPNE': '', 'METHODS_OPNE': '', 'TUNE_PARAMS_OPNE': ''}
-        other_dict = {'NAMES_OTHER': '', 'EMBTYPE_OTHER': '', 'WRITE_WEIGHTS_OTHER': '', 'WRITE_DIR_OTHER': '',
-                      'METHODS_OTHER': '', 'TUNE_PARAMS_OTHER': '', 'INPUT_DELIM_OTHER': '', 'OUTPUT_DELIM_OTHER': ''}
-    else:
-        # Ignore methods where name and cmd call are empty
-        empty_name = np.array(methods_dict['m-name']) == ''
-        empty_cmd = np.array(methods_dict['m-cmd']) == ''
-        ignore = empty_name * empty_cmd
-
-        if np.sum(ignore) == len(methods_dict['m-lib-dropdown']):
-            # No methods to evaluate
-            opne_dict = {'NAMES_OPNE': '', 'METHODS_OPNE': '', 'TUNE_PARAMS_OPNE': ''}
-            other_dict = {'NAMES_OTHER': '', 'EMBTYPE_OTHER': '', 'WRITE_WEIGHTS_OTHER': '', 'WRITE_DIR_OTHER': '',
-                          'METHODS_OTHER': '', 'TUNE_PARAMS_OTHER': '', 'INPUT_DELIM_OTHER': '',
-                          'OUTPUT_DELIM_OTHER': ''}
-        else:
-            # Get indices of opne methods
-            isopne = np.array(methods_dict['m-lib-dropdown']) == 'opne'
-            mask = isopne * ~ignore
-            invmask = ~isopne * ~ignore
-
-            # Fill the opne dict
-            opne_dict = {'NAMES_OPNE': get_list(np.array(methods_dict['m-name'])[mask], ' '),
-                         'METHODS_OPNE': get_list(np.array(methods_dict['m-cmd'])[mask], '\n'),
-                         'TUNE_PARAMS_OPNE': get_list(np.array(methods_dict['m-tune'])[mask], '\n')}
-
-            # Fill the others dict
-            other_dict = {'NAMES_OTHER': get_list(np.array(methods_dict['m-name'])[invmask], ' '),
-                          'EMBTYPE_OTHER': get_list(np.array(methods_dict['m-type-dropdown'])[invmask], ' '),
-                          'WRITE_WEIGHTS_OTHER': proc_nested_lists('weights',
-                                                                   np.array(methods_dict['m-opts'], dtype=object)[invmask]),
-                          'WRITE_DIR_OTHER': proc_nested_lists('dir',
-                                                               np.array(methods_dict['m-opts'], dtype=object)[invmask]),
-                          'METHODS_OTHER': get_list(np.array(methods_dict['m-cmd'])[invmask], '\n'),
-                          'TUNE_PARAMS_OTHER': get_list(np.array(methods_dict['m-tune'])[invmask], '\n'),
-                          'INPUT_DELIM_OTHER': get_list(np.array(methods_dict['m-input-delim'])[invmask], ' '),
-                          'OUTPUT_DELIM_OTHER': get_list(np.array(methods_dict['m-output-delim'])[invmask], ' ')}
-
-    return opne_dict, other_dict
-
-
-def proc_nested_lists(val, lst):
-    """ Given an input list of lists and value returns a string of True/False indicating if val is in a sublist. """
+def split_config(conf_dict, methods_dict, split_by='network'):
+    """ Splits a config into one sub-config per network or per method (with the baselines as an extra sub-config).
+    Returns a list of (name, conf_dict, methods_dict) tuples. If the config can not be split, the list only contains
+    the original config with an empty name. """
     res = []
-    for l in lst:
-        res.append(str(val in l))
-    return get_list(res, ' ')
-
-
-def get_logged_evals(path):
-    res = []
-    for fname in sorted(os.listdir(path), reverse=True):
-        aux = []
-        if '_eval_' in fname:
-            # Get filename
-            aux.append(fname)
-
-            fpath = os.path.join(path, fname)
-            logpath = os.path.join(fpath, 'eval.log')
-            with open(logpath) as f:
-                content = f.read()
-                content = content.strip().split('\n')
-                # Get status
-                if 'Evaluation end' in content[-1]:
-                    aux.append('Finished')
-                else:
-                    if len(res) == 0 and get_evalne_proc().running():
-                        aux.append('Running')
-                    else:
-                        aux.append('Failed')
-                # Get runtime
-                start_time = content[0].split(' - ')[0]
-                end_time = content[-1].split(' - ')[0]
-                std = datetime.datetime.strptime(start_time, '%d-%m-%y %H:%M:%S')
-                etd = datetime.datetime.strptime(end_time, '%d-%m-%y %H:%M:%S')
-                aux.append(str(etd - std))
-
-                # Get start time
-                aux.append(start_time)
-
-                # Get end time
-                aux.append(end_time)
-            res.append(aux)
-    return res
+    if split_by == 'network':
+        names = conf_dict['ib-nwnames'].split()
+        paths = [path for path in conf_dict['network-paths'].split('\n') if path.strip() != '']
+        labels = [path for path in conf_dict['network-nodelabels'].split('\n') if path.strip() != '']
+        seps = conf_dict['ib-separator'].split()
+        comments = conf_dict['ib-comment'].split()
+        if len(names) < 2 or any(len(lst) != len(names) for lst in (paths, seps, comments)) or \
+                len(labels) not in (0, len(names)):
+            # Let EvalNE report the inconsistent config
+            return [('', conf_dict, methods_dict)]
+        for i, name in enumerate(names):
+            sub_conf = dict(conf_dict)
+            sub_conf.update({'ib-nwnames': name,
+                             'network-paths': paths[i],
+                             'network-nodelabels': labels[i] if len(labels) else '',
+                             'ib-separator': seps[i],
+                             'ib-comment': comments[i]})
+            res.append((name, sub_conf, methods_dict))
+    elif split_by == 'method':
+        methods = [i for i in range(len(methods_dict['m-lib-dropdown']))
+                   if methods_dict['m-name'][i] != '' or methods_dict['m-cmd'][i] != '']
+        baselines = conf_dict['baselines-checklist'] + conf_dict['baselines-checklist2']
+        if len(methods) + (len(baselines) > 0) < 2:
+            return [('', conf_dict, methods_dict)]
+        no_baselines = dict(conf_dict, **{'baselines-checklist': [], 'baselines-checklist2': []})
+        for i in methods:
+            sub_methods = OrderedDict((key, [val[i]]) for key, val in methods_dict.items())
+            res.append((methods_dict['m-name'][i] or 'method_{}'.format(i), no_baselines, sub_methods))
+        if len(baselines):
+            res.append(('baselines', conf_dict, OrderedDict((key, []) for key in methods_dict.keys())))
+    else:
+        return [('', conf_dict, methods_dict)]
+
+    # Names are used as folder names, so make them safe and unique
+    names = []
+    for name, sub_conf, sub_methods in res:
+        name = re.sub(r'[^\w.-]', '_', name)
+        while name in names:
+            name += '_'
+        names.append(name)
+    return [(name, sub_conf, sub_methods) for name, (_, sub_conf, sub_methods) in zip(names, res)]
+
+
+def make_paths_absolute(conf_dict, methods_dict, base):
+    """ Returns copies of the config and method values where the network and label paths and the files referenced by
+    the method commands are absolute. Relative paths are resolved from `base`, the folder EvalNE runs from when the
+    config is not split. Sub-runs run from their own folder, so their configs can not contain relative paths. """
+    def resolve(path):
+        path = path.strip()
+        return path if path == '' or os.path.isabs(path) else os.path.normpath(os.path.join(base, path))
+
+    def resolve_cmd(cmd):
+        # Only replace the plain arguments that are existing files, placeholders and quoted arguments are kept as is
+        def replace(match):
+            arg = match.group(0)
+            if os.path.isabs(arg) or any(c in arg for c in '{}\'"') or not os.path.exists(os.path.join(base, arg)):
+                return arg
+            return resolve(arg)
+        return re.sub(r'\S+', replace, cmd or '')
+
+    conf_dict = dict(conf_dict)
+    for key in ('network-paths', 'network-nodelabels'):
+        conf_dict[key] = '\n'.join(resolve(path) for path in conf_dict[key].split('\n') if path.strip() != '')
+    methods_dict = OrderedDict(methods_dict)
+    methods_dict['m-cmd'] = [resolve_cmd(cmd) for cmd in methods_dict['m-cmd']]
+    return conf_dict, methods_dict
 
 
 def read_file(path, filename, console=False):
@@ -392,3 +240,79 @@ def read_file(path, filename, console=False):
             return 'Output not found! Start an evaluation to monitor its output...'
         else:
             return 'File not found! Evaluation is still running or has failed...'
+
+
+def read_first_line(fpath):
+    """ Returns the first line of a text file without the trailing newline. """
+    with open(fpath, 'rb') as f:
+        return f.readline().decode('utf-8', errors='replace').rstrip('\r\n')
+
+
+def read_last_lines(fpath, predicate=None, block_size=4096):
+    """ Returns the last non-empty line of a text file and the last line satisfying `predicate`. The file is read
+    backwards in blocks, so only the tail needs to be read in most cases. """
+    with open(fpath, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b''
+        last = None
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            lines = buf.split(b'\n')
+            # The first line in the buffer may be incomplete unless we reached the start of the file
+            complete = lines if pos == 0 else lines[1:]
+            for line in reversed(complete):
+                line = line.decode('utf-8', errors='replace').strip()
+                if line == '':
+                    continue
+                if last is None:
+                    last = line
+                if predicate is None or predicate(line):
+                    return last, line
+            buf = b'' if pos == 0 else lines[0]
+            block_size *= 2
+    return last, None
+
+
+def read_file_head(path, filename, max_bytes):
+    """ Reads at most `max_bytes` from the start of a file. Returns the text read and the number of bytes left. """
+    try:
+        with open(os.path.join(path, filename), 'rb') as f:
+            data = f.read(max_bytes)
+            remaining = max(0, os.fstat(f.fileno()).st_size - f.tell())
+        return data.decode('utf-8', errors='replace'), remaining
+    except FileNotFoundError:
+        return 'File not found! Evaluation is still running or has failed...', 0
+
+
+def tail_file(fpath, offset, inode, window):
+    """ Returns the bytes appended to a file since `offset` as text, together with the new offset, the file inode and
+    a flag indicating if the reader has to start over. The reader starts over, keeping only the last `window` bytes,
+    if the file was replaced or truncated or more than `window` bytes were appended. Returns None if the file does not
+    exist. """
+    try:
+        f = open(fpath, 'rb')
+    except FileNotFoundError:
+        return None
+    with f:
+        st = os.fstat(f.fileno())
+        reset = offset is None or inode != st.st_ino or st.st_size < offset or st.st_size - offset > window
+        if reset:
+            offset = max(0, st.st_size - window)
+        # Also read the byte before the offset, to know if it is at the start of a line
+        start = max(0, offset - 1)
+        f.seek(start)
+        data = f.read(st.st_size - start)
+        if offset > 0:
+            # Skip the partial line the offset falls in after a reset, across reads until its end is written
+            end = data.find(b'\n')
+            if end < 0:
+                return '', st.st_size, st.st_ino, reset
+            offset = start + end + 1
+            data = data[end + 1:]
+        # Only consume complete lines, the rest will be read next time
+        data = data[:data.rfind(b'\n') + 1]
+        return data.decode('utf-8', errors='replace'), offset + len(data), st.st_ino, reset
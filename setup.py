@@ -25,7 +25,7 @@ setup(
     long_description=open("./README.md").read(),
     long_description_content_type="text/markdown",
     keywords='dashboard visualization evaluation monitoring evalne',
-    packages=find_packages(),
+    packages=find_packages(exclude=['tests']),
     python_requires='>3.6',
     zip_safe=False,
     tests_require=["pytest", "pytest-cov"],
@@ -35,10 +35,14 @@ setup(
         'plotly',
         'dash-daq',
         'dash_bootstrap_components',
-        'dash',
+        'dash>=2.17',
         'fa2',
         'psutil'
     ],
+    extras_require={
+        # Production servers for `evalne_gui --serve`
+        'serve': ['gunicorn; platform_system != "Windows"', 'waitress']
+    },
     classifiers=[
         "Intended Audience :: Science/Research",
         "Intended Audience :: Developers",
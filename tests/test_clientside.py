@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import json
+import shutil
+import subprocess
+import pytest
+
+
+CLIENTSIDE_JS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'evalne_gui', 'assets',
+                             'clientside.js')
+
+# Runs the clientside callbacks on the calls given as json in stdin and prints their results
+NODE_RUNNER = """
+var fs = require('fs');
+var PreventUpdate = {};
+var window = {dash_clientside: {PreventUpdate: PreventUpdate, no_update: {}}};
+eval(fs.readFileSync(process.argv[1], 'utf8'));
+var calls = JSON.parse(fs.readFileSync(0, 'utf8'));
+var res = calls.map(function(call) {
+    try {
+        return window.dash_clientside.dashboard[call[0]].apply(null, call[1]);
+    } catch (e) {
+        if (e === PreventUpdate) {
+            return 'PreventUpdate';
+        }
+        throw e;
+    }
+});
+process.stdout.write(JSON.stringify(res));
+"""
+
+PREVENT_UPDATE = 'PreventUpdate'
+
+MAXIMIZE_OPTS = [{'label': 'AUROC', 'value': 'auroc'},
+                 {'label': 'F-score', 'value': 'f_score'},
+                 {'label': 'Precision', 'value': 'precision'},
+                 {'label': 'Recall', 'value': 'recall'},
+                 {'label': 'Accuracy', 'value': 'accuracy'},
+                 {'label': 'Fallout', 'value': 'fallout'},
+                 {'label': 'Miss', 'value': 'miss'}]
+
+
+# --------------------------
+#   Former server callbacks
+# --------------------------
+
+def render_global_section(task):
+    if task == 'nc' or task == 'nr':
+        return {'display': 'none'}
+    else:
+        return {'display': 'flex'}
+
+
+def toggle_neigh_visibility(val):
+    if val == 'dir':
+        return {'width': '30%'}
+    else:
+        return {'display': 'none'}
+
+
+def toggle_heuristics_visibility(task):
+    if task == 'nc':
+        return {'display': 'none'}
+    else:
+        return {'display': 'flex', 'margin-bottom': '20px'}
+
+
+def render_train_perc(frac):
+    val = int(float(frac) * 100)
+    return 'Train-test fraction ({}%):'.format(val)
+
+
+def render_valid_perc(frac):
+    val = int(float(frac) * 100)
+    return 'Train-valid. fraction ({}%):'.format(val)
+
+
+def render_nodepairs_perc(frac):
+    val = float(frac) * 100
+    return 'Node pairs to evaluate ({:4.1f}%):'.format(val)
+
+
+def render_content(task):
+    if task == 'lp' or task == 'sp':
+        return [{'width': '30%', 'padding-right': '5%'},
+                {'width': '30%', 'padding-right': '5%'},
+                {'display': 'none'},
+                {'display': 'none'},
+                {'display': 'none'},
+                {'width': '30%'},
+                'Binary classifier:',
+                {'display': 'none'},
+                MAXIMIZE_OPTS,
+                MAXIMIZE_OPTS + [{'label': 'All', 'value': 'all'}]]
+    elif task == 'nr':
+        return [{'width': '30%', 'padding-right': '5%'},
+                {'display': 'none'},
+                {'width': '30%', 'padding-right': '5%'},
+                {'display': 'none'},
+                {'display': 'none'},
+                {'width': '30%'},
+                'Binary classifier:',
+                {'display': 'none'},
+                MAXIMIZE_OPTS,
+                MAXIMIZE_OPTS + [{'label': 'All', 'value': 'all'}]]
+    elif task == 'nc':
+        return [{'width': '30%', 'padding-right': '5%'},
+                {'display': 'none'},
+                {'display': 'none'},
+                {'width': '30%', 'padding-right': '5%'},
+                {'width': '30%'},
+                {'display': 'none'},
+                'Multi-label classifier:',
+                {'display': 'block'},
+                [{'label': 'F1-micro', 'value': 'f1_micro'},
+                 {'label': 'F1-macro', 'value': 'f1_macro'},
+                 {'label': 'F1-weighted', 'value': 'f1_weighted'}],
+                [{'label': 'All', 'value': 'all'},
+                 {'label': 'F1-micro', 'value': 'f1_micro'},
+                 {'label': 'F1-macro', 'value': 'f1_macro'},
+                 {'label': 'F1-weighted', 'value': 'f1_weighted'}]]
+
+
+def render_metrics_section(task):
+    if task == 'nc':
+        return [{'width': '48%', 'padding-right': '4%'},
+                {'width': '48%'},
+                {'display': 'none'},
+                {'display': 'none'}]
+    else:
+        return [{'width': '22%', 'padding-right': '4%'},
+                {'width': '22%', 'padding-right': '4%'},
+                {'width': '22%', 'padding-right': '4%'},
+                {'width': '22%'}]
+
+
+def toggle_method_style(m_type):
+    if m_type:
+        if m_type == 'opne':
+            return [{'display': 'none'},
+                    {'display': 'none'},
+                    {'width': '100%'},
+                    {'display': 'none'},
+                    {'display': 'none'}]
+        else:
+            return [{'width': '22%', 'padding-right': '4%'},
+                    {'width': '22%'},
+                    {'width': '48%', 'padding-right': '4%'},
+                    {'width': '22%', 'padding-right': '4%'},
+                    {'width': '22%'}]
+    else:
+        return PREVENT_UPDATE
+
+
+# --------------------------
+#         Tests
+# --------------------------
+
+TASKS = ['lp', 'nc', 'nr', 'sp']
+INVALID_FRACS = ['', ' ', 'abc', None]
+# Values of the sliders, also as the strings of the range inputs
+FRACS = [i / 20 for i in range(21)] + [i / 1000 for i in range(501)] + ['0.45', '0.001', '1', ' 0.3 ']
+
+CALLBACKS = [(render_global_section, TASKS + [None]),
+             (toggle_neigh_visibility, ['dir', 'undir', None]),
+             (toggle_heuristics_visibility, TASKS + [None]),
+             (render_train_perc, FRACS + INVALID_FRACS),
+             (render_valid_perc, FRACS + INVALID_FRACS),
+             (render_nodepairs_perc, FRACS + INVALID_FRACS),
+             (render_content, TASKS),
+             (render_metrics_section, TASKS + [None]),
+             (toggle_method_style, ['opne', 'gem', 'kk', 'other', '', None])]
+
+
+def run_clientside(calls):
+    """ Returns the results of a list of (callback name, args) calls of the clientside callbacks run with node. """
+    res = subprocess.run(['node', '-e', NODE_RUNNER, CLIENTSIDE_JS], input=json.dumps(calls), capture_output=True,
+                         text=True, check=True)
+    return json.loads(res.stdout)
+
+
+def run_server(func, arg):
+    """ Returns the result of a former server callback, invalid inputs stop the update in the browser. """
+    try:
+        return func(arg)
+    except (ValueError, TypeError):
+        return PREVENT_UPDATE
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+@pytest.mark.parametrize('func, args', CALLBACKS, ids=[func.__name__ for func, _ in CALLBACKS])
+def test_clientside_parity(func, args):
+    expected = [run_server(func, arg) for arg in args]
+    assert run_clientside([(func.__name__, [arg]) for arg in args]) == expected
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_unknown_task():
+    # The server callback returned None, which Dash reported as an error
+    assert render_content('xx') is None
+    assert run_clientside([('render_content', ['xx']), ('render_content', [None])]) == [PREVENT_UPDATE] * 2
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import copy
+import pytest
+from evalne_gui.config import EvalConfig
+from evalne_gui.init_values import init_vals, method_init_vals
+
+
+# Config files written by the exporter of the dashboard values that `EvalConfig` replaced
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+METHODS = {'m-lib-dropdown': ['other', 'other', 'opne'],
+           'm-name': ['node2vec', 'cne', 'line'],
+           'm-type-dropdown': ['ne', 'e2e', 'ne'],
+           'm-opts': [['dir'], ['weights', 'dir'], []],
+           'm-cmd': ['python main.py --input {} --output {} --dimensions {}',
+                     'python cne.py --inputgraph {} --tr_e {} --tr_pred {}',
+                     '--method line --epochs 10'],
+           'm-tune': ['--p 0.5 1 --q 0.5 1', '', '--order 1 2'],
+           'm-input-delim': [',', '\\s', ''],
+           'm-output-delim': ['\\s', ',', '']}
+
+CONFIGS = {
+    'lp': dict(init_vals, **{'task-dropdown': 'lp',
+                             'ee-dropdown': ['average', 'hadamard'],
+                             'ib-exprep': 3,
+                             'ib-timeout': 1800,
+                             'ib-nwnames': 'Facebook PPI',
+                             'network-paths': '../data/facebook.txt\n../data/ppi.csv',
+                             'ib-separator': '\\s ,',
+                             'ib-comment': '# #',
+                             'nw-prep-checklist2': ['stats'],
+                             'input-prep-delim': ',',
+                             'baselines-checklist': ['common_neighbours', 'jaccard_coefficient'],
+                             'baselines-checklist2': ['random_prediction'],
+                             'negsamp-dropdown': 'cw',
+                             'ib-negratio': '2:1',
+                             'curves-dropdown': 'all',
+                             'ib-precatk': '1 10 100'}),
+    'nc': dict(init_vals, **{'task-dropdown': 'nc',
+                             'ib-rpnf': 3,
+                             'ib-fracn': '10 50 90',
+                             'ib-nwnames': 'BlogCatalog',
+                             'network-paths': '../data/blog.edgelist',
+                             'network-nodelabels': '../data/blog.labels',
+                             'ib-separator': ',',
+                             'ib-comment': '#',
+                             'maximize-dropdown': 'f1_micro',
+                             'scores-dropdown': 'f1_macro',
+                             'curves-dropdown': 'none'}),
+    'nr': dict(init_vals, **{'task-dropdown': 'nr',
+                             'ib-frace': 0.05,
+                             'ib-nwnames': 'Wiki',
+                             'network-paths': '/data/wiki.txt',
+                             'network-types': 'dir',
+                             'ib-separator': '\\t',
+                             'ib-comment': '#',
+                             'nw-prep-checklist': ['rel'],
+                             'baselines-checklist': ['adamic_adar_index'],
+                             'neighbourhood-dropdown': 'in',
+                             'ib-precatk': '10 100'}),
+    'sp': dict(init_vals, **{'task-dropdown': 'sp',
+                             'ee-dropdown': ['weighted_l1'],
+                             'ib-seed': 7,
+                             'ib-trainfrac': 0.5,
+                             'ib-validfrac': 0.75,
+                             'splitalg-dropdown': 'random',
+                             'ib-nwnames': 'GRQC',
+                             'network-paths': 'grqc.txt',
+                             'ib-separator': '\\s',
+                             'ib-comment': '#',
+                             'nw-prep-checklist2': ['save', 'stats'],
+                             'scores-dropdown': 'auroc',
+                             'curves-dropdown': 'pr'}),
+}
+
+
+def read_expected(task):
+    with open(os.path.join(DATA_DIR, 'conf_{}.ini'.format(task))) as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('task', sorted(CONFIGS))
+def test_export_matches_previous_exporter(task):
+    assert EvalConfig.from_values(CONFIGS[task], METHODS).to_ini() == read_expected(task)
+
+
+@pytest.mark.parametrize('task', sorted(CONFIGS))
+def test_ini_round_trip(task):
+    text = read_expected(task)
+    config = EvalConfig.from_ini(text)
+    assert config == EvalConfig.from_values(CONFIGS[task], METHODS)
+    assert config.to_ini() == text
+    assert EvalConfig.from_ini(config.to_ini()) == config
+
+
+@pytest.mark.parametrize('task', sorted(CONFIGS))
+def test_values_round_trip(task):
+    conf_dict, methods_dict = EvalConfig.from_ini(read_expected(task)).to_values()
+    assert list(conf_dict.keys()) == list(init_vals.keys())
+    assert list(methods_dict.keys()) == list(method_init_vals.keys())
+    assert dict(conf_dict) == CONFIGS[task]
+    assert dict(methods_dict) == METHODS
+
+
+def test_write(tmp_path):
+    path = str(tmp_path / 'conf.ini')
+    EvalConfig.from_values(CONFIGS['lp'], METHODS).write(path)
+    with open(path) as f:
+        assert f.read() == read_expected('lp')
+
+
+def test_invalid_configs():
+    with pytest.raises(ValueError):
+        EvalConfig.from_ini('not a config file')
+    text = read_expected('lp').replace('TASK = lp', 'TASK = xx')
+    with pytest.raises(ValueError):
+        EvalConfig.from_ini(text)
+    methods = copy.deepcopy(METHODS)
+    methods['m-name'].pop()
+    with pytest.raises(ValueError):
+        EvalConfig.from_values(CONFIGS['lp'], methods)
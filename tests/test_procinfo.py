@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import sys
+import psutil
+from evalne_gui.procinfo import ProcRegistry, EvalneProc, sample_tree
+
+
+def test_exited_processes_are_forgotten(tmp_path):
+    registry = ProcRegistry()
+    pidfile = str(tmp_path / 'job.pid')
+    proc = psutil.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    try:
+        registry.register(pidfile, proc)
+        assert registry.latest() is proc
+        assert registry.latest(str(tmp_path)) is proc
+        assert registry.latest(str(tmp_path / 'other')) is None
+    finally:
+        proc.kill()
+        proc.wait()
+    assert registry.latest() is None
+    assert not os.path.exists(pidfile)
+    # Neither exited processes nor missing pidfiles stay tracked, so they are not read again on every call
+    assert registry.get(str(tmp_path / 'missing.pid')) is None
+    assert registry._procs == {}
+
+
+def test_get_recovers_registered_process(tmp_path):
+    pidfile = str(tmp_path / 'job.pid')
+    proc = psutil.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    try:
+        ProcRegistry().register(pidfile, proc)
+        # A new registry, e.g. after a GUI restart, reads the pidfile
+        recovered = ProcRegistry().get(pidfile)
+        assert recovered is not None and recovered.pid == proc.pid
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_tree_rss():
+    proc = psutil.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    try:
+        eproc = EvalneProc(proc)
+        assert eproc.tree_rss() > 0
+        assert len(sample_tree(proc)) == 1
+    finally:
+        proc.kill()
+        proc.wait()
+    assert EvalneProc().tree_rss() == 0
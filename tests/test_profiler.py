@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+from evalne_gui.profiler import ProfileRecorder
+
+
+def test_recording_survives_errors(monkeypatch):
+    recorder = ProfileRecorder(interval=0.01)
+    errors = [ValueError('corrupted profile'), KeyError('pid'), OSError('disk full')]
+    calls = []
+
+    def step():
+        calls.append(1)
+        if len(errors):
+            raise errors.pop(0)
+        recorder.stop()
+
+    monkeypatch.setattr(recorder, '_step', step)
+    recorder.start()
+    recorder._thread.join(5)
+    assert not recorder._thread.is_alive()
+    assert len(calls) == 4
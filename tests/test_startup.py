@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+import sys
+import ast
+import glob
+import subprocess
+import pytest
+from evalne_gui.startup import get_import_times
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages that are slow to import and must only be imported inside the functions that use them
+LAZY_IMPORTS = ('numpy', 'plotly')
+
+# Packages that must not be loaded at all when the GUI starts. Dash imports plotly itself.
+DEFERRED = ('numpy',)
+
+# Maximum time in seconds spent in the GUI modules themselves when the GUI starts, excluding the packages they import
+OWN_IMPORT_BUDGET = 1.0
+
+
+def get_module_imports(path):
+    """ Returns the top-level package of each import executed when the module at `path` is imported, i.e. the ones
+    that are not inside a function. """
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    res = []
+    nodes = list(tree.body)
+    while len(nodes):
+        node = nodes.pop()
+        if isinstance(node, ast.Import):
+            res += [(node.lineno, alias.name.split('.')[0]) for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module is not None and node.level == 0:
+            res.append((node.lineno, node.module.split('.')[0]))
+        elif not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            # Class bodies, conditionals and try blocks run at import time
+            nodes += list(ast.iter_child_nodes(node))
+    return res
+
+
+@pytest.mark.parametrize('path', sorted(glob.glob(os.path.join(ROOT, 'evalne_gui', '*.py'))),
+                         ids=os.path.basename)
+def test_no_module_level_lazy_imports(path):
+    found = ['line {}: {}'.format(lineno, pkg) for lineno, pkg in get_module_imports(path) if pkg in LAZY_IMPORTS]
+    assert found == []
+
+
+@pytest.mark.parametrize('module', ['evalne_gui.index', 'evalne_gui.__main__'])
+def test_deferred_imports(module):
+    code = 'import sys, {}; print(sorted(set(sys.modules) & {}))'.format(module, set(DEFERRED))
+    res = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert res.stdout.strip() == '[]'
+
+
+def test_import_times(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    total, imports = get_import_times('evalne_gui.index')
+    names = [name for name, _, _ in imports]
+    assert total > 0
+    assert 'evalne_gui.index' in names
+    assert not any(name.split('.')[0] in DEFERRED for name in names)
+    own = sum(self_time for name, self_time, _ in imports if name.split('.')[0] == 'evalne_gui')
+    assert own < OWN_IMPORT_BUDGET
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+import os
+from evalne_gui.catalog import RunCatalog
+from evalne_gui.timeline import TimelineIndex, get_timeline
+import evalne_gui.timeline as timeline
+
+
+LOG1 = ('01-01-26 12:00:00 - INFO: Evaluation start\n'
+        '01-01-26 12:00:05 - INFO: ====== Evaluating A network ======\n'
+        '01-01-26 12:00:15 - INFO: Validation score for method `deepwalk_hadamard` is 0.9\n'
+        '01-01-26 12:00:20 - INFO: Evaluation end\n')
+LOG2 = ('01-01-26 12:00:01 - INFO: Evaluation start\n'
+        '01-01-26 12:00:06 - INFO: ====== Evaluating B network ======\n'
+        '01-01-26 12:00:30 - INFO: Validation score for method `line_average` is 0.8\n'
+        '01-01-26 12:00:40 - INFO: Evaluation end\n')
+WAITING = '01-01-26 12:00:20 - INFO: Waiting for sub-runs: lp_eval_0101_120000/B\n'
+
+
+def write_log(path, text, mtime):
+    with open(path, 'w') as f:
+        f.write(text)
+    os.utime(path, (mtime, mtime))
+
+
+def test_appended_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(timeline, 'catalog', RunCatalog())
+    os.mkdir(str(tmp_path / 'lp_eval_0101_1200'))
+    path = str(tmp_path / 'lp_eval_0101_1200' / 'eval.log')
+    index = TimelineIndex()
+    write_log(path, LOG1[:60], 1000)
+    events, _ = index.update(str(tmp_path))['lp_eval_0101_1200']
+    assert [event[1] for event in events] == ['start']
+    write_log(path, LOG1, 2000)
+    events, mtime = index.update(str(tmp_path))['lp_eval_0101_1200']
+    assert [event[1] for event in events] == ['start', 'network', 'tuned', 'end']
+    assert mtime == 2000
+    # The index is persisted and reloaded
+    assert TimelineIndex().update(str(tmp_path))['lp_eval_0101_1200'][0] == [list(event) for event in events]
+
+
+def test_rewritten_split_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(timeline, 'catalog', RunCatalog())
+    os.mkdir(str(tmp_path / 'lp_eval_0101_120000'))
+    path = str(tmp_path / 'lp_eval_0101_120000' / 'eval.log')
+    index = TimelineIndex()
+    # The job queue rewrites the log of a split evaluation with more content when each sub-run finishes
+    write_log(path, LOG1 + WAITING, 1000)
+    events, _ = index.update(str(tmp_path))['lp_eval_0101_120000']
+    assert [event[1] for event in events] == ['start', 'network', 'tuned', 'end']
+    write_log(path, LOG1 + LOG2, 2000)
+    events, _ = index.update(str(tmp_path))['lp_eval_0101_120000']
+    assert [event[1] for event in events] == ['start', 'network', 'tuned', 'end'] * 2
+    lanes = set(phase['lane'] for phase in get_timeline(events))
+    assert lanes == {'1: A', '2: B', '1: Setup', '2: Setup'}
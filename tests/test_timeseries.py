@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+from evalne_gui.timeseries import TimeSeriesStore
+
+
+def fill(ts, num_samples):
+    for t in range(num_samples):
+        ts.add(t, {'cpu': t % 100})
+    return num_samples - 1
+
+
+def test_window_not_full():
+    ts = TimeSeriesStore(['cpu'])
+    now = fill(ts, 100)
+    resolution, times, values = ts.window(now - 3600)
+    assert resolution == 1
+    assert times == list(range(100))
+    assert values['cpu'] == list(range(100))
+
+
+def test_window_full_tier():
+    ts = TimeSeriesStore(['cpu'])
+    now = fill(ts, 10000)
+    # The full 1 sec. tier holds the last hour, its oldest sample is one second newer than `now - 3600`
+    assert ts.resolution(now - 3600) == 1
+    resolution, times, _ = ts.window(now - 3600)
+    assert resolution == 1
+    assert len(times) == 3600
+    assert times[-1] == now
+
+
+def test_window_beyond_finest_tier():
+    ts = TimeSeriesStore(['cpu'])
+    now = fill(ts, 10000)
+    resolution, times, values = ts.window(now - 2 * 3600)
+    assert resolution == 60
+    # Only complete minutes are stored
+    assert times == list(range(2820, 9960, 60))
+    assert values['cpu'] == [sum(t % 100 for t in range(bucket, bucket + 60)) / 60 for bucket in times]
+
+
+def test_since():
+    ts = TimeSeriesStore(['cpu'])
+    fill(ts, 200)
+    times, values = ts.since(1, 190)
+    assert times == list(range(191, 200))
+    times, _ = ts.since(60, 0)
+    assert times == [60, 120]
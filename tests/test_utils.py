@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Author: Mara Alexandru Cristian
+# Contact: alexandru.mara@ugent.be
+# Date: 18/10/2026
+
+from evalne_gui.utils import tail_file
+
+
+def append(path, text):
+    with open(path, 'a') as f:
+        f.write(text)
+
+
+def test_tail_file(tmp_path):
+    path = str(tmp_path / 'console.out')
+    assert tail_file(path, None, None, 10) is None
+    append(path, 'one\ntw')
+    text, offset, inode, reset = tail_file(path, None, None, 10)
+    assert (text, offset, reset) == ('one\n', 4, True)
+    # Partial lines are only read once complete
+    append(path, 'o\nthr')
+    text, offset, inode, reset = tail_file(path, offset, inode, 10)
+    assert (text, offset, reset) == ('two\n', 8, False)
+    # The reader starts over on truncation
+    with open(path, 'w') as f:
+        f.write('four\n')
+    assert tail_file(path, offset, inode, 10)[0::3] == ('four\n', True)
+
+
+def test_tail_file_partial_line_after_reset(tmp_path):
+    path = str(tmp_path / 'console.out')
+    append(path, 'first\n' + 'x' * 20)
+    # The window only holds part of the last line, which is not complete yet
+    text, offset, inode, reset = tail_file(path, None, None, 10)
+    assert (text, reset) == ('', True)
+    append(path, 'x' * 3)
+    text, offset, inode, reset = tail_file(path, offset, inode, 10)
+    assert (text, reset) == ('', False)
+    # Its continuation is not returned as a line, only the complete lines after it
+    append(path, 'yyy\nlast\n')
+    text, offset, inode, reset = tail_file(path, offset, inode, 10)
+    assert (text, reset) == ('last\n', False)
+    append(path, 'more\n')
+    assert tail_file(path, offset, inode, 10)[0::3] == ('more\n', False)